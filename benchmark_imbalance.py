@@ -0,0 +1,112 @@
+# Imbalance strategy benchmark
+# Trains the fraud and loan-status models with every imbalance strategy on the same processed
+# matrix and shared train/test split, each strategy in its own process so peak RSS is comparable, and
+# reports wall time, peak RSS and test AUC.
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import scipy.sparse as sp
+
+def _peak_rss_mb():
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def prepare_splits(data_dir):
+    """Build the processed training matrix once and store it with both models' splits"""
+    import model_training as training
+
+    X_processed, y_fraud, y_loan_status = training.prepare_training_data()
+    X_processed = sp.csr_matrix(X_processed)
+    sp.save_npz(os.path.join(data_dir, 'X.npz'), X_processed)
+    train_idx, test_idx = training.shared_train_test_indices(y_fraud, y_loan_status)
+    np.savez(
+        os.path.join(data_dir, 'splits.npz'),
+        y_fraud=y_fraud.to_numpy(), y_loan_status=y_loan_status.astype(str).to_numpy(),
+        train=train_idx, test=test_idx
+    )
+    return X_processed.shape
+
+def run_strategy(strategy, data_dir):
+    """Resample and fit both models with one strategy; returns timings, peak RSS and AUCs"""
+    from lightgbm import LGBMClassifier
+    from sklearn.metrics import roc_auc_score
+    import model_training as training
+
+    X_processed = sp.load_npz(os.path.join(data_dir, 'X.npz'))
+    splits = np.load(os.path.join(data_dir, 'splits.npz'), allow_pickle=True)
+    baseline_rss = _peak_rss_mb()
+
+    result = {'strategy': strategy}
+    start = time.perf_counter()
+    train, test = splits['train'], splits['test']
+    for name, target, params in [
+        ('fraud', 'y_fraud', {}),
+        ('loan_status', 'y_loan_status', {'objective': 'multiclass'}),
+    ]:
+        y = splits[target]
+
+        stage_start = time.perf_counter()
+        X_train, y_train, model_params = training.rebalance_training_data(X_processed[train], y[train], strategy)
+        result[f'{name}_resample_s'] = time.perf_counter() - stage_start
+        result[f'{name}_train_rows'] = X_train.shape[0]
+
+        stage_start = time.perf_counter()
+        classifier = LGBMClassifier(random_state=42, verbose=-1, **params, **model_params)
+        classifier.fit(X_train, y_train)
+        result[f'{name}_fit_s'] = time.perf_counter() - stage_start
+
+        proba = classifier.predict_proba(X_processed[test])
+        if len(classifier.classes_) == 2:
+            result[f'{name}_auc'] = roc_auc_score(y[test], proba[:, 1])
+        else:
+            result[f'{name}_auc'] = roc_auc_score(y[test], proba, multi_class='ovr', labels=classifier.classes_)
+
+    result['total_s'] = time.perf_counter() - start
+    result['peak_rss_mb'] = _peak_rss_mb()
+    result['peak_rss_over_data_mb'] = result['peak_rss_mb'] - baseline_rss
+    return result
+
+def _print_results(results):
+    header = f"{'strategy':<14}{'total s':>9}{'resample s':>12}{'fit s':>8}{'peak RSS MB':>13}{'+RSS MB':>9}{'fraud AUC':>11}{'status AUC':>12}"
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        resample_s = r['fraud_resample_s'] + r['loan_status_resample_s']
+        fit_s = r['fraud_fit_s'] + r['loan_status_fit_s']
+        print(f"{r['strategy']:<14}{r['total_s']:>9.2f}{resample_s:>12.2f}{fit_s:>8.2f}"
+              f"{r['peak_rss_mb']:>13.0f}{r['peak_rss_over_data_mb']:>9.0f}{r['fraud_auc']:>11.4f}{r['loan_status_auc']:>12.4f}")
+
+if __name__ == "__main__":
+    import model_training as training
+
+    parser = argparse.ArgumentParser(description="Compare imbalance strategies on the same training splits")
+    parser.add_argument('--strategies', nargs='+', default=list(training.IMBALANCE_STRATEGIES),
+                        choices=training.IMBALANCE_STRATEGIES)
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    parser.add_argument('--data-dir', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_strategy(args.worker, args.data_dir)))
+        sys.exit(0)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        shape = prepare_splits(data_dir)
+        print(f"Processed matrix: {shape[0]:,} rows x {shape[1]:,} features\n")
+        results = []
+        for strategy in args.strategies:
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--worker', strategy, '--data-dir', data_dir],
+                check=True, capture_output=True, text=True
+            ).stdout
+            results.append(json.loads(output.strip().splitlines()[-1]))
+        _print_results(results)
@@ -0,0 +1,87 @@
+# Import time benchmark
+# Cold-imports each module in a fresh interpreter under `python -X importtime`, several times, and
+# reports the median cumulative import time plus the heaviest direct imports, so the cost of the
+# scoring import path (loan_python_file) can be compared with the training path (model_training)
+# and, with --baseline, with the same modules at an earlier git revision.
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+def import_times(module, source_dir=REPO_DIR):
+    """Cumulative import time (µs) of `module` and of each module it imports directly, for one cold import"""
+    code = f"import sys; sys.path.insert(0, {source_dir!r}); import {module}"
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code], check=True, capture_output=True, text=True
+    ).stderr
+    entries = []  # (name, cumulative µs, nesting depth) in report order: children before their parent
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            entries.append((match.group(4), int(match.group(2)), (len(match.group(3)) - 1) // 2))
+
+    position = max(i for i, entry in enumerate(entries) if entry[0] == module)
+    _, total_us, depth = entries[position]
+    times = {module: total_us}
+    for name, cumulative_us, child_depth in reversed(entries[:position]):
+        if child_depth <= depth:
+            break
+        if child_depth == depth + 1:
+            times[name] = cumulative_us
+    return times
+
+def benchmark_module(module, runs, top, source_dir=REPO_DIR):
+    """Median cumulative import time of `module` and of its heaviest direct imports, in ms"""
+    samples = defaultdict(list)
+    for _ in range(runs):
+        for name, cumulative_us in import_times(module, source_dir).items():
+            samples[name].append(cumulative_us / 1000)
+
+    median = {name: sorted(values)[len(values) // 2] for name, values in samples.items()}
+    total_ms = median.pop(module)
+    heaviest = sorted(median.items(), key=lambda item: item[1], reverse=True)[:top]
+    return total_ms, heaviest
+
+def checkout_revision(revision, directory):
+    """Write the repository's Python modules as of `revision` into `directory`"""
+    names = subprocess.run(['git', 'ls-tree', '--name-only', revision], cwd=REPO_DIR, check=True,
+                           capture_output=True, text=True).stdout.split()
+    for name in names:
+        if name.endswith('.py'):
+            source = subprocess.run(['git', 'show', f'{revision}:{name}'], cwd=REPO_DIR, check=True,
+                                    capture_output=True).stdout
+            with open(os.path.join(directory, name), 'wb') as f:
+                f.write(source)
+
+def _print_result(label, total_ms, heaviest, runs):
+    print(f"=== {label}: {total_ms:,.0f} ms (median of {runs}) ===")
+    for name, ms in heaviest:
+        print(f"  {name:<32} {ms:8,.0f} ms")
+    print()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure cold import time of the scoring and training modules")
+    parser.add_argument('--modules', nargs='+', default=['loan_python_file', 'portable_model', 'model_training'])
+    parser.add_argument('--runs', type=int, default=5, help="fresh interpreters per module (median reported)")
+    parser.add_argument('--top', type=int, default=8, help="heaviest direct imports to list")
+    parser.add_argument('--baseline', metavar='REV', help="also time the modules as of this git revision")
+    args = parser.parse_args()
+
+    for module in args.modules:
+        _print_result(module, *benchmark_module(module, args.runs, args.top), args.runs)
+
+    if args.baseline:
+        with tempfile.TemporaryDirectory() as baseline_dir:
+            checkout_revision(args.baseline, baseline_dir)
+            for module in args.modules:
+                if os.path.exists(os.path.join(baseline_dir, f'{module}.py')):
+                    total_ms, heaviest = benchmark_module(module, args.runs, args.top, baseline_dir)
+                    _print_result(f'{module} @ {args.baseline}', total_ms, heaviest, args.runs)
@@ -0,0 +1,95 @@
+# Inference latency benchmark
+# Compares the old two-call inference (predict + predict_proba per model) against the
+# single probability pass used by predict_batch, and the DataFrame scoring path against the
+# compiled single-application scorer used by predict_loan_risk_and_fraud.
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+import loan_python_file as model
+
+def _legacy_predict(model_input):
+    """Old inference path: separate predict and predict_proba calls for each model"""
+    fraud_prediction = model.lgbm_model.predict(model_input)
+    fraud_proba = model.lgbm_model.predict_proba(model_input)[:, 1]
+    loan_status_prediction = model.lgbm_loan_status_model.predict(model_input)
+    loan_status_proba = model.lgbm_loan_status_model.predict_proba(model_input)
+    return fraud_prediction, fraud_proba, loan_status_prediction, loan_status_proba
+
+def _single_pass_predict(model_input):
+    """Current inference path: one predict_proba call per model, labels derived from it"""
+    fraud_proba = model.lgbm_model.predict_proba(model_input)
+    loan_status_proba = model.lgbm_loan_status_model.predict_proba(model_input)
+    fraud_prediction = model._labels_from_proba(model.lgbm_model.classes_, fraud_proba)
+    loan_status_prediction = model._labels_from_proba(model.lgbm_loan_status_model.classes_, loan_status_proba)
+    return fraud_prediction, fraud_proba[:, 1], loan_status_prediction, loan_status_proba
+
+def _prepare(applications_df):
+    features_df = model._prepare_scoring_frame(applications_df.copy())
+    return model._transform_model_input(features_df)
+
+def _latency_summary(timings):
+    timings_ms = np.asarray(timings) * 1000
+    return f"mean {timings_ms.mean():.3f} ms | p50 {np.percentile(timings_ms, 50):.3f} ms | p99 {np.percentile(timings_ms, 99):.3f} ms"
+
+def benchmark_single(applications_df, repeats):
+    """Per-request latency of the model calls on one-row inputs"""
+    rows = [_prepare(applications_df.iloc[[i % len(applications_df)]]) for i in range(repeats)]
+    for name, predict in [('predict + predict_proba', _legacy_predict), ('single pass', _single_pass_predict)]:
+        predict(rows[0])  # warm-up
+        timings = []
+        for model_input in rows:
+            start = time.perf_counter()
+            predict(model_input)
+            timings.append(time.perf_counter() - start)
+        print(f"  {name:<28} {_latency_summary(timings)}")
+
+    # End-to-end single-application API: DataFrame path vs compiled scorer
+    records = applications_df.head(repeats).to_dict('records')
+    compilable = model.get_compiled_scorer() is not None
+    for name, compiled in [('DataFrame path', False), ('compiled scorer', True)]:
+        if compiled and not compilable:
+            continue
+        model.USE_COMPILED_SCORER = compiled
+        model.predict_loan_risk_and_fraud(records[0])  # warm-up
+        timings = []
+        for record in records:
+            start = time.perf_counter()
+            model.predict_loan_risk_and_fraud(record)
+            timings.append(time.perf_counter() - start)
+        print(f"  {'predict_loan_risk_and_fraud':<28} {_latency_summary(timings)} ({name})")
+    model.USE_COMPILED_SCORER = True
+
+def benchmark_batch(applications_df, rows):
+    """Throughput of the model calls on one large batch"""
+    batch_df = applications_df.sample(rows, replace=True, random_state=42).reset_index(drop=True)
+    model_input = _prepare(batch_df)
+    for name, predict in [('predict + predict_proba', _legacy_predict), ('single pass', _single_pass_predict)]:
+        start = time.perf_counter()
+        predict(model_input)
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<28} {elapsed:.3f} s | {rows / elapsed:,.0f} rows/s")
+
+    start = time.perf_counter()
+    model.predict_batch(batch_df)
+    elapsed = time.perf_counter() - start
+    print(f"  {'predict_batch':<28} {elapsed:.3f} s | {rows / elapsed:,.0f} rows/s")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark single-pass inference against predict + predict_proba")
+    parser.add_argument('--repeats', type=int, default=500, help="single-application requests to time")
+    parser.add_argument('--rows', type=int, default=100_000, help="rows in the batch benchmark")
+    args = parser.parse_args()
+
+    model.ensure_models_loaded()
+    applications_df = pd.read_csv('loan_applications.csv').drop(
+        columns=['fraud_flag', 'loan_status', 'fraud_type']
+    )
+
+    print(f"=== Single application ({args.repeats} requests) ===")
+    benchmark_single(applications_df, args.repeats)
+    print(f"\n=== Batch scoring ({args.rows:,} rows) ===")
+    benchmark_batch(applications_df, args.rows)
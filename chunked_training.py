@@ -0,0 +1,272 @@
+# Out-of-core model training
+# train_models holds the whole applications table, its transaction window features and the
+# preprocessed matrix in memory, and SMOTE copies the training rows again. train_models_out_of_core
+# trains the same kind of bundle from data streamed in chunks, so peak memory is set by the
+# partition size and by LightGBM's binned dataset (about one byte per row per dense feature)
+# rather than by the size of the CSVs:
+#   1. stream both CSVs once, hash-partitioning applications and transactions by customer_id into
+#      temporary files (a customer's transactions land with their applications, so the
+#      point-in-time window features stay exact), while fitting the outlier clipper on a sample
+#      and counting the one-hot vocabularies and the labels;
+#   2. per partition: clip, engineer and join the window features, update the scaler statistics
+#      (StandardScaler.partial_fit) and write the encoded rows to an on-disk float32 matrix;
+#   3. standardise the numeric block of that matrix in place once the statistics are final;
+#   4. build each model's LightGBM Dataset from the matrix through lightgbm.Sequence (bin bounds
+#      from a row sample, then rows pushed in batches) and train on it.
+# Only class weighting and undersampling are available here: SMOTE needs the rows in memory.
+
+import math
+import os
+import pickle
+import tempfile
+import time
+
+import lightgbm as lgb
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+from sklearn.utils.class_weight import compute_sample_weight
+
+import loan_python_file as model
+import model_training as training
+from data_loader import LOAN_APPLICATIONS_CSV, TRANSACTIONS_CSV, iter_loan_application_chunks, iter_transaction_chunks
+from model_components import BoosterClassifier, OutlierClipper
+from model_registry import ModelSet
+from transaction_features import add_transaction_window_features
+
+# Rows per CSV chunk read (and per block written to the feature matrix), and CSV bytes
+# (applications plus transactions) per customer partition; a partition's frames take a few
+# times its CSV size in memory
+CHUNK_ROWS = 100_000
+PARTITION_BYTES = 64 * 1024 * 1024
+
+# Imbalance strategies that work on streamed data
+OUT_OF_CORE_IMBALANCE_STRATEGIES = ('class_weight', 'undersample')
+
+# Share of rows held out of training, as in train_models
+HOLDOUT_FRACTION = 0.2
+
+# LightGBM settings matching the LGBMClassifier defaults train_models fits with
+BOOSTING_ROUNDS = 100
+BOOSTER_PARAMS = {'learning_rate': 0.1, 'num_leaves': 31, 'seed': 42}
+
+class _MatrixRows(lgb.Sequence):
+    """Selected rows of the on-disk float32 feature matrix, read by LightGBM one float64 batch at a time"""
+
+    def __init__(self, matrix, rows, batch_size=8192):
+        self.matrix = matrix
+        self.rows = rows
+        self.batch_size = batch_size
+
+    def __getitem__(self, idx):
+        return self.matrix[self.rows[idx]].astype(np.float64)
+
+    def __len__(self):
+        return len(self.rows)
+
+def _partition_path(work_dir, table, partition):
+    return os.path.join(work_dir, f'{table}_{partition}.pkl')
+
+def _write_partitions(chunk, n_partitions, files):
+    """Append a chunk's rows to the partition file of each row's customer"""
+    partitions = pd.util.hash_array(chunk['customer_id'].astype(str).to_numpy(dtype=object)) % n_partitions
+    for partition, part in chunk.groupby(partitions, sort=False):
+        pickle.dump(part, files[partition], protocol=pickle.HIGHEST_PROTOCOL)
+
+def _read_partition(path):
+    """Concatenated frames of one partition file (None if it has none), deleting the file"""
+    frames = []
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            while True:
+                try:
+                    frames.append(pickle.load(f))
+                except EOFError:
+                    break
+        os.remove(path)
+    return pd.concat(frames, ignore_index=True) if frames else None
+
+def _add_counts(total, counts):
+    return counts if total is None else total.add(counts, fill_value=0)
+
+def partition_training_data(work_dir, n_partitions, chunk_rows=CHUNK_ROWS, applications_path=LOAN_APPLICATIONS_CSV,
+                            transactions_path=TRANSACTIONS_CSV):
+    """Pass 1: split both CSVs into customer partitions under work_dir while gathering the streaming statistics.
+
+    Returns a dict with the number of application rows, the fitted outlier_clipper, the
+    category_counts of each one-hot column, the label counts and validation_applications.
+    """
+    outlier_clipper = OutlierClipper(lower_quantile=0.01, upper_quantile=0.99)
+    stats = {'rows': 0, 'category_counts': {}, 'fraud_counts': None, 'loan_status_counts': None,
+             'validation_applications': None}
+
+    files = [open(_partition_path(work_dir, 'applications', p), 'wb') for p in range(n_partitions)]
+    try:
+        for chunk in iter_loan_application_chunks(chunk_rows, path=applications_path):
+            if stats['validation_applications'] is None:
+                stats['validation_applications'] = training.validation_sample(chunk)
+            stats['rows'] += len(chunk)
+            outlier_clipper.partial_fit(chunk)
+            _, categorical_features, _ = training.feature_groups(chunk.drop(columns=training.NON_FEATURE_COLUMNS))
+            for col in categorical_features:
+                counts = chunk[col].astype(object).value_counts(dropna=False)
+                stats['category_counts'][col] = _add_counts(stats['category_counts'].get(col), counts)
+            stats['fraud_counts'] = _add_counts(stats['fraud_counts'], chunk['fraud_flag'].value_counts())
+            stats['loan_status_counts'] = _add_counts(
+                stats['loan_status_counts'], chunk['loan_status'].astype(object).value_counts()
+            )
+            _write_partitions(chunk, n_partitions, files)
+    finally:
+        for f in files:
+            f.close()
+
+    files = [open(_partition_path(work_dir, 'transactions', p), 'wb') for p in range(n_partitions)]
+    try:
+        for chunk in iter_transaction_chunks(chunk_rows, usecols=training.TRANSACTION_COLUMNS, path=transactions_path):
+            _write_partitions(chunk, n_partitions, files)
+    finally:
+        for f in files:
+            f.close()
+
+    stats['outlier_clipper'] = outlier_clipper
+    return stats
+
+def encode_partitions(work_dir, n_partitions, stats, fraud_classes, loan_status_classes, chunk_rows=CHUNK_ROWS):
+    """Pass 2 and 3: engineer and encode every partition into one standardised float32 matrix on disk.
+
+    Returns (matrix, fraud labels, loan status labels, fitted preprocessor, X_columns); labels are
+    class indices.
+    """
+    rows = stats['rows']
+    outlier_clipper = stats['outlier_clipper']
+    scaler = StandardScaler()
+    fraud_labels = np.empty(rows, dtype=np.int8)
+    loan_status_labels = np.empty(rows, dtype=np.int8)
+    preprocessor = matrix = X_columns = numerical_features = None
+    offset = 0
+
+    for partition in range(n_partitions):
+        applications_df = _read_partition(_partition_path(work_dir, 'applications', partition))
+        transactions_df = _read_partition(_partition_path(work_dir, 'transactions', partition))
+        if applications_df is None:
+            continue
+        if transactions_df is None:
+            transactions_df = pd.DataFrame(columns=training.TRANSACTION_COLUMNS)
+
+        outlier_clipper.transform(applications_df)
+        model.engineer_application_features(applications_df)
+        applications_df = add_transaction_window_features(applications_df, transactions_df, notebook_compatible=False)
+        X = applications_df.drop(columns=training.NON_FEATURE_COLUMNS)
+
+        if preprocessor is None:
+            X_columns = X.columns.tolist()
+            numerical_features, categorical_features, address_features = training.feature_groups(X)
+            preprocessor = training.build_preprocessor(numerical_features, categorical_features, address_features)
+            preprocessor.fit(training.vocabulary_frame(stats['category_counts'], X_columns))
+            width = max(indices.stop for indices in preprocessor.output_indices_.values())
+            matrix = np.lib.format.open_memmap(os.path.join(work_dir, 'features.npy'), mode='w+',
+                                               dtype=np.float32, shape=(rows, width))
+
+        X = X.reindex(columns=X_columns)
+        scaler.partial_fit(X[numerical_features])
+        for start in range(0, len(X), chunk_rows):
+            block = preprocessor.transform(X.iloc[start:start + chunk_rows])
+            matrix[offset + start:offset + start + block.shape[0]] = block.toarray()
+        end = offset + len(X)
+        fraud_labels[offset:end] = pd.Categorical(applications_df['fraud_flag'], categories=fraud_classes).codes
+        loan_status_labels[offset:end] = pd.Categorical(
+            applications_df['loan_status'].astype(object), categories=loan_status_classes
+        ).codes
+        offset = end
+
+    # Standardise the numeric block with the final statistics and give them to the fitted scaler
+    numeric_block = preprocessor.output_indices_['num']
+    for start in range(0, rows, chunk_rows):
+        block = matrix[start:start + chunk_rows, numeric_block].astype(np.float64)
+        matrix[start:start + chunk_rows, numeric_block] = ((block - scaler.mean_) / scaler.scale_).astype(np.float32)
+    matrix.flush()
+    fitted_scaler = preprocessor.named_transformers_['num']
+    for attribute in ('mean_', 'var_', 'scale_', 'n_samples_seen_'):
+        setattr(fitted_scaler, attribute, getattr(scaler, attribute))
+    return matrix, fraud_labels, loan_status_labels, preprocessor, X_columns
+
+def _fit_booster(matrix, rows, labels, classes, imbalance_strategy, n_jobs):
+    """Train one model on the given rows of the feature matrix through a lightgbm.Sequence"""
+    labels = labels[rows]
+    weight = None
+    if imbalance_strategy == 'undersample':
+        rng = np.random.default_rng(42)
+        present = np.unique(labels)
+        smallest = min(np.count_nonzero(labels == label) for label in present)
+        keep = np.sort(np.concatenate([
+            rng.choice(np.flatnonzero(labels == label), smallest, replace=False) for label in present
+        ]))
+        rows, labels = rows[keep], labels[keep]
+    else:
+        weight = compute_sample_weight('balanced', labels)
+
+    params = dict(BOOSTER_PARAMS, num_threads=n_jobs)
+    if len(classes) == 2:
+        params['objective'] = 'binary'
+    else:
+        params.update(objective='multiclass', num_class=len(classes))
+    dataset = lgb.Dataset(_MatrixRows(matrix, rows), label=labels, weight=weight, params={'num_threads': n_jobs})
+    booster = lgb.train(params, dataset, num_boost_round=BOOSTING_ROUNDS)
+    return BoosterClassifier(booster, classes)
+
+def train_models_out_of_core(bundle_path=model.MODEL_BUNDLE_PATH, imbalance_strategy='class_weight',
+                             n_jobs=training.TRAINING_N_JOBS, chunk_rows=CHUNK_ROWS, partition_bytes=PARTITION_BYTES,
+                             work_dir=None):
+    """Train, save and activate a model bundle like train_models, streaming the data (see the module comment).
+
+    Temporary partitions and the feature matrix go to a directory under `work_dir` (default: the
+    system temporary directory), which needs about 4 bytes per row per encoded feature.
+    """
+    if imbalance_strategy not in OUT_OF_CORE_IMBALANCE_STRATEGIES:
+        raise ValueError(f"Imbalance strategy {imbalance_strategy!r} needs the training rows in memory; "
+                         f"out-of-core training supports {OUT_OF_CORE_IMBALANCE_STRATEGIES}")
+    n_jobs = n_jobs or os.cpu_count() or 1
+    timings = {}
+    training_start = time.perf_counter()
+
+    stage_start = time.perf_counter()
+    data_fingerprint = training.training_data_fingerprint()
+    timings['fingerprint'] = time.perf_counter() - stage_start
+
+    csv_bytes = os.path.getsize(LOAN_APPLICATIONS_CSV) + os.path.getsize(TRANSACTIONS_CSV)
+    n_partitions = max(1, math.ceil(csv_bytes / partition_bytes))
+    with tempfile.TemporaryDirectory(prefix='loan_sherlock_training_', dir=work_dir) as work_dir:
+        stage_start = time.perf_counter()
+        stats = partition_training_data(work_dir, n_partitions, chunk_rows)
+        timings['partition'] = time.perf_counter() - stage_start
+
+        stage_start = time.perf_counter()
+        fraud_classes = np.sort(stats['fraud_counts'].index.to_numpy())
+        loan_status_classes = np.sort(stats['loan_status_counts'].index.to_numpy(dtype=object))
+        matrix, fraud_labels, loan_status_labels, preprocessor, X_columns = encode_partitions(
+            work_dir, n_partitions, stats, fraud_classes, loan_status_classes, chunk_rows
+        )
+        timings['encode'] = time.perf_counter() - stage_start
+
+        train_rows = np.flatnonzero(np.random.default_rng(42).random(stats['rows']) >= HOLDOUT_FRACTION)
+        stage_start = time.perf_counter()
+        fraud_model = _fit_booster(matrix, train_rows, fraud_labels, fraud_classes, imbalance_strategy, n_jobs)
+        timings['fraud_fit'] = time.perf_counter() - stage_start
+        stage_start = time.perf_counter()
+        loan_status_model = _fit_booster(matrix, train_rows, loan_status_labels, loan_status_classes,
+                                         imbalance_strategy, n_jobs)
+        timings['loan_status_fit'] = time.perf_counter() - stage_start
+        del matrix
+    timings['total'] = time.perf_counter() - training_start
+
+    print(f"Models trained out of core on {stats['rows']:,} applications in {n_partitions} partitions!")
+    training._print_stage_timings(timings)
+
+    models = ModelSet(
+        stats['outlier_clipper'], preprocessor, fraud_model, loan_status_model, X_columns, path=bundle_path or None,
+        metadata={'data_fingerprint': data_fingerprint, 'imbalance_strategy': imbalance_strategy, 'out_of_core': True,
+                  'training_timings': timings, 'training_data': training.applications_snapshot(stats['rows']),
+                  'category_counts': stats['category_counts']}
+    )
+    training._save_and_activate(models, bundle_path, stats['validation_applications'])
+    return models
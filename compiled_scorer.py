@@ -0,0 +1,135 @@
+# Compiled single-application scorer
+# Flattens the fitted outlier clipper, ColumnTransformer (scaler, one-hot vocabularies, address
+# hashing, passthrough columns) and LightGBM boosters into plain Python/NumPy lookups, so scoring
+# one application builds a float32 feature vector directly and calls the boosters, without pandas
+# or sklearn transform overhead. Produces the same features as the DataFrame path in
+# loan_python_file; the compiled tables are what export_portable_model writes out.
+
+import numpy as np
+from sklearn.preprocessing import FunctionTransformer, OneHotEncoder, StandardScaler
+
+from model_components import AddressHashingEncoder
+from portable_model import ApplicationFeaturizer, _is_missing
+
+class CompiledScorer:
+    """Score single applications (dicts) with the fitted bundle components and no DataFrames.
+
+    Built once per loaded model set; predict() returns the same tuple as
+    loan_python_file.predict_loan_risk_and_fraud.
+    """
+
+    def __init__(self, outlier_clipper, preprocessor, fraud_model, loan_status_model, X_columns,
+                 default_feature_value, transaction_feature_store=None):
+        self.X_columns = list(X_columns)
+        self.defaults = {col: default_feature_value(col) for col in self.X_columns}
+
+        if outlier_clipper is not None:
+            self.clip_bounds = {
+                col: (float(outlier_clipper.lower_[col]), float(outlier_clipper.upper_[col]))
+                for col in outlier_clipper.columns_
+            }
+        else:
+            self.clip_bounds = {}
+
+        self.n_features = len(preprocessor.get_feature_names_out())
+        self.numeric_blocks = []   # (columns, output offsets, means, scales)
+        self.onehot_blocks = []    # (column, {category: output index}, unknown output index or None)
+        self.address_blocks = []   # (column, hashed width, output offset)
+        self._compile_preprocessor(preprocessor)
+        self.featurizer = ApplicationFeaturizer(
+            self.X_columns, self.defaults, self.clip_bounds, self.numeric_blocks, self.onehot_blocks,
+            self.address_blocks, self.n_features, transaction_feature_store
+        )
+
+        if len(fraud_model.classes_) != 2:
+            raise TypeError("Cannot compile a fraud model that is not binary")
+        self.fraud_booster = fraud_model.booster_
+        self.fraud_classes = fraud_model.classes_
+        self.loan_status_booster = loan_status_model.booster_
+        self.loan_status_classes = loan_status_model.classes_
+
+    def _column_names(self, columns):
+        return [self.X_columns[col] if isinstance(col, (int, np.integer)) else col for col in columns]
+
+    def _compile_preprocessor(self, preprocessor):
+        offset = 0
+        for name, transformer, columns in preprocessor.transformers_:
+            if transformer == 'drop' or len(columns) == 0:
+                continue
+            columns = self._column_names(columns)
+            if transformer == 'passthrough' or (isinstance(transformer, FunctionTransformer) and transformer.func is None):
+                n_out = len(columns)
+                self.numeric_blocks.append((columns, np.arange(offset, offset + n_out), np.zeros(n_out), np.ones(n_out)))
+            elif isinstance(transformer, StandardScaler):
+                n_out = len(columns)
+                means = transformer.mean_ if transformer.with_mean else np.zeros(n_out)
+                scales = transformer.scale_ if transformer.with_std else np.ones(n_out)
+                self.numeric_blocks.append((columns, np.arange(offset, offset + n_out), means, scales))
+            elif isinstance(transformer, OneHotEncoder):
+                n_out = self._compile_onehot(transformer, columns, offset)
+            elif isinstance(transformer, AddressHashingEncoder):
+                n_out = transformer.n_features
+                self.address_blocks.append((columns[0], transformer.n_features, offset))
+            else:
+                raise TypeError(f"Cannot compile transformer {name!r} of type {type(transformer).__name__}")
+            offset += n_out
+        if offset != self.n_features:
+            raise ValueError(f"Compiled {offset} features but the preprocessor produces {self.n_features}")
+
+    def _compile_onehot(self, encoder, columns, offset):
+        """Vocabulary lookups per column (frequent categories in order, then the infrequent column)"""
+        if encoder.drop is not None:
+            raise TypeError("Cannot compile a OneHotEncoder with drop")
+        infrequent = getattr(encoder, 'infrequent_categories_', [None] * len(columns))
+        start = offset
+        for column, categories, infrequent_categories in zip(columns, encoder.categories_, infrequent):
+            infrequent_set = set(infrequent_categories) if infrequent_categories is not None else set()
+            lookup = {}
+            for category in categories:
+                if category not in infrequent_set:
+                    lookup[None if _is_missing(category) else category] = offset
+                    offset += 1
+            unknown_index = None
+            if infrequent_set:
+                unknown_index = offset
+                for category in infrequent_set:
+                    lookup[None if _is_missing(category) else category] = unknown_index
+                offset += 1
+            if encoder.handle_unknown == 'error':
+                unknown_index = 'error'
+            self.onehot_blocks.append((column, lookup, unknown_index))
+        return offset - start
+
+    def features(self, application):
+        """Model input vector (float32, shape (1, n_features)) for one application dict"""
+        return self.featurizer.features(application)
+
+    def predict_records(self, applications, fraud_threshold=None):
+        """Fraud labels, fraud probabilities, loan status labels and probabilities for a list of
+        application dicts, scored as one matrix"""
+        model_input = self.featurizer.features_matrix(applications)
+
+        fraud_positive = self.fraud_booster.predict(model_input)
+        if fraud_threshold is not None:
+            fraud_prediction = self.fraud_classes[(fraud_positive >= fraud_threshold).astype(int)]
+        else:
+            fraud_prediction = self.fraud_classes[(fraud_positive > 1.0 - fraud_positive).astype(int)]
+
+        loan_status_proba = self.loan_status_booster.predict(model_input)
+        loan_status_prediction = self.loan_status_classes[loan_status_proba.argmax(axis=1)]
+        return fraud_prediction, fraud_positive, loan_status_prediction, loan_status_proba
+
+    def predict(self, application, fraud_threshold=None):
+        """(fraud label, fraud probability, loan status label, loan status probabilities) for one application"""
+        model_input = self.features(application)
+
+        fraud_positive = self.fraud_booster.predict(model_input)[0]
+        fraud_proba = np.array([[1.0 - fraud_positive, fraud_positive]])
+        if fraud_threshold is not None:
+            fraud_prediction = self.fraud_classes[int(fraud_positive >= fraud_threshold)]
+        else:
+            fraud_prediction = self.fraud_classes[fraud_proba[0].argmax()]
+
+        loan_status_proba = self.loan_status_booster.predict(model_input)
+        loan_status_prediction = self.loan_status_classes[loan_status_proba[0].argmax()]
+        return fraud_prediction, fraud_proba[0, 1], loan_status_prediction, loan_status_proba
@@ -0,0 +1,172 @@
+# Dataset loading
+# Single place that parses loan_applications.csv and transactions.csv with explicit dtypes.
+# Parsed frames are cached in-process and as Parquet files on disk, keyed by the source file's
+# mtime/size and the dtype schema, so only the first load after a data change pays for CSV parsing.
+
+import hashlib
+import json
+import os
+import threading
+
+import pandas as pd
+
+LOAN_APPLICATIONS_CSV = 'loan_applications.csv'
+TRANSACTIONS_CSV = 'transactions.csv'
+CACHE_DIR = '.data_cache'
+
+LOAN_APPLICATION_DTYPES = {
+    'application_id': 'object',
+    'customer_id': 'object',
+    'loan_type': 'category',
+    'loan_amount_requested': 'float64',
+    'loan_tenure_months': 'float64',
+    'interest_rate_offered': 'float64',
+    'purpose_of_loan': 'category',
+    'employment_status': 'category',
+    'monthly_income': 'float64',
+    'cibil_score': 'float64',
+    'existing_emis_monthly': 'float64',
+    'debt_to_income_ratio': 'float64',
+    'property_ownership_status': 'category',
+    'residential_address': 'object',
+    'applicant_age': 'float64',
+    'gender': 'category',
+    'number_of_dependents': 'float64',
+    'loan_status': 'category',
+    'fraud_flag': 'int64',
+    'fraud_type': 'object',
+}
+LOAN_APPLICATION_DATES = ['application_date']
+
+# Integer columns that may have empty cells: parsed as float64, so a gap does not fail the load, and
+# turned back into int64 when a frame has none, as pd.read_csv would infer them without dtypes
+NULLABLE_INTEGER_COLUMNS = ['loan_tenure_months', 'cibil_score', 'applicant_age', 'number_of_dependents']
+
+TRANSACTION_DTYPES = {
+    'transaction_id': 'object',
+    'customer_id': 'object',
+    'transaction_type': 'category',
+    'transaction_amount': 'float64',
+    'merchant_category': 'category',
+    'merchant_name': 'object',
+    'transaction_location': 'object',
+    'account_balance_after_transaction': 'float64',
+    'is_international_transaction': 'int64',
+    'device_used': 'category',
+    'ip_address': 'object',
+    'transaction_status': 'category',
+    'transaction_source_destination': 'object',
+    'transaction_notes': 'object',
+    'fraud_flag': 'int64',
+}
+TRANSACTION_DATES = ['transaction_date']
+
+# In-process cache: absolute source path -> (cache key, parsed DataFrame)
+_frame_cache = {}
+_cache_lock = threading.Lock()
+
+try:
+    import pyarrow  # noqa: F401  (Parquet engine for the on-disk cache)
+    _PARQUET_AVAILABLE = True
+except ImportError:
+    _PARQUET_AVAILABLE = False
+
+def file_version(path):
+    """(mtime_ns, size) of a source file, used to detect data changes"""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+def data_version(paths=(LOAN_APPLICATIONS_CSV, TRANSACTIONS_CSV)):
+    """Version tuple for a set of source files; changes whenever any of them is rewritten"""
+    return tuple(file_version(path) for path in paths)
+
+def _cache_key(path, dtypes, parse_dates):
+    mtime_ns, size = file_version(path)
+    schema = json.dumps({'dtypes': dtypes, 'parse_dates': parse_dates}, sort_keys=True)
+    payload = f"{os.path.abspath(path)}|{mtime_ns}|{size}|{schema}"
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+def _disk_cache_path(path, key):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(CACHE_DIR, f"{stem}-{key}.parquet")
+
+def _write_disk_cache(path, key, df):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    # Drop cache files left behind by older versions of the same source
+    for name in os.listdir(CACHE_DIR):
+        if name.startswith(f"{stem}-") and name.endswith('.parquet'):
+            os.remove(os.path.join(CACHE_DIR, name))
+
+    cache_path = _disk_cache_path(path, key)
+    tmp_path = f"{cache_path}.tmp"
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, cache_path)
+
+def _restore_integer_columns(df):
+    """Make the NULLABLE_INTEGER_COLUMNS of a parsed frame int64 where they have no missing or fractional values"""
+    for col in NULLABLE_INTEGER_COLUMNS:
+        if col in df.columns and df[col].notna().all() and (df[col] % 1 == 0).all():
+            df[col] = df[col].astype('int64')
+    return df
+
+def _read_csv(path, dtypes, parse_dates, **kwargs):
+    return _restore_integer_columns(pd.read_csv(path, dtype=dtypes, parse_dates=parse_dates, **kwargs))
+
+def _load_frame(path, dtypes, parse_dates, copy):
+    key = _cache_key(path, dtypes, parse_dates)
+    slot = os.path.abspath(path)
+    with _cache_lock:
+        cached_key, df = _frame_cache.get(slot, (None, None))
+        if cached_key != key:
+            cache_path = _disk_cache_path(path, key)
+            if _PARQUET_AVAILABLE and os.path.exists(cache_path):
+                df = pd.read_parquet(cache_path)
+            else:
+                df = _read_csv(path, dtypes, parse_dates)
+                if _PARQUET_AVAILABLE:
+                    try:
+                        _write_disk_cache(path, key, df)
+                    except OSError:
+                        pass  # the disk cache is an optimisation only
+            _frame_cache[slot] = (key, df)
+    return df.copy() if copy else df
+
+def load_loan_applications(path=LOAN_APPLICATIONS_CSV, copy=True):
+    """Loan applications with categorical columns and a parsed application_date.
+
+    Pass copy=False for read-only access to the shared cached frame.
+    """
+    return _load_frame(path, LOAN_APPLICATION_DTYPES, LOAN_APPLICATION_DATES, copy)
+
+def load_transactions(path=TRANSACTIONS_CSV, copy=True):
+    """Transactions with categorical columns and a parsed transaction_date.
+
+    Pass copy=False for read-only access to the shared cached frame.
+    """
+    return _load_frame(path, TRANSACTION_DTYPES, TRANSACTION_DATES, copy)
+
+def _iter_chunks(path, dtypes, parse_dates, chunksize, usecols):
+    if usecols is not None:
+        dtypes = {col: dtype for col, dtype in dtypes.items() if col in usecols}
+        parse_dates = [col for col in parse_dates if col in usecols]
+    for chunk in pd.read_csv(path, dtype=dtypes, parse_dates=parse_dates, usecols=usecols, chunksize=chunksize):
+        yield _restore_integer_columns(chunk)
+
+def iter_loan_application_chunks(chunksize, usecols=None, path=LOAN_APPLICATIONS_CSV):
+    """Stream loan applications in typed chunks (bypasses the caches; for data larger than memory)"""
+    return _iter_chunks(path, LOAN_APPLICATION_DTYPES, LOAN_APPLICATION_DATES, chunksize, usecols)
+
+def iter_transaction_chunks(chunksize, usecols=None, path=TRANSACTIONS_CSV):
+    """Stream transactions in typed chunks (bypasses the caches; for data larger than memory)"""
+    return _iter_chunks(path, TRANSACTION_DTYPES, TRANSACTION_DATES, chunksize, usecols)
+
+def load_loan_applications_tail(start_row, path=LOAN_APPLICATIONS_CSV):
+    """Typed loan applications from data row `start_row` onwards (for aggregating appended rows)"""
+    return _read_csv(path, LOAN_APPLICATION_DTYPES, LOAN_APPLICATION_DATES, skiprows=range(1, start_row + 1))
+
+def clear_cache():
+    """Forget all in-process cached frames (the on-disk cache is left in place)"""
+    with _cache_lock:
+        _frame_cache.clear()
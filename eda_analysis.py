@@ -1,189 +1,301 @@
-import pandas as pd
-import numpy as np
-from datetime import datetime
-
-def analyze_loan_data():
-    """Analyze loan applications data and return insights"""
-    
-    # Load the data
-    loan_df = pd.read_csv('loan_applications.csv')
-    transactions_df = pd.read_csv('transactions.csv')
-    
-    # Basic statistics
-    total_applications = len(loan_df)
-    
-    # Loan status analysis
-    approved_loans = len(loan_df[loan_df['loan_status'] == 'Approved'])
-    declined_loans = len(loan_df[loan_df['loan_status'] == 'Declined'])
-    approval_rate = (approved_loans / total_applications * 100)
-    
-    # Loan amount statistics
-    avg_loan_amount = loan_df['loan_amount_requested'].mean()
-    total_loan_amount = loan_df[loan_df['loan_status'] == 'Approved']['loan_amount_requested'].sum()
-    
-    # Fraud analysis
-    fraud_cases = len(loan_df[loan_df['fraud_flag'] == 1])
-    fraud_rate = (fraud_cases / total_applications * 100)
-    
-    # Loan type distribution
-    loan_type_dist = loan_df['loan_type'].value_counts()
-    
-    # Employment status analysis
-    employment_dist = loan_df['employment_status'].value_counts()
-    
-    # Age and gender analysis
-    avg_age = loan_df['applicant_age'].mean()
-    gender_dist = loan_df['gender'].value_counts()
-    
-    # CIBIL score analysis
-    avg_cibil = loan_df['cibil_score'].mean()
-    cibil_approved = loan_df[loan_df['loan_status'] == 'Approved']['cibil_score'].mean()
-    cibil_declined = loan_df[loan_df['loan_status'] == 'Declined']['cibil_score'].mean()
-    
-    # Interest rate analysis
-    avg_interest_rate = loan_df['interest_rate_offered'].mean()
-    
-    # Property ownership analysis
-    property_dist = loan_df['property_ownership_status'].value_counts()
-    
-    # Transaction analysis
-    total_transactions = len(transactions_df)
-    avg_transaction_amount = transactions_df['transaction_amount'].mean()
-    total_transaction_volume = transactions_df['transaction_amount'].sum()
-    
-    # Transaction type distribution
-    transaction_type_dist = transactions_df['transaction_type'].value_counts()
-    
-    # Merchant category analysis
-    merchant_category_dist = transactions_df['merchant_category'].value_counts()
-    
-    # Fraud in transactions
-    transaction_fraud = len(transactions_df[transactions_df['fraud_flag'] == 1])
-    transaction_fraud_rate = (transaction_fraud / total_transactions * 100)
-    
-    return {
-        'loan_stats': {
-            'total_applications': total_applications,
-            'approved_loans': approved_loans,
-            'declined_loans': declined_loans,
-            'approval_rate': approval_rate,
-            'avg_loan_amount': avg_loan_amount,
-            'total_loan_amount': total_loan_amount,
-            'fraud_rate': fraud_rate,
-            'avg_age': avg_age,
-            'avg_cibil': avg_cibil,
-            'cibil_approved': cibil_approved,
-            'cibil_declined': cibil_declined,
-            'avg_interest_rate': avg_interest_rate,
-            'loan_type_dist': loan_type_dist.to_dict(),
-            'employment_dist': employment_dist.to_dict(),
-            'gender_dist': gender_dist.to_dict(),
-            'property_dist': property_dist.to_dict()
-        },
-        'transaction_stats': {
-            'total_transactions': total_transactions,
-            'avg_transaction_amount': avg_transaction_amount,
-            'total_transaction_volume': total_transaction_volume,
-            'transaction_fraud_rate': transaction_fraud_rate,
-            'transaction_type_dist': transaction_type_dist.to_dict(),
-            'merchant_category_dist': merchant_category_dist.to_dict()
-        }
-    }
-
-def get_detailed_market_insights():
-    """Get detailed market insights for the Market Analysis page"""
-    
-    # Load the data
-    loan_df = pd.read_csv('loan_applications.csv')
-    transactions_df = pd.read_csv('transactions.csv')
-    
-    # Time series analysis
-    loan_df['application_date'] = pd.to_datetime(loan_df['application_date'])
-    loan_df['year'] = loan_df['application_date'].dt.year
-    loan_df['month'] = loan_df['application_date'].dt.month
-    
-    # Monthly trends
-    monthly_applications = loan_df.groupby(['year', 'month']).size().reset_index(name='applications')
-    monthly_approval_rate = loan_df.groupby(['year', 'month'])['loan_status'].apply(
-        lambda x: (x == 'Approved').sum() / len(x) * 100
-    ).reset_index(name='approval_rate')
-    
-    # Average loan amounts by type
-    avg_amounts_by_type = loan_df.groupby('loan_type')['loan_amount_requested'].mean().sort_values(ascending=False)
-    
-    # Interest rate trends by loan type
-    interest_by_type = loan_df.groupby('loan_type')['interest_rate_offered'].mean().sort_values(ascending=False)
-    
-    # Risk analysis by employment status
-    risk_by_employment = loan_df.groupby('employment_status').agg({
-        'loan_status': lambda x: (x == 'Approved').sum() / len(x) * 100,
-        'cibil_score': 'mean',
-        'loan_amount_requested': 'mean'
-    }).round(2)
-    
-    # Geographic analysis (state-wise)
-    loan_df['state'] = loan_df['residential_address'].str.split(', ').str[-2]
-    state_analysis = loan_df.groupby('state').agg({
-        'loan_status': lambda x: (x == 'Approved').sum() / len(x) * 100,
-        'loan_amount_requested': 'mean',
-        'cibil_score': 'mean'
-    }).round(2)
-    top_states = state_analysis.sort_values('loan_amount_requested', ascending=False).head(10)
-    
-    # Age group analysis
-    loan_df['age_group'] = pd.cut(loan_df['applicant_age'], 
-                                 bins=[0, 25, 35, 45, 55, 100], 
-                                 labels=['18-25', '26-35', '36-45', '46-55', '55+'])
-    age_analysis = loan_df.groupby('age_group').agg({
-        'loan_status': lambda x: (x == 'Approved').sum() / len(x) * 100,
-        'cibil_score': 'mean',
-        'loan_amount_requested': 'mean'
-    }).round(2)
-    
-    return {
-        'avg_amounts_by_type': avg_amounts_by_type.to_dict(),
-        'interest_by_type': interest_by_type.to_dict(),
-        'risk_by_employment': risk_by_employment.to_dict(),
-        'top_states': top_states.to_dict(),
-        'age_analysis': age_analysis.to_dict(),
-        'latest_trends': {
-            'total_portfolio_value': loan_df[loan_df['loan_status'] == 'Approved']['loan_amount_requested'].sum(),
-            'average_processing_time': '3-5 days',  # Based on typical industry standards
-            'digital_adoption': 78.5,  # Estimated based on transaction patterns
-            'customer_satisfaction': 4.2  # Typical industry rating
-        }
-    }
-
-if __name__ == "__main__":
-    results = analyze_loan_data()
-    print("=== LOAN DATA ANALYSIS ===")
-    print(f"Total Applications: {results['loan_stats']['total_applications']:,}")
-    print(f"Approval Rate: {results['loan_stats']['approval_rate']:.1f}%")
-    print(f"Average Loan Amount: ${results['loan_stats']['avg_loan_amount']:,.0f}")
-    print(f"Fraud Rate: {results['loan_stats']['fraud_rate']:.1f}%")
-    print(f"Average CIBIL Score: {results['loan_stats']['avg_cibil']:.0f}")
-    print(f"Average Interest Rate: {results['loan_stats']['avg_interest_rate']:.2f}%")
-    
-    print("\n=== TRANSACTION DATA ANALYSIS ===")
-    print(f"Total Transactions: {results['transaction_stats']['total_transactions']:,}")
-    print(f"Average Transaction Amount: ${results['transaction_stats']['avg_transaction_amount']:,.0f}")
-    print(f"Transaction Fraud Rate: {results['transaction_stats']['transaction_fraud_rate']:.2f}%")
-    
-    print("\n=== LOAN TYPE DISTRIBUTION ===")
-    for loan_type, count in results['loan_stats']['loan_type_dist'].items():
-        print(f"{loan_type}: {count}")
-    
-    print("\n=== EMPLOYMENT STATUS DISTRIBUTION ===")
-    for status, count in results['loan_stats']['employment_dist'].items():
-        print(f"{status}: {count}")
-    
-    # Get market insights
-    market_insights = get_detailed_market_insights()
-    print("\n=== MARKET INSIGHTS ===")
-    print("Average Loan Amounts by Type:")
-    for loan_type, amount in market_insights['avg_amounts_by_type'].items():
-        print(f"  {loan_type}: ${amount:,.0f}")
-    
-    print("\nInterest Rates by Type:")
-    for loan_type, rate in market_insights['interest_by_type'].items():
-        print(f"  {loan_type}: {rate:.2f}%")
+import pandas as pd
+import numpy as np
+from datetime import datetime
+
+from data_loader import (
+    load_loan_applications, load_transactions, iter_loan_application_chunks, iter_transaction_chunks
+)
+from loan_cube import AGE_GROUP_LABELS, age_groups, derive_state
+
+# Columns analyze_loan_data reads; the chunked mode loads only these
+LOAN_MEAN_COLUMNS = ['loan_amount_requested', 'applicant_age', 'cibil_score', 'interest_rate_offered']
+LOAN_DIST_COLUMNS = ['loan_type', 'employment_status', 'gender', 'property_ownership_status']
+LOAN_ANALYSIS_COLUMNS = ['loan_status', 'fraud_flag'] + LOAN_MEAN_COLUMNS + LOAN_DIST_COLUMNS
+TRANSACTION_DIST_COLUMNS = ['transaction_type', 'merchant_category']
+TRANSACTION_ANALYSIS_COLUMNS = ['transaction_amount', 'fraud_flag'] + TRANSACTION_DIST_COLUMNS
+
+def _loan_partials(loan_df):
+    """Additive aggregates of an applications frame (or one chunk of it), one grouped pass"""
+    by_status = loan_df.groupby('loan_status', observed=True).agg(
+        applications=('loan_status', 'size'),
+        loan_amount=('loan_amount_requested', 'sum'),
+        cibil_sum=('cibil_score', 'sum'),
+        cibil_count=('cibil_score', 'count')
+    )
+    return {
+        'rows': len(loan_df),
+        'fraud_cases': int((loan_df['fraud_flag'] == 1).sum()),
+        'by_status': by_status,
+        'sums': loan_df[LOAN_MEAN_COLUMNS].sum(),
+        'counts': loan_df[LOAN_MEAN_COLUMNS].count(),
+        'dists': {col: loan_df[col].value_counts() for col in LOAN_DIST_COLUMNS}
+    }
+
+def _transaction_partials(transactions_df):
+    """Additive aggregates of a transactions frame (or one chunk of it)"""
+    amounts = transactions_df['transaction_amount']
+    return {
+        'rows': len(transactions_df),
+        'fraud_cases': int((transactions_df['fraud_flag'] == 1).sum()),
+        'amount_sum': amounts.sum(),
+        'amount_count': int(amounts.count()),
+        'dists': {col: transactions_df[col].value_counts() for col in TRANSACTION_DIST_COLUMNS}
+    }
+
+def _combine_partials(left, right):
+    """Add two partial-aggregate dicts produced by the same _*_partials function"""
+    combined = {}
+    for key, value in left.items():
+        if isinstance(value, dict):
+            combined[key] = _combine_partials(value, right[key])
+        elif isinstance(value, (pd.Series, pd.DataFrame)):
+            combined[key] = pd.concat([value, right[key]]).groupby(level=0, observed=True).sum()
+        else:
+            combined[key] = value + right[key]
+    return combined
+
+def _aggregate_chunks(chunks, partials_func):
+    """Fold per-chunk partial aggregates so only one chunk is in memory at a time"""
+    total = None
+    for chunk in chunks:
+        partials = partials_func(chunk)
+        total = partials if total is None else _combine_partials(total, partials)
+    return total
+
+def _status_mean(by_status, status, sum_col, count_col):
+    if status not in by_status.index or not by_status.at[status, count_col]:
+        return np.nan
+    return by_status.at[status, sum_col] / by_status.at[status, count_col]
+
+def _sorted_dist(counts):
+    return counts.sort_values(ascending=False, kind='stable').to_dict()
+
+def analyze_loan_data(chunksize=None):
+    """Analyze loan applications data and return insights
+
+    Every KPI is derived from one grouped/vectorized pass per table. With `chunksize` the CSVs
+    are streamed in chunks of that many rows, so files larger than memory can be aggregated.
+    """
+    
+    # Load the data (read-only, shared with other callers) and aggregate it
+    if chunksize is None:
+        loan = _loan_partials(load_loan_applications(copy=False))
+        transactions = _transaction_partials(load_transactions(copy=False))
+    else:
+        loan = _aggregate_chunks(
+            iter_loan_application_chunks(chunksize, usecols=LOAN_ANALYSIS_COLUMNS), _loan_partials
+        )
+        transactions = _aggregate_chunks(
+            iter_transaction_chunks(chunksize, usecols=TRANSACTION_ANALYSIS_COLUMNS), _transaction_partials
+        )
+    
+    # Basic statistics
+    total_applications = loan['rows']
+    by_status = loan['by_status']
+    loan_means = loan['sums'] / loan['counts']
+    
+    # Loan status analysis
+    approved_loans = int(by_status['applications'].get('Approved', 0))
+    declined_loans = int(by_status['applications'].get('Declined', 0))
+    approval_rate = (approved_loans / total_applications * 100)
+    
+    # Loan amount statistics
+    avg_loan_amount = loan_means['loan_amount_requested']
+    total_loan_amount = by_status['loan_amount'].get('Approved', 0.0)
+    
+    # Fraud analysis
+    fraud_rate = (loan['fraud_cases'] / total_applications * 100)
+    
+    # CIBIL score analysis
+    cibil_approved = _status_mean(by_status, 'Approved', 'cibil_sum', 'cibil_count')
+    cibil_declined = _status_mean(by_status, 'Declined', 'cibil_sum', 'cibil_count')
+    
+    # Transaction analysis
+    total_transactions = transactions['rows']
+    avg_transaction_amount = transactions['amount_sum'] / transactions['amount_count']
+    transaction_fraud_rate = (transactions['fraud_cases'] / total_transactions * 100)
+    
+    return {
+        'loan_stats': {
+            'total_applications': total_applications,
+            'approved_loans': approved_loans,
+            'declined_loans': declined_loans,
+            'approval_rate': approval_rate,
+            'avg_loan_amount': avg_loan_amount,
+            'total_loan_amount': total_loan_amount,
+            'fraud_rate': fraud_rate,
+            'avg_age': loan_means['applicant_age'],
+            'avg_cibil': loan_means['cibil_score'],
+            'cibil_approved': cibil_approved,
+            'cibil_declined': cibil_declined,
+            'avg_interest_rate': loan_means['interest_rate_offered'],
+            'loan_type_dist': _sorted_dist(loan['dists']['loan_type']),
+            'employment_dist': _sorted_dist(loan['dists']['employment_status']),
+            'gender_dist': _sorted_dist(loan['dists']['gender']),
+            'property_dist': _sorted_dist(loan['dists']['property_ownership_status'])
+        },
+        'transaction_stats': {
+            'total_transactions': total_transactions,
+            'avg_transaction_amount': avg_transaction_amount,
+            'total_transaction_volume': transactions['amount_sum'],
+            'transaction_fraud_rate': transaction_fraud_rate,
+            'transaction_type_dist': _sorted_dist(transactions['dists']['transaction_type']),
+            'merchant_category_dist': _sorted_dist(transactions['dists']['merchant_category'])
+        }
+    }
+
+# Dimensions and measures of the market insights; every group statistic is a sum or a count
+INSIGHT_DIMENSIONS = ['loan_type', 'employment_status', 'state', 'age_group']
+INSIGHT_MEASURES = ['loan_amount_requested', 'cibil_score', 'interest_rate_offered']
+
+def _insight_partials(loan_df):
+    """Per-group sums and counts for every insight dimension, from one indicator/measure frame"""
+    is_approved = (loan_df['loan_status'] == 'Approved').to_numpy(dtype=np.int64)
+    frame = pd.DataFrame({
+        'loan_type': loan_df['loan_type'],
+        'employment_status': loan_df['employment_status'],
+        'state': derive_state(loan_df['residential_address']),
+        'age_group': age_groups(loan_df['applicant_age']),
+        'is_approved': is_approved,
+        'approved_amount': loan_df['loan_amount_requested'].to_numpy() * is_approved,
+        **{col: loan_df[col] for col in INSIGHT_MEASURES}
+    })
+    partials = {'portfolio_value': frame['approved_amount'].sum()}
+    for dimension in INSIGHT_DIMENSIONS:
+        grouped = frame.groupby(dimension, observed=True)
+        stats = grouped[['is_approved'] + INSIGHT_MEASURES].sum()
+        stats = stats.join(grouped[INSIGHT_MEASURES].count().add_suffix('_count'))
+        stats['applications'] = grouped.size()
+        partials[dimension] = stats
+    return partials
+
+def _parallel_insight_partials(loan_df, n_jobs):
+    """Compute insight partials on row slices in a thread pool and add them up.
+
+    pandas' groupby/factorize kernels release the GIL, so slices aggregate concurrently
+    without copying the frame into worker processes.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    bounds = np.linspace(0, len(loan_df), n_jobs + 1).astype(int)
+    slices = [loan_df.iloc[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        partials = list(executor.map(_insight_partials, slices))
+    total = partials[0]
+    for partial in partials[1:]:
+        total = _combine_partials(total, partial)
+    return total
+
+def _cube_insight_partials(cube):
+    """Insight partials rolled up from a LoanCube instead of raw rows"""
+    partials = {
+        'portfolio_value': cube.rollup(filters={'loan_status': 'Approved'})['loan_amount_requested_sum'].iloc[0]
+    }
+    for dimension in INSIGHT_DIMENSIONS:
+        stats = cube.rollup([dimension])
+        partials[dimension] = pd.DataFrame({
+            'is_approved': stats['approved'],
+            **{col: stats[f'{col}_sum'] for col in INSIGHT_MEASURES},
+            **{f'{col}_count': stats[f'{col}_count'] for col in INSIGHT_MEASURES},
+            'applications': stats['applications']
+        })
+    return partials
+
+def _group_insights(stats, columns):
+    """Approval rate (as 'loan_status') and measure means per group from summed partials"""
+    applications = stats['applications'].where(stats['applications'] > 0)
+    insights = {}
+    for col in columns:
+        if col == 'loan_status':
+            insights[col] = stats['is_approved'] / applications * 100
+        else:
+            insights[col] = stats[col] / stats[f'{col}_count'].where(stats[f'{col}_count'] > 0)
+    return pd.DataFrame(insights)
+
+def get_detailed_market_insights(n_jobs=1, cube=None):
+    """Get detailed market insights for the Market Analysis page
+
+    Approval rates come from an is_approved indicator computed once; every group statistic is a
+    native sum/count aggregation. n_jobs > 1 splits the rows across a thread pool. Pass a
+    loan_cube.LoanCube to roll the insights up from its cells without touching raw rows.
+    """
+    
+    # Aggregate the cube cells, or load the data (read-only, shared with other callers)
+    if cube is not None:
+        partials = _cube_insight_partials(cube)
+    else:
+        loan_df = load_loan_applications(copy=False)
+        if n_jobs > 1 and len(loan_df) > 1:
+            partials = _parallel_insight_partials(loan_df, n_jobs)
+        else:
+            partials = _insight_partials(loan_df)
+    
+    # Average loan amounts by type
+    by_type = _group_insights(partials['loan_type'], ['loan_amount_requested', 'interest_rate_offered'])
+    avg_amounts_by_type = by_type['loan_amount_requested'].sort_values(ascending=False)
+    
+    # Interest rate trends by loan type
+    interest_by_type = by_type['interest_rate_offered'].sort_values(ascending=False)
+    
+    # Risk analysis by employment status
+    risk_by_employment = _group_insights(
+        partials['employment_status'], ['loan_status', 'cibil_score', 'loan_amount_requested']
+    ).round(2)
+    
+    # Geographic analysis (state-wise)
+    state_analysis = _group_insights(
+        partials['state'], ['loan_status', 'loan_amount_requested', 'cibil_score']
+    ).round(2)
+    top_states = state_analysis.sort_values('loan_amount_requested', ascending=False).head(10)
+    
+    # Age group analysis (every age group is reported, empty ones as NaN)
+    age_stats = partials['age_group'].reindex(pd.CategoricalIndex(AGE_GROUP_LABELS, ordered=True, name='age_group'))
+    age_stats['applications'] = age_stats['applications'].fillna(0)
+    age_analysis = _group_insights(age_stats, ['loan_status', 'cibil_score', 'loan_amount_requested']).round(2)
+    
+    return {
+        'avg_amounts_by_type': avg_amounts_by_type.to_dict(),
+        'interest_by_type': interest_by_type.to_dict(),
+        'risk_by_employment': risk_by_employment.to_dict(),
+        'top_states': top_states.to_dict(),
+        'age_analysis': age_analysis.to_dict(),
+        'latest_trends': {
+            'total_portfolio_value': partials['portfolio_value'],
+            'average_processing_time': '3-5 days',  # Based on typical industry standards
+            'digital_adoption': 78.5,  # Estimated based on transaction patterns
+            'customer_satisfaction': 4.2  # Typical industry rating
+        }
+    }
+
+if __name__ == "__main__":
+    results = analyze_loan_data()
+    print("=== LOAN DATA ANALYSIS ===")
+    print(f"Total Applications: {results['loan_stats']['total_applications']:,}")
+    print(f"Approval Rate: {results['loan_stats']['approval_rate']:.1f}%")
+    print(f"Average Loan Amount: ${results['loan_stats']['avg_loan_amount']:,.0f}")
+    print(f"Fraud Rate: {results['loan_stats']['fraud_rate']:.1f}%")
+    print(f"Average CIBIL Score: {results['loan_stats']['avg_cibil']:.0f}")
+    print(f"Average Interest Rate: {results['loan_stats']['avg_interest_rate']:.2f}%")
+    
+    print("\n=== TRANSACTION DATA ANALYSIS ===")
+    print(f"Total Transactions: {results['transaction_stats']['total_transactions']:,}")
+    print(f"Average Transaction Amount: ${results['transaction_stats']['avg_transaction_amount']:,.0f}")
+    print(f"Transaction Fraud Rate: {results['transaction_stats']['transaction_fraud_rate']:.2f}%")
+    
+    print("\n=== LOAN TYPE DISTRIBUTION ===")
+    for loan_type, count in results['loan_stats']['loan_type_dist'].items():
+        print(f"{loan_type}: {count}")
+    
+    print("\n=== EMPLOYMENT STATUS DISTRIBUTION ===")
+    for status, count in results['loan_stats']['employment_dist'].items():
+        print(f"{status}: {count}")
+    
+    # Get market insights
+    market_insights = get_detailed_market_insights()
+    print("\n=== MARKET INSIGHTS ===")
+    print("Average Loan Amounts by Type:")
+    for loan_type, amount in market_insights['avg_amounts_by_type'].items():
+        print(f"  {loan_type}: ${amount:,.0f}")
+    
+    print("\nInterest Rates by Type:")
+    for loan_type, rate in market_insights['interest_by_type'].items():
+        print(f"  {loan_type}: {rate:.2f}%")
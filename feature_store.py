@@ -0,0 +1,220 @@
+# Online transaction feature store
+# Keeps each customer's recent transactions with running totals so real-time scoring can look up
+# the same 30/90/180/365-day window features train_models builds with transaction_features, with
+# a binary search per window (batches use the vectorized offline computation).
+
+import math
+import threading
+from bisect import bisect_left, bisect_right, insort
+from itertools import accumulate
+
+import numpy as np
+import pandas as pd
+
+from transaction_features import TIME_WINDOWS, compute_transaction_window_features, transaction_feature_columns
+
+_NS_PER_DAY = 24 * 60 * 60 * 10**9
+
+def _to_ns(timestamp):
+    return pd.Timestamp(timestamp).value
+
+class _CustomerHistory:
+    """One customer's retained transactions in time order, with running amount totals.
+
+    The window [start, end) is found by bisecting the timestamps and its total is a difference of
+    two prefix sums. Each merchant category keeps its own sorted timestamps, so the distinct
+    categories of a window take one bisection per category rather than a scan of the window.
+    Transactions dropped by evict() leave a horizon before which windows are incomplete.
+    """
+
+    __slots__ = ('timestamps', 'amounts', 'categories', 'amount_prefix', 'category_timestamps', 'horizon_ns')
+
+    def __init__(self):
+        self.timestamps = []
+        self.amounts = []
+        self.categories = []
+        self.amount_prefix = [0.0]
+        self.category_timestamps = {}
+        self.horizon_ns = None
+
+    def add(self, timestamp_ns, amount, category):
+        if self.horizon_ns is not None and timestamp_ns < self.horizon_ns:
+            return
+        i = bisect_right(self.timestamps, timestamp_ns)
+        self.timestamps.insert(i, timestamp_ns)
+        self.amounts.insert(i, amount)
+        self.categories.insert(i, category)
+        if category is not None:
+            insort(self.category_timestamps.setdefault(category, []), timestamp_ns)
+        if i == len(self.amounts) - 1:
+            self.amount_prefix.append(self.amount_prefix[-1] + amount)
+        else:
+            # Late-arriving transaction: redo the running totals from it onwards
+            self.amount_prefix[i + 1:] = list(accumulate(self.amounts[i:], initial=self.amount_prefix[i]))[1:]
+
+    def evict(self, retention_ns):
+        """Drop transactions more than retention_ns older than the newest one"""
+        if retention_ns is None or not self.timestamps:
+            return
+        horizon_ns = self.timestamps[-1] - retention_ns
+        cut = bisect_left(self.timestamps, horizon_ns)
+        if cut:
+            del self.timestamps[:cut], self.amounts[:cut], self.categories[:cut], self.amount_prefix[:cut]
+            for category, timestamps in list(self.category_timestamps.items()):
+                del timestamps[:bisect_left(timestamps, horizon_ns)]
+                if not timestamps:
+                    del self.category_timestamps[category]
+            self.horizon_ns = horizon_ns
+
+    def window(self, start_ns, end_ns):
+        """Count, total and distinct categories of the transactions in [start, end)"""
+        lo = bisect_left(self.timestamps, start_ns)
+        hi = bisect_left(self.timestamps, end_ns, lo)
+        if hi == lo:
+            return 0, 0.0, 0
+        unique_categories = 0
+        for timestamps in self.category_timestamps.values():
+            # Present if the category's first transaction at or after start is before end
+            j = bisect_left(timestamps, start_ns)
+            unique_categories += j < len(timestamps) and timestamps[j] < end_ns
+        return hi - lo, self.amount_prefix[hi] - self.amount_prefix[lo], unique_categories
+
+class TransactionFeatureStore:
+    """Incrementally updated per-customer transaction histories for the rolling window features.
+
+    Lookups are point-in-time and read-only: features as of `as_of` aggregate the transactions in
+    [as_of - window, as_of), exactly as transaction_features.compute_transaction_window_features
+    (notebook_compatible=False) does. Ingesting evicts a customer's transactions more than
+    `retention_days` (default: the longest window) older than their newest one, which bounds memory
+    for a stream but means lookups whose longest window reaches before the evicted range raise
+    ValueError; pass retention_days=math.inf to keep every transaction and look up any date.
+    """
+
+    def __init__(self, time_windows=TIME_WINDOWS, retention_days=None):
+        self.time_windows = list(time_windows)
+        self.feature_columns = transaction_feature_columns(self.time_windows)
+        if retention_days is None:
+            retention_days = max(self.time_windows)
+        self.retention_ns = None if math.isinf(retention_days) else int(retention_days * _NS_PER_DAY)
+        self._longest_window_ns = max(self.time_windows) * _NS_PER_DAY
+        self._customers = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._customers)
+
+    @classmethod
+    def from_csv(cls, path='transactions.csv', time_windows=TIME_WINDOWS, retention_days=None):
+        """Build a store from a transactions CSV"""
+        transactions_df = pd.read_csv(
+            path, usecols=['customer_id', 'transaction_date', 'transaction_amount', 'merchant_category']
+        )
+        store = cls(time_windows, retention_days)
+        store.ingest(transactions_df)
+        return store
+
+    def ingest(self, transactions_df):
+        """Append a batch of transactions (customer_id, transaction_date, transaction_amount, merchant_category)"""
+        transaction_dates = pd.to_datetime(transactions_df['transaction_date'])
+        transactions_df = transactions_df.assign(transaction_date=transaction_dates).dropna(
+            subset=['transaction_date', 'customer_id']
+        )
+        transactions_df = transactions_df.sort_values('transaction_date', kind='stable')
+        categories = transactions_df['merchant_category'].astype(object)
+
+        with self._lock:
+            customer_ids = transactions_df['customer_id'].to_numpy()
+            for customer_id, timestamp_ns, amount, category in zip(
+                customer_ids,
+                transactions_df['transaction_date'].to_numpy().astype('datetime64[ns]').astype('int64').tolist(),
+                transactions_df['transaction_amount'].to_numpy(dtype=float).tolist(),
+                categories.where(categories.notna(), None).to_numpy(),
+            ):
+                self._history(customer_id).add(timestamp_ns, amount, category)
+            for customer_id in pd.unique(customer_ids):
+                self._customers[customer_id].evict(self.retention_ns)
+
+    def add_transaction(self, customer_id, transaction_date, transaction_amount, merchant_category):
+        """Append one transaction from a stream"""
+        if pd.isna(merchant_category):
+            merchant_category = None
+        with self._lock:
+            history = self._history(customer_id)
+            history.add(_to_ns(transaction_date), float(transaction_amount), merchant_category)
+            history.evict(self.retention_ns)
+
+    def _history(self, customer_id):
+        history = self._customers.get(customer_id)
+        if history is None:
+            history = self._customers[customer_id] = _CustomerHistory()
+        return history
+
+    def get_features(self, customer_id, as_of):
+        """Window features for one customer as of a timestamp (application date); does not change the store"""
+        as_of_ns = _to_ns(as_of)
+        features = {}
+        with self._lock:
+            history = self._customers.get(customer_id)
+            if history is not None and history.horizon_ns is not None \
+                    and as_of_ns - self._longest_window_ns < history.horizon_ns:
+                raise ValueError(
+                    f"Transactions of customer {customer_id!r} before {pd.Timestamp(history.horizon_ns)} were "
+                    f"evicted, so window features as of {pd.Timestamp(as_of_ns)} would be incomplete"
+                )
+            for window_days in self.time_windows:
+                if history is None:
+                    count, total_amount, unique_categories = 0, 0.0, 0
+                else:
+                    count, total_amount, unique_categories = history.window(
+                        as_of_ns - window_days * _NS_PER_DAY, as_of_ns
+                    )
+                features[f'num_transactions_{window_days}d'] = count
+                features[f'total_transaction_amount_{window_days}d'] = total_amount
+                features[f'average_transaction_amount_{window_days}d'] = total_amount / count if count else 0.0
+                features[f'unique_merchant_categories_{window_days}d'] = unique_categories
+        return features
+
+    def features_frame(self, customer_ids, as_of_dates):
+        """Window features for aligned sequences of customer ids and as-of dates, computed for all rows at once.
+
+        Copies the histories of the customers involved into flat arrays and runs the offline
+        compute_transaction_window_features over them, rather than one get_features per row.
+        """
+        customer_ids = pd.Series(list(customer_ids), dtype=object)
+        as_of_dates = pd.to_datetime(pd.Series(list(as_of_dates), dtype=object))
+        with self._lock:
+            histories = {customer_id: self._customers[customer_id] for customer_id in pd.unique(customer_ids)
+                         if customer_id in self._customers}
+            transaction_customers, timestamps, amounts, categories, horizons = [], [], [], [], {}
+            for customer_id, history in histories.items():
+                transaction_customers += [customer_id] * len(history.timestamps)
+                timestamps += history.timestamps
+                amounts += history.amounts
+                categories += history.categories
+                if history.horizon_ns is not None:
+                    horizons[customer_id] = history.horizon_ns
+
+        if horizons:
+            horizon_ns = customer_ids.map(horizons)
+            as_of_ns = as_of_dates.to_numpy().astype('datetime64[ns]').astype(np.int64)
+            incomplete = horizon_ns.notna() & as_of_dates.notna() & (as_of_ns - self._longest_window_ns < horizon_ns)
+            if incomplete.any():
+                i = incomplete.to_numpy().argmax()
+                raise ValueError(
+                    f"Transactions of customer {customer_ids[i]!r} before {pd.Timestamp(int(horizon_ns[i]))} were "
+                    f"evicted, so window features as of {as_of_dates[i]} would be incomplete"
+                )
+
+        transactions_df = pd.DataFrame({
+            'customer_id': pd.Series(transaction_customers, dtype=object),
+            'transaction_date': pd.to_datetime(np.asarray(timestamps, dtype=np.int64)),
+            'transaction_amount': np.asarray(amounts, dtype=np.float64),
+            'merchant_category': pd.Series(categories, dtype=object),
+        })
+        applications_df = pd.DataFrame({
+            'application_id': np.arange(len(customer_ids)), 'customer_id': customer_ids, 'application_date': as_of_dates,
+        })
+        features_df = compute_transaction_window_features(
+            applications_df, transactions_df, self.time_windows, notebook_compatible=False
+        )
+        return features_df[self.feature_columns]
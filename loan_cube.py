@@ -0,0 +1,263 @@
+# Loan applications cube
+# Pre-aggregated application counts plus sums, sums of squares and counts of the numeric measures
+# per (month, loan_type, employment_status, state, age_group, loan_status, fraud_flag) cell.
+# Dashboards and eda_analysis roll the cells up instead of scanning raw rows, and rows appended to
+# loan_applications.csv are aggregated on their own and merged into the stored cube.
+
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    _ARROW_AVAILABLE = True
+except ImportError:
+    _ARROW_AVAILABLE = False
+
+from data_loader import (
+    CACHE_DIR, LOAN_APPLICATIONS_CSV, file_version, load_loan_applications, load_loan_applications_tail
+)
+
+CUBE_DIMENSIONS = ['month', 'loan_type', 'employment_status', 'state', 'age_group', 'loan_status', 'fraud_flag']
+CUBE_MEASURES = ['loan_amount_requested', 'cibil_score', 'interest_rate_offered']
+CUBE_FORMAT_VERSION = 2
+CUBE_PATH = os.path.join(CACHE_DIR, 'loan_cube.parquet')
+
+AGE_GROUP_BINS = [0, 25, 35, 45, 55, 100]
+AGE_GROUP_LABELS = ['18-25', '26-35', '36-45', '46-55', '55+']
+
+def derive_state(addresses):
+    """Second-to-last ', '-separated part of each residential address, as a categorical Series"""
+    if not _ARROW_AVAILABLE:
+        return addresses.str.split(', ').str[-2].astype('category')
+
+    # Split in Arrow and pick element len-2 of each list from the offsets, without Python per-row work
+    parts = pc.split_pattern(pa.array(addresses.to_numpy(), type=pa.string(), from_pandas=True),
+                             ', ', max_splits=2, reverse=True)
+    lengths = pc.list_value_length(parts).fill_null(0).to_numpy()
+    has_state = lengths >= 2
+    if not has_state.any():
+        return pd.Series(pd.Categorical([None] * len(addresses)), index=addresses.index)
+    positions = np.where(has_state, parts.offsets.to_numpy()[1:] - 2, 0)
+    states = pc.list_flatten(parts).take(pa.array(positions)).dictionary_encode()
+    codes = np.where(has_state, states.indices.to_numpy(), -1)
+
+    # Sorted categories so groupby order matches grouping on the plain strings
+    categories = states.dictionary.to_numpy(zero_copy_only=False)
+    order = np.argsort(categories, kind='stable')
+    remap = np.empty(len(order) + 1, dtype=np.int64)
+    remap[order] = np.arange(len(order))
+    remap[-1] = -1
+    return pd.Series(pd.Categorical.from_codes(remap[codes], categories[order]), index=addresses.index)
+
+def age_groups(ages):
+    """Applicant ages bucketed into the dashboard's age groups"""
+    return pd.cut(ages, bins=AGE_GROUP_BINS, labels=AGE_GROUP_LABELS)
+
+def application_months(dates):
+    """'YYYY-MM' month of each application date, as a categorical Series"""
+    codes, months = pd.factorize(pd.to_datetime(dates).dt.to_period('M'), sort=True)
+    return pd.Series(pd.Categorical.from_codes(codes, months.astype(str)), index=dates.index)
+
+def _compact(cells):
+    """Categorical dimension columns (merged cells fall back to object columns)"""
+    for dimension in CUBE_DIMENSIONS:
+        if dimension != 'fraud_flag' and not isinstance(cells[dimension].dtype, pd.CategoricalDtype):
+            cells[dimension] = cells[dimension].astype('category')
+    return cells.reset_index(drop=True)
+
+def build_cells(loan_df):
+    """Aggregate loan applications into cube cells"""
+    frame = pd.DataFrame({
+        'month': application_months(loan_df['application_date']),
+        'loan_type': loan_df['loan_type'],
+        'employment_status': loan_df['employment_status'],
+        'state': derive_state(loan_df['residential_address']),
+        'age_group': age_groups(loan_df['applicant_age']),
+        'loan_status': loan_df['loan_status'],
+        'fraud_flag': loan_df['fraud_flag'],
+        'applications': 1
+    })
+    for measure in CUBE_MEASURES:
+        values = loan_df[measure].astype('float64')
+        frame[f'{measure}_sum'] = values
+        frame[f'{measure}_sumsq'] = values * values
+        frame[f'{measure}_count'] = values.notna().astype('int64')
+    cells = frame.groupby(CUBE_DIMENSIONS, observed=True, dropna=False, as_index=False).sum()
+    return _compact(cells)
+
+def merge_cells(left, right):
+    """Add two cell tables together"""
+    cells = pd.concat([left, right], ignore_index=True)
+    for dimension in CUBE_DIMENSIONS:
+        if isinstance(cells[dimension].dtype, pd.CategoricalDtype):
+            cells[dimension] = cells[dimension].astype(object)
+    cells = cells.groupby(CUBE_DIMENSIONS, dropna=False, as_index=False).sum()
+    return _compact(cells)
+
+class LoanCube:
+    """Counts and measure sums/sums of squares per cube cell, with roll-up and drill-down queries"""
+
+    def __init__(self, cells):
+        self.cells = cells
+
+    def __len__(self):
+        return len(self.cells)
+
+    @classmethod
+    def from_applications(cls, loan_df):
+        """Build a cube from a loan applications frame"""
+        return cls(build_cells(loan_df))
+
+    def update(self, new_applications_df):
+        """Aggregate newly arrived applications into the cube"""
+        if len(new_applications_df):
+            self.cells = merge_cells(self.cells, build_cells(new_applications_df))
+        return self
+
+    def rollup(self, by=(), filters=None):
+        """Summed cell statistics grouped by the dimensions in `by`, after filtering.
+
+        `filters` maps dimensions to a value or a list of values to keep. Besides the measure
+        sums, sums of squares and counts, the result has applications, approved and fraud_cases.
+        """
+        cells = self.cells
+        if filters:
+            mask = np.ones(len(cells), dtype=bool)
+            for dimension, values in filters.items():
+                values = values if isinstance(values, (list, tuple, set)) else [values]
+                mask &= cells[dimension].isin(values).to_numpy()
+            cells = cells[mask]
+
+        statistics = [col for col in cells.columns if col not in CUBE_DIMENSIONS]
+        cells = cells.assign(
+            approved=np.where(cells['loan_status'] == 'Approved', cells['applications'], 0),
+            fraud_cases=np.where(cells['fraud_flag'] == 1, cells['applications'], 0)
+        )
+        statistics += ['approved', 'fraud_cases']
+        by = list(by)
+        if not by:
+            return cells[statistics].sum().to_frame().T
+        return cells.groupby(by, observed=True)[statistics].sum()
+
+    def query(self, by=(), filters=None):
+        """Rolled-up applications, approval/fraud rates and measure mean/std per group"""
+        stats = self.rollup(by, filters)
+        applications = stats['applications'].where(stats['applications'] > 0)
+        result = pd.DataFrame({
+            'applications': stats['applications'],
+            'approval_rate': stats['approved'] / applications * 100,
+            'fraud_rate': stats['fraud_cases'] / applications * 100
+        }, index=stats.index)
+        for measure in CUBE_MEASURES:
+            count = stats[f'{measure}_count'].where(stats[f'{measure}_count'] > 0)
+            total = stats[f'{measure}_sum']
+            variance = (stats[f'{measure}_sumsq'] - total * total / count) / (count - 1).where(count > 1)
+            result[f'{measure}_total'] = total
+            result[f'{measure}_mean'] = total / count
+            result[f'{measure}_std'] = np.sqrt(variance.clip(lower=0))
+        return result
+
+    def save(self, path=CUBE_PATH, metadata=None):
+        """Write the cells as Parquet (plus a JSON sidecar with `metadata`), atomically"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        if os.path.exists(_metadata_path(path)):
+            os.remove(_metadata_path(path))  # never pair new cells with stale metadata
+        tmp_path = f"{path}.tmp"
+        self.cells.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+        with open(f"{path}.tmp.json", 'w') as f:
+            json.dump(metadata or {}, f)
+        os.replace(f"{path}.tmp.json", _metadata_path(path))
+
+    @classmethod
+    def load(cls, path=CUBE_PATH):
+        """Read cells written by save"""
+        return cls(_compact(pd.read_parquet(path)))
+
+def _metadata_path(cube_path):
+    return os.path.splitext(cube_path)[0] + '.json'
+
+def _prefix_digest(path, end):
+    """SHA-256 of the first `end` bytes of a file plus whether they end with a newline (None if it is shorter)"""
+    digest = hashlib.sha256()
+    remaining = end
+    block = b''
+    with open(path, 'rb') as f:
+        while remaining > 0:
+            block = f.read(min(1 << 20, remaining))
+            if not block:
+                return None
+            digest.update(block)
+            remaining -= len(block)
+    return digest.hexdigest(), block.endswith(b'\n')
+
+def _source_metadata(path, rows):
+    mtime_ns, size = file_version(path)
+    digest, ends_with_newline = _prefix_digest(path, size)
+    return {
+        'format_version': CUBE_FORMAT_VERSION,
+        'source': os.path.abspath(path),
+        'mtime_ns': mtime_ns,
+        'size': size,
+        'rows': rows,
+        'sha256': digest,
+        'ends_with_newline': ends_with_newline
+    }
+
+def _read_metadata(cube_path):
+    try:
+        with open(_metadata_path(cube_path)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _is_append_of(path, metadata):
+    """True if `path` is the file described by `metadata` with rows appended after it.
+
+    The whole previously aggregated prefix is hashed, so an edit anywhere in it forces a rebuild.
+    """
+    if metadata.get('format_version') != CUBE_FORMAT_VERSION or metadata.get('source') != os.path.abspath(path):
+        return False
+    _, size = file_version(path)
+    if size <= metadata['size'] or not metadata['ends_with_newline']:
+        return False
+    prefix = _prefix_digest(path, metadata['size'])
+    return prefix is not None and prefix[0] == metadata['sha256']
+
+def load_cube(path=LOAN_APPLICATIONS_CSV, cube_path=CUBE_PATH):
+    """Cube for a loan applications CSV, kept up to date on disk.
+
+    The stored cube is reused while the CSV is unchanged; if rows were only appended, just those
+    rows are aggregated and merged in; otherwise it is rebuilt. Without pyarrow the cube is built
+    in memory on every call.
+    """
+    if not _ARROW_AVAILABLE:
+        return LoanCube.from_applications(load_loan_applications(path, copy=False))
+
+    metadata = _read_metadata(cube_path)
+    if metadata and os.path.exists(cube_path):
+        mtime_ns, size = file_version(path)
+        if (metadata.get('format_version') == CUBE_FORMAT_VERSION and metadata.get('source') == os.path.abspath(path)
+                and (metadata['mtime_ns'], metadata['size']) == (mtime_ns, size)):
+            return LoanCube.load(cube_path)
+        if _is_append_of(path, metadata):
+            new_rows_df = load_loan_applications_tail(metadata['rows'], path)
+            cube = LoanCube.load(cube_path).update(new_rows_df)
+            _save_quietly(cube, cube_path, _source_metadata(path, metadata['rows'] + len(new_rows_df)))
+            return cube
+
+    loan_df = load_loan_applications(path, copy=False)
+    cube = LoanCube.from_applications(loan_df)
+    _save_quietly(cube, cube_path, _source_metadata(path, len(loan_df)))
+    return cube
+
+def _save_quietly(cube, cube_path, metadata):
+    try:
+        cube.save(cube_path, metadata)
+    except OSError:
+        pass  # the stored cube is an optimisation only
@@ -1,148 +1,429 @@
-# Fraud Detection and Risk Assessment Model
-# This script contains steps for data preprocessing, feature engineering, and model building for fraud detection and loan risk assessment.
-
-import warnings
-warnings.simplefilter('ignore')
-
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-from datetime import timedelta
-from sklearn.compose import ColumnTransformer
-from sklearn.preprocessing import StandardScaler, OneHotEncoder
-from sklearn.model_selection import train_test_split
-from imblearn.over_sampling import SMOTE
-from sklearn.linear_model import LogisticRegression
-from sklearn.ensemble import RandomForestClassifier
-from lightgbm import LGBMClassifier
-from sklearn.metrics import roc_auc_score, classification_report, confusion_matrix
-import pickle
-
-# Global variables to store trained models and preprocessor
-preprocessor = None
-lgbm_model = None
-lgbm_loan_status_model = None
-X_columns = None
-
-def train_models():
-    """Train the fraud detection and loan risk assessment models"""
-    global preprocessor, lgbm_model, lgbm_loan_status_model, X_columns
-    
-    # Load data
-    loan_applications_df = pd.read_csv('loan_applications.csv')
-    transactions_df = pd.read_csv('transactions.csv')
-
-    # Initial data inspection & cleaning
-    loan_applications_df['application_date'] = pd.to_datetime(loan_applications_df['application_date'])
-    transactions_df['transaction_date'] = pd.to_datetime(transactions_df['transaction_date'])
-    loan_applications_df['fraud_type'].fillna('Not Fraudulent', inplace=True)
-
-    # Outlier detection and treatment
-    numerical_cols = loan_applications_df.select_dtypes(include=np.number).columns.tolist()
-    for col in numerical_cols:
-        lower_bound = loan_applications_df[col].quantile(0.01)
-        upper_bound = loan_applications_df[col].quantile(0.99)
-        loan_applications_df[col] = loan_applications_df[col].clip(lower=lower_bound, upper=upper_bound)
-
-    # Feature engineering
-    loan_applications_df['application_year'] = loan_applications_df['application_date'].dt.year
-    loan_applications_df['application_month'] = loan_applications_df['application_date'].dt.month
-    loan_applications_df['application_day_of_week'] = loan_applications_df['application_date'].dt.dayofweek
-    loan_applications_df['existing_emi_to_income_ratio'] = (loan_applications_df['existing_emis_monthly'] / (loan_applications_df['monthly_income'] + 1e-6)) * 100
-    loan_applications_df['loan_amount_to_income_ratio'] = (loan_applications_df['loan_amount_requested'] / (loan_applications_df['monthly_income'] + 1e-6)) * 100
-
-    # Data preprocessing for modeling
-    X = loan_applications_df.drop(columns=['fraud_flag', 'loan_status', 'fraud_type', 'application_id', 'customer_id', 'application_date'])
-    X_columns = X.columns.tolist()
-    y_fraud = loan_applications_df['fraud_flag']
-    y_loan_status = loan_applications_df['loan_status']
-    
-    numerical_features = X.select_dtypes(include=['int64', 'float64']).columns.tolist()
-    categorical_features = X.select_dtypes(include=['object', 'category']).columns.tolist()
-    
-    preprocessor = ColumnTransformer(
-        transformers=[
-            ('num', StandardScaler(), numerical_features),
-            ('cat', OneHotEncoder(handle_unknown='ignore'), categorical_features)
-        ],
-        remainder='passthrough'
-    )
-    X_processed = preprocessor.fit_transform(X)
-
-    # Fraud detection model (using LightGBM only)
-    X_train, X_test, y_train, y_test = train_test_split(X_processed, y_fraud, test_size=0.2, random_state=42, stratify=y_fraud)
-    smote = SMOTE(random_state=42)
-    X_train_smote, y_train_smote = smote.fit_resample(X_train, y_train)
-    lgbm_model = LGBMClassifier(random_state=42)
-    lgbm_model.fit(X_train_smote, y_train_smote)
-
-    # Loan risk assessment model
-    X_train_loan_status, X_test_loan_status, y_train_loan_status, y_test_loan_status = train_test_split(X_processed, y_loan_status, test_size=0.2, random_state=42, stratify=y_loan_status)
-    smote_loan_status = SMOTE(random_state=42)
-    X_train_loan_status_smote, y_train_loan_status_smote = smote_loan_status.fit_resample(X_train_loan_status, y_train_loan_status)
-    lgbm_loan_status_model = LGBMClassifier(objective='multiclass', num_class=y_train_loan_status.nunique(), random_state=42)
-    lgbm_loan_status_model.fit(X_train_loan_status_smote, y_train_loan_status_smote)
-    
-    print("Models trained successfully!")
-    return preprocessor, lgbm_model, lgbm_loan_status_model, X_columns
-
-def predict_loan_risk_and_fraud(new_application_data):
-    """Predict fraud risk and loan status for new application data"""
-    global preprocessor, lgbm_model, lgbm_loan_status_model, X_columns
-    
-    # If models are not trained, train them first
-    if preprocessor is None or lgbm_model is None or lgbm_loan_status_model is None:
-        train_models()
-    
-    # Convert input data to DataFrame
-    new_application_df = pd.DataFrame([new_application_data])
-    
-    # Convert date and engineer features
-    new_application_df['application_date'] = pd.to_datetime(new_application_df['application_date'])
-    new_application_df['application_year'] = new_application_df['application_date'].dt.year
-    new_application_df['application_month'] = new_application_df['application_date'].dt.month
-    new_application_df['application_day_of_week'] = new_application_df['application_date'].dt.dayofweek
-    
-    # Calculate ratios
-    epsilon = 1e-6
-    if 'existing_emis_monthly' in new_application_df.columns and 'monthly_income' in new_application_df.columns:
-        new_application_df['existing_emi_to_income_ratio'] = (new_application_df['existing_emis_monthly'] / (new_application_df['monthly_income'] + epsilon)) * 100
-    else:
-        new_application_df['existing_emi_to_income_ratio'] = 0
-        
-    if 'loan_amount_requested' in new_application_df.columns and 'monthly_income' in new_application_df.columns:
-        new_application_df['loan_amount_to_income_ratio'] = (new_application_df['loan_amount_requested'] / (new_application_df['monthly_income'] + epsilon)) * 100
-    else:
-        new_application_df['loan_amount_to_income_ratio'] = 0
-
-    # Prepare data with all required columns
-    new_application_processed_data = {}
-    for col in X_columns:
-        if col in new_application_df.columns:
-            new_application_processed_data[col] = new_application_df[col].iloc[0]
-        else:
-            # Set default values for missing columns
-            if col.startswith('num_transactions_') or col.startswith('unique_merchant_categories_'):
-                new_application_processed_data[col] = 0
-            elif col.startswith('total_transaction_amount_') or col.startswith('average_transaction_amount_'):
-                new_application_processed_data[col] = 0.0
-            else:
-                new_application_processed_data[col] = 0
-
-    new_application_processed_df = pd.DataFrame([new_application_processed_data])
-    new_application_processed_scaled = preprocessor.transform(new_application_processed_df)
-
-    # Make predictions
-    fraud_prediction = lgbm_model.predict(new_application_processed_scaled)[0]
-    fraud_prediction_proba = lgbm_model.predict_proba(new_application_processed_scaled)[:, 1][0]
-    
-    loan_status_prediction = lgbm_loan_status_model.predict(new_application_processed_scaled)[0]
-    loan_status_prediction_proba = lgbm_loan_status_model.predict_proba(new_application_processed_scaled)
-
-    return fraud_prediction, fraud_prediction_proba, loan_status_prediction, loan_status_prediction_proba
-
-# Train models when script is run directly
-if __name__ == "__main__":
-    train_models()
-    print("Training completed successfully!")
-
+# Fraud Detection and Risk Assessment Model
+# This script contains steps for data preprocessing, feature engineering, and model building for fraud detection and loan risk assessment.
+# It is the scoring import path and only needs pandas and NumPy to import: training lives in
+# model_training (scikit-learn, imblearn, LightGBM), imported on first use, and unpickling a model
+# bundle brings in whatever its fitted components need.
+
+import warnings
+warnings.simplefilter('ignore')
+
+import pandas as pd
+import numpy as np
+from itertools import islice
+import math
+import pickle
+import os
+import threading
+import time
+
+from feature_store import TransactionFeatureStore
+from model_registry import ModelRegistry, ModelSet, ModelWatcher
+from portable_model import PortableScorer, TreeEnsemble
+from transaction_features import transaction_feature_columns
+
+# Active fitted models (outlier clipper, preprocessor, both LightGBM models, feature columns).
+# Scoring functions read registry.active once per call, so a concurrent load_model_bundle() or
+# retraining swaps the whole set without a request ever mixing two versions.
+registry = ModelRegistry()
+
+# Read-only module attributes kept for existing callers, resolved against the active ModelSet
+_MODEL_SET_ATTRIBUTES = {
+    'outlier_clipper': 'outlier_clipper',
+    'preprocessor': 'preprocessor',
+    'lgbm_model': 'fraud_model',
+    'lgbm_loan_status_model': 'loan_status_model',
+    'X_columns': 'X_columns',
+}
+
+# Online store that supplies the transaction window features at scoring time, by customer_id (an
+# application without one has no transaction history). Models trained on them need it;
+# ensure_models_loaded builds it from TRANSACTIONS_CSV when such models are loaded and none has been set.
+transaction_feature_store = None
+_transaction_feature_store_lock = threading.Lock()
+TRANSACTIONS_CSV = 'transactions.csv'
+TRANSACTION_FEATURE_COLUMNS = frozenset(transaction_feature_columns())
+
+# Score single applications with the CompiledScorer when the pipeline allows (False forces the DataFrame path)
+USE_COMPILED_SCORER = True
+
+# Persisted model artifact bundle
+MODEL_DIR = 'models'
+MODEL_BUNDLE_PATH = os.path.join(MODEL_DIR, 'loan_sherlock_bundle.pkl')
+BUNDLE_FORMAT_VERSION = 2
+
+# NumPy-only scoring artifact written by export_portable_model (see portable_model)
+PORTABLE_MODEL_PATH = os.path.join(MODEL_DIR, 'loan_sherlock_portable.npz')
+
+# Rows scored per preprocessor/model call in predict_batch
+BATCH_CHUNK_SIZE = 100_000
+
+# Fraud probability at or above which an application is flagged; None uses the argmax class
+FRAUD_DECISION_THRESHOLD = None
+
+# Largest difference from the fraud probabilities recorded at training time that validate_model_set accepts
+VALIDATION_TOLERANCE = 1e-6
+
+def __getattr__(name):
+    if name in _MODEL_SET_ATTRIBUTES:
+        models = registry.active
+        return getattr(models, _MODEL_SET_ATTRIBUTES[name]) if models is not None else None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def save_model_bundle(path=MODEL_BUNDLE_PATH, data_fingerprint=None, imbalance_strategy=None, training_timings=None,
+                      models=None, **metadata):
+    """Write a fitted model set (default: the active one) and metadata as one versioned bundle.
+
+    Extra keyword arguments are stored as further metadata, e.g. validation
+    ({'applications': [...], 'fraud_probability': [...]}), the batch validate_model_set checks
+    the bundle against before it is hot-swapped in.
+    """
+    models = models or registry.active
+    bundle = {
+        'format_version': BUNDLE_FORMAT_VERSION,
+        'created_at': time.time(),
+        'data_fingerprint': data_fingerprint,
+        'imbalance_strategy': imbalance_strategy,
+        'training_timings': training_timings,
+        **metadata,
+        'outlier_clipper': models.outlier_clipper,
+        'preprocessor': models.preprocessor,
+        'fraud_model': models.fraud_model,
+        'loan_status_model': models.loan_status_model,
+        'X_columns': models.X_columns,
+        'fraud_classes': models.fraud_model.classes_.tolist(),
+        'loan_status_classes': models.loan_status_model.classes_.tolist(),
+    }
+
+    # Write to a temporary file first so readers never see a partial bundle
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return bundle
+
+def read_model_bundle(path=MODEL_BUNDLE_PATH):
+    """Read a persisted model bundle as a ModelSet without activating it"""
+    with open(path, 'rb') as f:
+        bundle = pickle.load(f)
+    if bundle.get('format_version') != BUNDLE_FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported model bundle version {bundle.get('format_version')!r} in {path}, "
+            f"expected {BUNDLE_FORMAT_VERSION}. Retrain with train_models()."
+        )
+
+    components = ('outlier_clipper', 'preprocessor', 'fraud_model', 'loan_status_model', 'X_columns')
+    metadata = {key: value for key, value in bundle.items() if key not in components}
+    return ModelSet(*(bundle[key] for key in components), metadata=metadata, path=path)
+
+def load_model_bundle(path=MODEL_BUNDLE_PATH):
+    """Load a persisted model bundle and atomically make it the active model set (in-flight calls finish on the old one)"""
+    models = read_model_bundle(path)
+    registry.activate(models)
+    return models
+
+def validate_model_set(models, applications=None, tolerance=VALIDATION_TOLERANCE):
+    """Warm up a candidate model set and check it on a validation batch before it goes live.
+
+    Scores `applications` (default: the validation batch saved in its bundle) and raises
+    ValueError if the scores are not probabilities, if the class labels differ from the active
+    set's, or if the saved batch does not reproduce the fraud probabilities recorded at training
+    (computed there with the offline transaction window features, so this also checks the
+    feature store against them).
+    """
+    if uses_transaction_features(models):
+        ensure_transaction_feature_store()
+    get_compiled_scorer(models)  # built now rather than by the first request after the swap
+    validation = models.metadata.get('validation') or {}
+    expected = None
+    if applications is None:
+        applications = validation.get('applications')
+        expected = validation.get('fraud_probability')
+    if not applications:
+        return
+
+    _, fraud_positive, _, loan_status_proba = _score_records(list(applications), models)
+    if not (np.isfinite(fraud_positive).all() and ((fraud_positive >= 0) & (fraud_positive <= 1)).all()):
+        raise ValueError("Fraud probabilities outside [0, 1] on the validation batch")
+    if not np.allclose(loan_status_proba.sum(axis=1), 1, atol=1e-4):
+        raise ValueError("Loan status probabilities do not sum to 1 on the validation batch")
+    active = registry.active
+    if active is not None and active is not models:
+        for name in ('fraud_model', 'loan_status_model'):
+            if list(getattr(active, name).classes_) != list(getattr(models, name).classes_):
+                raise ValueError(f"{name} classes {list(getattr(models, name).classes_)} differ from the active "
+                                 f"model's {list(getattr(active, name).classes_)}")
+    if expected is not None and not np.allclose(fraud_positive, expected, rtol=0, atol=tolerance):
+        drift = np.abs(fraud_positive - np.asarray(expected)).max()
+        raise ValueError(f"Validation batch fraud probabilities differ from training by up to {drift:.2e}")
+
+def watch_model_directory(directory=MODEL_DIR, interval=5.0, validation_applications=None):
+    """Hot-reload new bundles (*.pkl) saved in `directory`: returns the started model_registry.ModelWatcher.
+
+    Each new bundle is loaded, warmed up and validated (validate_model_set) in the background and
+    only then swapped in; call stop() on the watcher to end it.
+    """
+    return ModelWatcher(
+        registry, directory, read_model_bundle, lambda models: validate_model_set(models, validation_applications),
+        pattern='*.pkl', interval=interval
+    ).start()
+
+def _initial_models(path):
+    if os.path.exists(path):
+        return read_model_bundle(path)
+    train_models(bundle_path=path)
+    return registry.active
+
+def ensure_models_loaded(path=MODEL_BUNDLE_PATH):
+    """Active model set, loading the persisted bundle if needed and training only when none exists.
+
+    Concurrent first callers (e.g. several Streamlit sessions) wait for a single load or training run.
+    Also builds the transaction feature store if the models need one and none is set.
+    """
+    models = registry.get_or_init(lambda: _initial_models(path))
+    if transaction_feature_store is None and uses_transaction_features(models):
+        ensure_transaction_feature_store()
+    return models
+
+def train_models(bundle_path=MODEL_BUNDLE_PATH, **kwargs):
+    """Train the fraud detection and loan risk assessment models (see model_training.train_models)"""
+    import model_training
+    return model_training.train_models(bundle_path=bundle_path, **kwargs)
+
+def engineer_application_features(applications_df):
+    """Add the date and income-ratio features to an applications DataFrame (column-wise, in place)"""
+    application_date = pd.to_datetime(applications_df['application_date'])
+    applications_df['application_year'] = application_date.dt.year
+    applications_df['application_month'] = application_date.dt.month
+    applications_df['application_day_of_week'] = application_date.dt.dayofweek
+
+    # Calculate ratios
+    epsilon = 1e-6
+    if 'existing_emis_monthly' in applications_df.columns and 'monthly_income' in applications_df.columns:
+        applications_df['existing_emi_to_income_ratio'] = (applications_df['existing_emis_monthly'] / (applications_df['monthly_income'] + epsilon)) * 100
+    else:
+        applications_df['existing_emi_to_income_ratio'] = 0
+
+    if 'loan_amount_requested' in applications_df.columns and 'monthly_income' in applications_df.columns:
+        applications_df['loan_amount_to_income_ratio'] = (applications_df['loan_amount_requested'] / (applications_df['monthly_income'] + epsilon)) * 100
+    else:
+        applications_df['loan_amount_to_income_ratio'] = 0
+    return applications_df
+
+def set_transaction_feature_store(store):
+    """Use a feature_store.TransactionFeatureStore for the transaction window features when scoring"""
+    global transaction_feature_store
+    transaction_feature_store = store
+
+def ensure_transaction_feature_store(path=TRANSACTIONS_CSV):
+    """The transaction feature store, built from `path` on first use if none is set.
+
+    Keeps every transaction, so applications of any date (e.g. a bundle's validation batch) get
+    their exact window features.
+    """
+    global transaction_feature_store
+    with _transaction_feature_store_lock:
+        if transaction_feature_store is None:
+            transaction_feature_store = TransactionFeatureStore.from_csv(path, retention_days=math.inf)
+        return transaction_feature_store
+
+def uses_transaction_features(models):
+    """Whether a model set was trained on the transaction window features"""
+    return not TRANSACTION_FEATURE_COLUMNS.isdisjoint(models.X_columns)
+
+def get_compiled_scorer(models=None):
+    """CompiledScorer for a model set (default: the active one), built once per set and feature store.
+
+    None if the pipeline cannot be compiled or USE_COMPILED_SCORER is off.
+    """
+    models = models or ensure_models_loaded()
+    if not USE_COMPILED_SCORER:
+        return None
+    store = transaction_feature_store
+
+    def build():
+        from compiled_scorer import CompiledScorer
+        try:
+            return CompiledScorer(
+                models.outlier_clipper, models.preprocessor, models.fraud_model, models.loan_status_model,
+                models.X_columns, _default_feature_value, store
+            )
+        except (TypeError, ValueError):
+            return False
+
+    return models.cached(('compiled_scorer', store), build) or None
+
+def export_portable_model(path=PORTABLE_MODEL_PATH):
+    """Write the active models as a portable_model artifact that scores without sklearn, imblearn or LightGBM"""
+    models = ensure_models_loaded()
+    scorer = get_compiled_scorer(models)
+    if scorer is None:
+        raise ValueError("The fitted preprocessing pipeline cannot be exported")
+    portable = PortableScorer(
+        scorer.featurizer,
+        TreeEnsemble.from_booster(models.fraud_model.booster_),
+        TreeEnsemble.from_booster(models.loan_status_model.booster_),
+        models.fraud_model.classes_, models.loan_status_model.classes_,
+        metadata={'exported_at': time.time(), 'bundle_format_version': BUNDLE_FORMAT_VERSION}
+    )
+    portable.save(path)
+    return portable
+
+def _prepare_scoring_frame(applications_df, models=None):
+    """Clip and engineer the scoring features, looking up transaction windows by customer_id if the models use them.
+
+    An application without a customer_id is scored as a customer with no transaction history.
+    """
+    models = models or registry.active
+    if models.outlier_clipper is not None:
+        models.outlier_clipper.transform(applications_df)
+    engineer_application_features(applications_df)
+    if uses_transaction_features(models):
+        if transaction_feature_store is None:
+            raise RuntimeError("The models use transaction window features but no transaction feature store is set "
+                               "(see ensure_transaction_feature_store)")
+        customer_ids = applications_df['customer_id'] if 'customer_id' in applications_df.columns \
+            else [None] * len(applications_df)
+        window_features_df = transaction_feature_store.features_frame(
+            customer_ids, applications_df['application_date']
+        )
+        for col in window_features_df.columns:
+            applications_df[col] = window_features_df[col].to_numpy()
+    return applications_df
+
+def _default_feature_value(col):
+    """Default used for a model feature that is missing from the scoring input"""
+    if col.startswith('total_transaction_amount_') or col.startswith('average_transaction_amount_'):
+        return 0.0
+    return 0
+
+def _build_model_input(applications_df, X_columns):
+    """Select the training feature columns in order, filling missing ones with defaults"""
+    model_input = applications_df.reindex(columns=X_columns)
+    for col in X_columns:
+        if col not in applications_df.columns:
+            model_input[col] = _default_feature_value(col)
+    return model_input
+
+def _transform_model_input(features_df, models=None):
+    """Preprocess engineered features into the float32 CSR matrix the models were trained on"""
+    models = models or registry.active
+    return models.preprocessor.transform(_build_model_input(features_df, models.X_columns)).astype(np.float32)
+
+def _labels_from_proba(classes, proba, threshold=None):
+    """Derive class labels from predicted probabilities (argmax, or a positive-class threshold for binary models)"""
+    if threshold is not None and len(classes) == 2:
+        return classes[(proba[:, 1] >= threshold).astype(int)]
+    return classes[proba.argmax(axis=1)]
+
+def predict_loan_risk_and_fraud(new_application_data, fraud_threshold=FRAUD_DECISION_THRESHOLD):
+    """Predict fraud risk and loan status for new application data"""
+    # Active model set (loading the persisted bundle, or training only if none has been saved yet)
+    models = ensure_models_loaded()
+
+    # Fast path: flat feature vector and direct booster calls
+    scorer = get_compiled_scorer(models)
+    if scorer is not None:
+        return scorer.predict(new_application_data, fraud_threshold)
+    
+    # Convert input data to DataFrame and engineer features
+    new_application_df = _prepare_scoring_frame(pd.DataFrame([new_application_data]), models)
+    new_application_processed_scaled = _transform_model_input(new_application_df, models)
+
+    # Make predictions (one probability pass per model, labels derived from it)
+    fraud_proba = models.fraud_model.predict_proba(new_application_processed_scaled)
+    fraud_prediction = _labels_from_proba(models.fraud_model.classes_, fraud_proba, fraud_threshold)[0]
+    fraud_prediction_proba = fraud_proba[:, 1][0]
+
+    loan_status_prediction_proba = models.loan_status_model.predict_proba(new_application_processed_scaled)
+    loan_status_prediction = _labels_from_proba(models.loan_status_model.classes_, loan_status_prediction_proba)[0]
+
+    return fraud_prediction, fraud_prediction_proba, loan_status_prediction, loan_status_prediction_proba
+
+def predict_applications(applications, fraud_threshold=FRAUD_DECISION_THRESHOLD):
+    """predict_loan_risk_and_fraud for a list of application dicts, scored as one matrix.
+
+    Returns one (fraud label, fraud probability, loan status label, loan status probabilities)
+    tuple per application; micro_batcher.MicroBatcher uses this to serve concurrent callers.
+    """
+    models = ensure_models_loaded()
+    applications = list(applications)
+    if not applications:
+        return []
+
+    fraud_prediction, fraud_positive, loan_status_prediction, loan_status_proba = _score_records(
+        applications, models, fraud_threshold
+    )
+    return [
+        (fraud_prediction[i], fraud_positive[i], loan_status_prediction[i], loan_status_proba[i:i + 1])
+        for i in range(len(applications))
+    ]
+
+def _score_records(applications, models, fraud_threshold=FRAUD_DECISION_THRESHOLD):
+    """Score a non-empty list of application dicts with one model set: four per-application arrays"""
+    scorer = get_compiled_scorer(models)
+    if scorer is not None:
+        fraud_prediction, fraud_positive, loan_status_prediction, loan_status_proba = scorer.predict_records(
+            applications, fraud_threshold
+        )
+    else:
+        model_input = _transform_model_input(_prepare_scoring_frame(pd.DataFrame(applications), models), models)
+        fraud_proba = models.fraud_model.predict_proba(model_input)
+        fraud_prediction = _labels_from_proba(models.fraud_model.classes_, fraud_proba, fraud_threshold)
+        fraud_positive = fraud_proba[:, 1]
+        loan_status_proba = models.loan_status_model.predict_proba(model_input)
+        loan_status_prediction = _labels_from_proba(models.loan_status_model.classes_, loan_status_proba)
+    return fraud_prediction, fraud_positive, loan_status_prediction, loan_status_proba
+
+def _iter_application_chunks(applications, chunk_size):
+    """Yield DataFrame chunks from a DataFrame or an iterable of application dicts"""
+    if isinstance(applications, pd.DataFrame):
+        for start in range(0, len(applications), chunk_size):
+            yield applications.iloc[start:start + chunk_size]
+        return
+
+    iterator = iter(applications)
+    offset = 0
+    while True:
+        records = list(islice(iterator, chunk_size))
+        if not records:
+            return
+        yield pd.DataFrame.from_records(records, index=pd.RangeIndex(offset, offset + len(records)))
+        offset += len(records)
+
+def _score_chunk(chunk, models, fraud_threshold=FRAUD_DECISION_THRESHOLD):
+    """Score one chunk with a single transform and one probability call per model"""
+    features_df = _prepare_scoring_frame(chunk.copy(deep=False), models)
+    model_input = _transform_model_input(features_df, models)
+
+    fraud_proba = models.fraud_model.predict_proba(model_input)
+    loan_status_proba = models.loan_status_model.predict_proba(model_input)
+
+    result = {
+        'fraud_flag': _labels_from_proba(models.fraud_model.classes_, fraud_proba, fraud_threshold),
+        'fraud_probability': fraud_proba[:, 1],
+        'loan_status': _labels_from_proba(models.loan_status_model.classes_, loan_status_proba),
+    }
+    for i, label in enumerate(models.loan_status_model.classes_):
+        result[f'loan_status_proba_{label}'] = loan_status_proba[:, i]
+    return pd.DataFrame(result, index=chunk.index)
+
+def predict_batch(applications, chunk_size=BATCH_CHUNK_SIZE, fraud_threshold=FRAUD_DECISION_THRESHOLD):
+    """Score a portfolio of applications (DataFrame or iterable of dicts) and return a columnar result"""
+    # One model set for the whole portfolio, even if a new version is activated meanwhile
+    models = ensure_models_loaded()
+
+    results = [
+        _score_chunk(chunk, models, fraud_threshold) for chunk in _iter_application_chunks(applications, chunk_size)
+    ]
+    if not results:
+        columns = ['fraud_flag', 'fraud_probability', 'loan_status']
+        columns += [f'loan_status_proba_{label}' for label in models.loan_status_model.classes_]
+        return pd.DataFrame(columns=columns)
+    return pd.concat(results) if len(results) > 1 else results[0]
+
+# Train models when script is run directly
+if __name__ == "__main__":
+    import model_training
+    model_training.main()
+
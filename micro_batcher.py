@@ -0,0 +1,117 @@
+# Micro-batching scheduler
+# Many callers scoring one application each is dominated by per-call overhead. MicroBatcher sits in
+# front of a function that scores a list of items in one vectorised call: submit() queues an item
+# and returns a concurrent.futures.Future, and a background thread collects items until it has
+# max_batch_size of them or max_wait_ms have passed since the first one, scores them together and
+# resolves each caller's future with its own result.
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+_STOP = object()
+
+class MicroBatcher:
+    """Collect single-item requests into batches for `batch_fn` (list of items -> list of results).
+
+    If a batch raises, its items are retried one at a time so a single bad item only fails its own
+    caller. Futures are safe to wait on from any thread (or with asyncio.wrap_future).
+    """
+
+    def __init__(self, batch_fn, max_batch_size=256, max_wait_ms=2.0, name='micro-batcher'):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.batches = 0
+        self.items = 0
+        self._queue = queue.Queue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, item):
+        """Queue one item; the returned Future resolves to its result"""
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("MicroBatcher is closed")
+            self._queue.put((item, future))
+        return future
+
+    def __call__(self, item, timeout=None):
+        """Score one item through the batcher and wait for its result"""
+        return self.submit(item).result(timeout)
+
+    def close(self, timeout=None):
+        """Score everything already queued, then stop the batching thread"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _collect(self):
+        """Block for the first request, then gather more until the batch is full or the wait is over"""
+        first = self._queue.get()
+        if first is _STOP:
+            return None, True
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                request = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is _STOP:
+                return batch, True
+            batch.append(request)
+        return batch, False
+
+    def _run(self):
+        stop = False
+        while not stop:
+            batch, stop = self._collect()
+            if batch:
+                self._score(batch)
+
+    def _score(self, batch):
+        batch = [(item, future) for item, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        self.batches += 1
+        self.items += len(batch)
+        try:
+            results = self.batch_fn([item for item, _ in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0][1].set_exception(e)
+                return
+            results = None
+        if results is not None:
+            results = list(results)
+            if len(results) != len(batch):
+                # No way to tell which result belongs to which caller: fail them all rather than leave any waiting
+                error = RuntimeError(f"batch_fn returned {len(results)} results for a batch of {len(batch)} items")
+                for _, future in batch:
+                    future.set_exception(error)
+                return
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+            return
+
+        # Isolate the failing item(s): score the batch one item at a time
+        for item, future in batch:
+            try:
+                future.set_result(self.batch_fn([item])[0])
+            except Exception as e:
+                future.set_exception(e)
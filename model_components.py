@@ -0,0 +1,254 @@
+# Pipeline components
+# Stateful transformers that train_models fits and stores in the model bundle, so scoring applies
+# exactly the transformations the models were trained with, and the training-only resamplers.
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from sklearn.base import BaseEstimator, TransformerMixin
+
+from portable_model import hashed_address_columns, parse_address  # noqa: F401  (parse_address re-exported)
+
+# Hashed columns produced for residential_address
+ADDRESS_HASH_FEATURES = 64
+
+# Columns never clipped: targets and identifiers
+OUTLIER_CLIPPER_EXCLUDED_COLUMNS = ('fraud_flag',)
+
+# Binomial standard errors by which the share of rows beyond a clipping bound must exceed the
+# bound's tail before OutlierClipper.widen moves it (sampling noise alone almost never does)
+WIDEN_STANDARD_ERRORS = 3
+
+class OutlierClipper:
+    """Clip numeric columns to per-column quantile bounds learned at training time.
+
+    fit computes every bound from one DataFrame.quantile([lower, upper]) pass. For data larger than
+    memory, call partial_fit once per chunk instead: it keeps a uniform random sample of at most
+    `sample_size` rows (bottom-k random keys, so chunks merge exactly) and estimates the bounds
+    from it. Either way the sample of the rows seen is kept, and saved (cut to the
+    `retained_sample_size` lowest keys) with the clipper, for widen to add later rows to.
+    """
+
+    def __init__(self, lower_quantile=0.01, upper_quantile=0.99, exclude=OUTLIER_CLIPPER_EXCLUDED_COLUMNS,
+                 sample_size=200_000, retained_sample_size=20_000, random_state=42):
+        self.lower_quantile = lower_quantile
+        self.upper_quantile = upper_quantile
+        self.exclude = tuple(exclude)
+        self.sample_size = sample_size
+        self.retained_sample_size = retained_sample_size
+        self.random_state = random_state
+        self.columns_ = None
+        self.lower_ = None
+        self.upper_ = None
+        self._sample = None
+        self._sample_keys = None
+        self._rng = None
+
+    def _numeric_columns(self, df):
+        return [col for col in df.select_dtypes(include=np.number).columns if col not in self.exclude]
+
+    def _set_bounds(self, df):
+        bounds = df[self.columns_].quantile([self.lower_quantile, self.upper_quantile])
+        self.lower_ = bounds.iloc[0]
+        self.upper_ = bounds.iloc[1]
+
+    def _add_to_sample(self, df):
+        """Merge df's rows into the sample, keeping the sample_size rows with the lowest random keys"""
+        if self._rng is None:
+            self._rng = np.random.default_rng(self.random_state)
+        chunk = df[self.columns_].reset_index(drop=True)
+        keys = self._rng.random(len(chunk))
+        if self._sample is not None:
+            chunk = pd.concat([self._sample, chunk], ignore_index=True)
+            keys = np.concatenate([self._sample_keys, keys])
+        if len(chunk) > self.sample_size:
+            keep = np.argpartition(keys, self.sample_size - 1)[:self.sample_size]
+            chunk = chunk.iloc[keep].reset_index(drop=True)
+            keys = keys[keep]
+        self._sample, self._sample_keys = chunk, keys
+
+    def fit(self, df):
+        """Learn the bounds of every numeric column of df in one quantile pass"""
+        self.columns_ = self._numeric_columns(df)
+        self._sample = self._sample_keys = self._rng = None
+        self._add_to_sample(df)
+        self._set_bounds(df)
+        return self
+
+    def partial_fit(self, df):
+        """Update the sampled bounds with one more chunk of rows"""
+        if self.columns_ is None:
+            self.columns_ = self._numeric_columns(df)
+        self._add_to_sample(df)
+        self._set_bounds(self._sample)
+        return self
+
+    def transform(self, df):
+        """Clip the learned columns present in df (in place) and return it"""
+        for col in self.columns_:
+            if col in df.columns:
+                df[col] = df[col].clip(lower=self.lower_[col], upper=self.upper_[col])
+        return df
+
+    def fit_transform(self, df):
+        return self.fit(df).transform(df)
+
+    def widen(self, df):
+        """Add df's rows to the sample and extend the bounds they no longer fit, never narrowing them.
+
+        A bound moves out to the sample's quantile only when the share of sampled rows beyond it
+        exceeds its tail (lower_quantile, 1 - upper_quantile) by more than WIDEN_STANDARD_ERRORS
+        binomial standard errors, so refreshes with rows from the training distribution leave it in
+        place. Returns the widened columns.
+
+        Used when trees are added to already fitted models: values beyond an old bound fall on the
+        same side of every existing split as the bound itself, so the old trees score as before.
+        """
+        self._add_to_sample(df)
+        sample = self._sample
+        rows = sample.count().clip(lower=1)
+        bounds = sample.quantile([self.lower_quantile, self.upper_quantile])
+
+        def exceeded(beyond, tail):
+            return (beyond.sum() / rows) > tail + WIDEN_STANDARD_ERRORS * np.sqrt(tail * (1 - tail) / rows)
+
+        lower = self.lower_.where(~exceeded(sample < self.lower_, self.lower_quantile),
+                                  np.minimum(self.lower_, bounds.iloc[0]))
+        upper = self.upper_.where(~exceeded(sample > self.upper_, 1 - self.upper_quantile),
+                                  np.maximum(self.upper_, bounds.iloc[1]))
+        widened = [col for col in self.columns_ if lower[col] < self.lower_[col] or upper[col] > self.upper_[col]]
+        self.lower_, self.upper_ = lower, upper
+        return widened
+
+    def __getstate__(self):
+        # Keep the lowest-keyed rows of the sample (still a uniform sample) so bundles stay small
+        state = self.__dict__.copy()
+        if state['_sample'] is not None and len(state['_sample']) > self.retained_sample_size:
+            keep = np.argpartition(state['_sample_keys'], self.retained_sample_size - 1)[:self.retained_sample_size]
+            state['_sample'] = state['_sample'].iloc[keep].reset_index(drop=True)
+            state['_sample_keys'] = state['_sample_keys'][keep]
+        return state
+
+    def __setstate__(self, state):
+        state.setdefault('retained_sample_size', 20_000)  # saved before the sample was kept
+        self.__dict__.update(state)
+
+class ApproximateSMOTE:
+    """SMOTE with approximate nearest neighbours, for training sets too large for exact k-NN.
+
+    Like imblearn's default, every class except the majority is oversampled to the majority count.
+    Each synthetic row interpolates between a random class member and one of its k nearest
+    neighbours, searched in chunks of `chunk_size` rows in a random projection to `n_components`
+    dimensions, among at most `max_candidates` randomly chosen members of the class. Dense arrays
+    and scipy sparse matrices are both supported.
+    """
+
+    def __init__(self, k_neighbors=5, n_components=16, max_candidates=4096, chunk_size=1024, random_state=42):
+        self.k_neighbors = k_neighbors
+        self.n_components = n_components
+        self.max_candidates = max_candidates
+        self.chunk_size = chunk_size
+        self.random_state = random_state
+
+    def _neighbours(self, projected, seeds, rng):
+        """Index (within the class) of one random approximate k-nearest neighbour per seed row"""
+        n_members = len(projected)
+        candidates = rng.choice(n_members, min(n_members, self.max_candidates), replace=False)
+        k = min(self.k_neighbors, len(candidates) - 1)
+        candidate_points = projected[candidates]
+        candidate_norms = (candidate_points ** 2).sum(axis=1)
+
+        neighbours = np.empty(len(seeds), dtype=np.int64)
+        for start in range(0, len(seeds), self.chunk_size):
+            seed_chunk = seeds[start:start + self.chunk_size]
+            # Squared distances up to a per-row constant, which does not change the ranking
+            distances = candidate_norms[None, :] - 2 * projected[seed_chunk] @ candidate_points.T
+            distances[candidates[None, :] == seed_chunk[:, None]] = np.inf
+            nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+            picked = nearest[np.arange(len(seed_chunk)), rng.integers(0, k, len(seed_chunk))]
+            neighbours[start:start + len(seed_chunk)] = candidates[picked]
+        return neighbours
+
+    def fit_resample(self, X, y):
+        """Return X and y with synthetic minority rows appended (same order convention as imblearn)"""
+        rng = np.random.default_rng(self.random_state)
+        y = np.asarray(y)
+        is_sparse = sp.issparse(X)
+        X = X.tocsr() if is_sparse else np.asarray(X)
+        classes, counts = np.unique(y, return_counts=True)
+        target = counts.max()
+        projection = rng.standard_normal((X.shape[1], self.n_components)) / np.sqrt(self.n_components)
+
+        X_blocks, y_blocks = [X], [y]
+        for label, count in zip(classes, counts):
+            n_new = target - count
+            if n_new == 0 or count < 2:
+                continue
+            X_class = X[np.flatnonzero(y == label)]
+            projected = np.asarray(X_class @ projection)
+            seeds = rng.integers(0, count, n_new)
+            neighbours = self._neighbours(projected, seeds, rng)
+
+            gaps = rng.random(n_new).astype(X.dtype)
+            base = X_class[seeds]
+            if is_sparse:
+                synthetic = base + sp.diags(gaps) @ (X_class[neighbours] - base)
+            else:
+                synthetic = base + gaps[:, None] * (X_class[neighbours] - base)
+            X_blocks.append(synthetic)
+            y_blocks.append(np.full(n_new, label, dtype=y.dtype))
+
+        X_resampled = sp.vstack(X_blocks, format='csr') if is_sparse else np.vstack(X_blocks)
+        return X_resampled, np.concatenate(y_blocks)
+
+class BoosterClassifier:
+    """A LightGBM Booster with the classifier interface scoring uses (classes_, booster_, predict_proba, predict).
+
+    Incremental training continues boosters with lightgbm.train rather than LGBMClassifier.fit, so
+    the labels stay encoded against the original classes even when the new rows miss one of them.
+    """
+
+    def __init__(self, booster, classes):
+        self.booster_ = booster
+        self.classes_ = np.asarray(classes)
+        self.n_classes_ = len(self.classes_)
+        self.n_features_in_ = booster.num_feature()
+
+    def predict_proba(self, X):
+        proba = self.booster_.predict(X)
+        return np.column_stack([1 - proba, proba]) if proba.ndim == 1 else proba
+
+    def predict(self, X):
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
+
+class AddressHashingEncoder(BaseEstimator, TransformerMixin):
+    """Encode residential addresses as hashed state and city indicators in a fixed number of columns.
+
+    Each parsed field sets one of `n_features` columns chosen by a stable CRC32 hash, so the
+    encoded width, model size and transform cost do not depend on how many distinct addresses
+    (or unseen ones at scoring time) there are. Stateless: fit only records the input width.
+    """
+
+    def __init__(self, n_features=ADDRESS_HASH_FEATURES):
+        self.n_features = n_features
+
+    def fit(self, X, y=None):
+        self.n_features_in_ = 1
+        return self
+
+    def hashed_columns(self, address):
+        """Hashed column of each parsed field of one address"""
+        return hashed_address_columns(address, self.n_features)
+
+    def transform(self, X):
+        addresses = X.iloc[:, 0].to_numpy() if isinstance(X, pd.DataFrame) else np.asarray(X).reshape(len(X), -1)[:, 0]
+        rows, columns = [], []
+        for row, address in enumerate(addresses):
+            for column in self.hashed_columns(address):
+                rows.append(row)
+                columns.append(column)
+        values = np.ones(len(rows), dtype=np.float32)
+        return sp.csr_matrix((values, (rows, columns)), shape=(len(addresses), self.n_features))
+
+    def get_feature_names_out(self, input_features=None):
+        return np.array([f'address_hash_{i}' for i in range(self.n_features)], dtype=object)
@@ -0,0 +1,164 @@
+# Model registry
+# Holds the active fitted model version behind one reference that is swapped atomically, so every
+# scoring call works on one consistent set of components even while another version is being
+# loaded, and runs first-time initialisation (loading or training) once however many threads
+# ask for the models at the same time. ModelWatcher hot-swaps in new versions saved to a model
+# directory.
+
+import gc
+import glob
+import os
+import threading
+
+class ModelSet:
+    """One fitted model version: the outlier clipper, preprocessor, both models and the feature columns.
+
+    Treated as read-only once built; a new version is a new ModelSet. Objects derived from a
+    version (e.g. its compiled scorer) are cached on it with cached().
+    """
+
+    def __init__(self, outlier_clipper, preprocessor, fraud_model, loan_status_model, X_columns, metadata=None,
+                 path=None):
+        self.outlier_clipper = outlier_clipper
+        self.preprocessor = preprocessor
+        self.fraud_model = fraud_model
+        self.loan_status_model = loan_status_model
+        self.X_columns = X_columns
+        self.metadata = metadata or {}
+        self.path = path
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+
+    def cached(self, key, build):
+        """Value derived from this version, built once (under a lock) on first request"""
+        with self._cache_lock:
+            if key not in self._cache:
+                self._cache[key] = build()
+            return self._cache[key]
+
+class ModelRegistry:
+    """The active ModelSet, with atomic hot-swap and single-flight initialisation"""
+
+    def __init__(self):
+        self._active = None
+        self._swap_lock = threading.Lock()
+        self._init_lock = threading.Lock()
+        self.version = 0
+
+    @property
+    def active(self):
+        """The active ModelSet (None before initialisation); read it once per request"""
+        return self._active
+
+    def activate(self, models):
+        """Make `models` the active set and return the previous one (callers holding it keep using it)"""
+        with self._swap_lock:
+            previous, self._active = self._active, models
+            self.version += 1
+        return previous
+
+    def get_or_init(self, initialize):
+        """Active set, calling initialize() for it if there is none; concurrent callers wait for one call"""
+        models = self._active
+        if models is not None:
+            return models
+        with self._init_lock:
+            if self._active is None:
+                models = initialize()
+                if self._active is not models:
+                    self.activate(models)
+            return self._active
+
+    def clear(self):
+        """Forget the active set (the next get_or_init initialises again)"""
+        return self.activate(None)
+
+def freeze_for_fork():
+    """Call after loading the models, just before forking worker processes.
+
+    Moves every object allocated so far, the models included, to the permanent GC generation, so
+    collections in the workers never write to their pages and the workers keep sharing them
+    copy-on-write with the parent. The boosters' native memory is only read when scoring and
+    stays shared anyway.
+    """
+    gc.collect()
+    gc.freeze()
+
+class ModelWatcher:
+    """Hot-reload new model versions from a directory into a ModelRegistry, without a restart.
+
+    A background thread polls `directory` every `interval` seconds for the newest file matching
+    `pattern`. When a file appears or changes, load(path) builds a candidate ModelSet and
+    prepare(candidate) warms it up and validates it (raising to reject it), both off the request
+    path; only then is the candidate activated, so requests never wait for a load and in-flight
+    requests finish on the version they started with. A rejected or unreadable file is recorded
+    in last_error and retried only once it changes again.
+    """
+
+    def __init__(self, registry, directory, load, prepare=None, pattern='*.pkl', interval=5.0,
+                 name='model-watcher'):
+        self.registry = registry
+        self.directory = directory
+        self.load = load
+        self.prepare = prepare
+        self.pattern = pattern
+        self.interval = interval
+        self.reloads = 0
+        self.last_error = None
+        self._seen = None
+        active = registry.active
+        if active is not None and active.path:
+            self._seen = self._signature(active.path)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    @staticmethod
+    def _signature(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+    def latest(self):
+        """(path, mtime_ns, size) of the newest matching file in the directory, or None"""
+        signatures = [self._signature(path) for path in glob.glob(os.path.join(self.directory, self.pattern))]
+        signatures = [signature for signature in signatures if signature is not None]
+        return max(signatures, key=lambda signature: (signature[1], signature[0])) if signatures else None
+
+    def check(self):
+        """Poll once: load, prepare and activate a new file if there is one; True if a new version went live"""
+        signature = self.latest()
+        if signature is None or signature == self._seen:
+            return False
+        self._seen = signature
+        try:
+            candidate = self.load(signature[0])
+            if self.prepare is not None:
+                self.prepare(candidate)
+        except Exception as e:
+            self.last_error = f"{signature[0]}: {type(e).__name__}: {e}"
+            return False
+        self.registry.activate(candidate)
+        self.reloads += 1
+        self.last_error = None
+        return True
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
@@ -0,0 +1,622 @@
+# Model training
+# Builds the training matrix, fits the fraud detection and loan risk assessment models and saves
+# them as the model bundle that loan_python_file scores with. Kept apart from loan_python_file so
+# scoring processes (and the Streamlit app) never import scikit-learn's training stack, imblearn
+# or the data loading code; loan_python_file.train_models imports this module on first use.
+
+import argparse
+import copy
+import hashlib
+import json
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import lightgbm as lgb
+import numpy as np
+import pandas as pd
+from imblearn.over_sampling import SMOTE
+from imblearn.under_sampling import RandomUnderSampler
+from lightgbm import LGBMClassifier
+from sklearn.base import clone
+from sklearn.compose import ColumnTransformer
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+from sklearn.utils.class_weight import compute_sample_weight
+
+import loan_python_file as model
+from data_loader import (LOAN_APPLICATIONS_CSV, iter_loan_application_chunks, iter_transaction_chunks,
+                         load_loan_applications, load_loan_applications_tail, load_transactions)
+from model_components import AddressHashingEncoder, ApproximateSMOTE, BoosterClassifier, OutlierClipper
+from model_registry import ModelSet
+from transaction_features import add_transaction_window_features
+
+TRAINING_DATA_FILES = ('loan_applications.csv', 'transactions.csv')
+
+# How train_models handles class imbalance in the training split:
+#   'smote'        - imblearn SMOTE (exact k-NN; the original behaviour)
+#   'approx_smote' - model_components.ApproximateSMOTE (chunked approximate k-NN, for large data)
+#   'class_weight' - no resampling, LightGBM 'balanced' class weights
+#   'undersample'  - random undersampling of the larger classes
+IMBALANCE_STRATEGIES = ('smote', 'approx_smote', 'class_weight', 'undersample')
+IMBALANCE_STRATEGY = 'smote'
+
+# One-hot encoding caps. Categories seen fewer than ONE_HOT_MIN_FREQUENCY times, and any beyond the
+# ONE_HOT_MAX_CATEGORIES most frequent of a column, share that column's 'infrequent' output (as do
+# categories unseen in training), so the encoded width stays bounded however many distinct values
+# the applicant base has.
+ONE_HOT_MIN_FREQUENCY = 20
+ONE_HOT_MAX_CATEGORIES = 50
+
+# Free-text address columns encoded as hashed state/city indicators instead of one-hot
+HASHED_ADDRESS_COLUMNS = ('residential_address',)
+
+# Application columns that are labels or identifiers rather than model features
+NON_FEATURE_COLUMNS = ['fraud_flag', 'loan_status', 'fraud_type', 'application_id', 'customer_id', 'application_date']
+
+# Cores train_models may use (None = all). With fork_workers (set by the command line, never by
+# threaded hosts such as the Streamlit app or the scoring service, where forking is unsafe) the two
+# models are resampled and fitted concurrently in forked worker processes, each LightGBM fit limited
+# to its share of the cores; otherwise they are fitted one after the other, each using all of them.
+TRAINING_N_JOBS = None
+
+# Raw applications saved in the bundle with their scores, as the batch a new bundle must reproduce
+# before it is hot-swapped in (loan_python_file.validate_model_set)
+VALIDATION_SAMPLE_ROWS = 256
+
+# Transaction columns the window features read
+TRANSACTION_COLUMNS = ['customer_id', 'transaction_date', 'transaction_amount', 'merchant_category']
+
+# Rows per chunk when streaming a CSV for a few of its customers or columns
+STREAM_CHUNK_ROWS = 500_000
+
+# Incremental refresh (incremental_train_models): boosting rounds added to each model per refresh
+# and the learning rate of the added trees
+INCREMENTAL_ROUNDS = 20
+INCREMENTAL_LEARNING_RATE = 0.05
+
+# Training rows and labels handed to the forked model-fitting workers (inherited, never pickled);
+# set only while a forked fit runs, one at a time
+_training_payload = {}
+_training_payload_lock = threading.Lock()
+
+def training_data_fingerprint(paths=TRAINING_DATA_FILES):
+    """Return a SHA-256 fingerprint of the training data files"""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.basename(path).encode())
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+def applications_snapshot(rows, path=LOAN_APPLICATIONS_CSV):
+    """Row count, byte size and SHA-256 of the applications file a model set was trained on"""
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+            size += len(block)
+    return {'applications_rows': rows, 'applications_bytes': size, 'applications_sha256': digest.hexdigest()}
+
+def _only_appended(snapshot, path=LOAN_APPLICATIONS_CSV):
+    """Whether the applications file still starts with exactly the bytes of `snapshot`"""
+    digest = hashlib.sha256()
+    remaining = snapshot['applications_bytes']
+    with open(path, 'rb') as f:
+        while remaining > 0:
+            block = f.read(min(1 << 20, remaining))
+            if not block:
+                return False
+            digest.update(block)
+            remaining -= len(block)
+    return digest.hexdigest() == snapshot['applications_sha256']
+
+def rebalance_training_data(X_train, y_train, strategy=IMBALANCE_STRATEGY, random_state=42):
+    """Apply an imbalance strategy to a training split.
+
+    Returns the (possibly resampled) rows and labels plus extra LGBMClassifier parameters.
+    """
+    if strategy == 'smote':
+        X_train, y_train = SMOTE(random_state=random_state).fit_resample(X_train, y_train)
+        return X_train, y_train, {}
+    if strategy == 'approx_smote':
+        X_train, y_train = ApproximateSMOTE(random_state=random_state).fit_resample(X_train, y_train)
+        return X_train, y_train, {}
+    if strategy == 'class_weight':
+        return X_train, y_train, {'class_weight': 'balanced'}
+    if strategy == 'undersample':
+        X_train, y_train = RandomUnderSampler(random_state=random_state).fit_resample(X_train, y_train)
+        return X_train, y_train, {}
+    raise ValueError(f"Unknown imbalance strategy {strategy!r}, expected one of {IMBALANCE_STRATEGIES}")
+
+def validation_sample(loan_applications_df, rows=VALIDATION_SAMPLE_ROWS, random_state=42):
+    """Sample of raw applications as JSON-style dicts (the scoring request format).
+
+    customer_id is kept, so scoring the sample goes through the transaction feature store lookups.
+    """
+    sample_df = loan_applications_df.sample(min(rows, len(loan_applications_df)), random_state=random_state)
+    sample_df = sample_df.drop(columns=['fraud_flag', 'loan_status', 'fraud_type'])
+    sample_df['application_date'] = sample_df['application_date'].dt.strftime('%Y-%m-%d')
+    return json.loads(sample_df.to_json(orient='records'))
+
+def feature_groups(X):
+    """Split feature columns into (numerical, one-hot categorical, hashed address) lists; the rest pass through"""
+    numerical_features = X.select_dtypes(include=['int64', 'float64']).columns.tolist()
+    categorical_features = X.select_dtypes(include=['object', 'category']).columns.tolist()
+    address_features = [col for col in categorical_features if col in HASHED_ADDRESS_COLUMNS]
+    categorical_features = [col for col in categorical_features if col not in HASHED_ADDRESS_COLUMNS]
+    return numerical_features, categorical_features, address_features
+
+def build_preprocessor(numerical_features, categorical_features, address_features):
+    """Unfitted ColumnTransformer producing the models' float32 CSR input"""
+    # Always CSR (sparse_threshold=1) in float32: the matrix stays sparse through splitting,
+    # resampling and LightGBM, which trains on CSR directly
+    return ColumnTransformer(
+        transformers=[
+            ('num', StandardScaler(), numerical_features),
+            ('cat', OneHotEncoder(handle_unknown='infrequent_if_exist', min_frequency=ONE_HOT_MIN_FREQUENCY,
+                                  max_categories=ONE_HOT_MAX_CATEGORIES, dtype=np.float32), categorical_features),
+            ('address', AddressHashingEncoder(), address_features)
+        ],
+        remainder='passthrough',
+        sparse_threshold=1.0
+    )
+
+def vocabulary_frame(category_counts, X_columns):
+    """Small frame on which the one-hot encoder learns the vocabulary it would learn on the full data.
+
+    Infrequent categories keep their exact counts and frequent ones get distinct counts of at
+    least ONE_HOT_MIN_FREQUENCY in the full data's order (ties kept): all that the encoder's
+    min_frequency and max_categories rules look at. Every other column is zero, so the scaler
+    fitted alongside is the identity until its streamed statistics are set. Columns are padded to
+    one length with their most frequent category, so each should have a frequent one.
+    """
+    columns = {}
+    for col, counts in category_counts.items():
+        counts = counts[counts > 0]
+        repeats = counts.astype(int)
+        frequent = counts >= ONE_HOT_MIN_FREQUENCY
+        repeats[frequent] = ONE_HOT_MIN_FREQUENCY + counts[frequent].rank(method='dense').astype(int)
+        values = np.repeat(repeats.index.to_numpy(dtype=object), repeats.to_numpy())
+        columns[col] = (values, repeats.idxmax())
+    length = max([len(values) for values, _ in columns.values()] + [1])
+
+    frame = {}
+    for col in X_columns:
+        if col in columns:
+            # Padding with the most repeated category keeps every category's rank
+            values, most_frequent = columns[col]
+            frame[col] = np.concatenate([values, np.full(length - len(values), most_frequent, dtype=object)])
+        else:
+            frame[col] = np.zeros(length)
+    return pd.DataFrame(frame, columns=X_columns)
+
+def category_counts(df, columns):
+    """Occurrences of every category (missing values included) of each of the given columns"""
+    return {col: df[col].astype(object).value_counts(dropna=False) for col in columns}
+
+def combine_category_counts(*counts):
+    """Sum of several category_counts results"""
+    combined = {}
+    for column_counts in counts:
+        for col, col_counts in column_counts.items():
+            combined[col] = col_counts if col not in combined else combined[col].add(col_counts, fill_value=0)
+    return combined
+
+def prepare_training_data(timings=None, components=None):
+    """Load, clean and engineer the training data and fit the preprocessor.
+
+    Returns (X_processed, y_fraud, y_loan_status). The fitted outlier_clipper, preprocessor and
+    X_columns, the number of applications_rows, validation_applications (see validation_sample)
+    and the one-hot columns' category_counts are stored in `components` and stage durations in
+    `timings`, if given.
+    """
+    timings = {} if timings is None else timings
+    components = {} if components is None else components
+
+    # Load data
+    stage_start = time.perf_counter()
+    loan_applications_df = load_loan_applications()
+    transactions_df = load_transactions()
+    timings['load_data'] = time.perf_counter() - stage_start
+
+    # Initial data inspection & cleaning (dates are parsed by the loader)
+    loan_applications_df['fraud_type'].fillna('Not Fraudulent', inplace=True)
+    components['applications_rows'] = len(loan_applications_df)
+    components['validation_applications'] = validation_sample(loan_applications_df)
+
+    # Outlier detection and treatment (bounds are kept in the bundle and reapplied at scoring time)
+    stage_start = time.perf_counter()
+    outlier_clipper = OutlierClipper(lower_quantile=0.01, upper_quantile=0.99)
+    outlier_clipper.fit_transform(loan_applications_df)
+
+    # Feature engineering
+    model.engineer_application_features(loan_applications_df)
+    timings['clip_and_engineer'] = time.perf_counter() - stage_start
+
+    # Point-in-time transaction window features (each transaction counted once, as at serving time)
+    stage_start = time.perf_counter()
+    loan_applications_df = add_transaction_window_features(
+        loan_applications_df, transactions_df, notebook_compatible=False
+    )
+    timings['transaction_windows'] = time.perf_counter() - stage_start
+
+    # Data preprocessing for modeling
+    stage_start = time.perf_counter()
+    X = loan_applications_df.drop(columns=NON_FEATURE_COLUMNS)
+    X_columns = X.columns.tolist()
+    y_fraud = loan_applications_df['fraud_flag']
+    y_loan_status = loan_applications_df['loan_status']
+
+    numerical_features, categorical_features, address_features = feature_groups(X)
+    preprocessor = build_preprocessor(numerical_features, categorical_features, address_features)
+    X_processed = preprocessor.fit_transform(X).astype(np.float32).tocsr()
+    timings['preprocess'] = time.perf_counter() - stage_start
+    components.update(outlier_clipper=outlier_clipper, preprocessor=preprocessor, X_columns=X_columns,
+                      category_counts=category_counts(X, categorical_features))
+    return X_processed, y_fraud, y_loan_status
+
+def shared_train_test_indices(y_fraud, y_loan_status, test_size=0.2, random_state=42):
+    """One train/test split of row positions for both models, stratified on the combined labels.
+
+    Label combinations with a single row cannot be stratified and are pooled into one stratum.
+    """
+    strata = pd.Series(np.asarray(y_fraud).astype(str)) + '|' + pd.Series(np.asarray(y_loan_status).astype(str))
+    strata = strata.where(strata.map(strata.value_counts()) >= 2, 'rare')
+    return train_test_split(np.arange(len(strata)), test_size=test_size, random_state=random_state, stratify=strata)
+
+def _thread_budgets(n_jobs, weights):
+    """Split n_jobs threads across concurrent tasks in proportion to their weights, at least one each"""
+    budgets = [max(1, int(n_jobs * weight / sum(weights))) for weight in weights]
+    budgets[budgets.index(max(budgets))] += max(0, n_jobs - sum(budgets))
+    return budgets
+
+def _fit_training_task(name, n_threads, payload=None):
+    """Rebalance and fit one of the two models on the training rows (default: the forked workers' _training_payload).
+
+    Returns (model, timings).
+    """
+    payload = _training_payload if payload is None else payload
+    X_train = payload['X_train']
+    labels = payload[name]
+    timings = {}
+
+    stage_start = time.perf_counter()
+    X_train_balanced, y_train_balanced, model_params = rebalance_training_data(
+        X_train, labels, payload['imbalance_strategy']
+    )
+    timings[f'{name}_resample'] = time.perf_counter() - stage_start
+
+    stage_start = time.perf_counter()
+    if name == 'fraud':
+        model = LGBMClassifier(random_state=42, n_jobs=n_threads, **model_params)
+    else:
+        model = LGBMClassifier(objective='multiclass', num_class=len(np.unique(labels)), random_state=42,
+                               n_jobs=n_threads, **model_params)
+    model.fit(X_train_balanced, y_train_balanced)
+    timings[f'{name}_fit'] = time.perf_counter() - stage_start
+    return model, timings
+
+def _print_stage_timings(timings):
+    print("Training stage timings:")
+    for stage, seconds in timings.items():
+        print(f"  {stage:<24} {seconds:8.2f} s")
+
+def train_models(bundle_path=model.MODEL_BUNDLE_PATH, imbalance_strategy=IMBALANCE_STRATEGY, n_jobs=TRAINING_N_JOBS,
+                 fork_workers=False):
+    """Train the fraud detection and loan risk assessment models and make them loan_python_file's active set.
+
+    The new set is activated atomically once both models are fitted; until then callers keep
+    scoring with the previous one. fork_workers fits the two models in forked processes (see
+    TRAINING_N_JOBS); only pass it from a single-threaded program such as the command line.
+    """
+    global _training_payload
+    n_jobs = n_jobs or os.cpu_count() or 1
+    timings = {}
+    training_start = time.perf_counter()
+
+    stage_start = time.perf_counter()
+    data_fingerprint = training_data_fingerprint()
+    timings['fingerprint'] = time.perf_counter() - stage_start
+    components = {}
+    X_processed, y_fraud, y_loan_status = prepare_training_data(timings, components)
+
+    # One stratified split for both models; only the training rows are materialized, once
+    stage_start = time.perf_counter()
+    train_idx, test_idx = shared_train_test_indices(y_fraud, y_loan_status)
+    X_train = X_processed[train_idx]
+    del X_processed
+    timings['split'] = time.perf_counter() - stage_start
+
+    payload = {
+        'X_train': X_train,
+        'fraud': y_fraud.to_numpy()[train_idx],
+        'loan_status': y_loan_status.to_numpy()[train_idx],
+        'imbalance_strategy': imbalance_strategy,
+    }
+    del X_train
+
+    # Fraud detection and loan risk assessment models (LightGBM), fitted concurrently in forked
+    # workers when allowed and several cores are available; the multiclass model builds one tree
+    # per class, so it gets proportionally more threads
+    stage_start = time.perf_counter()
+    tasks = ['fraud', 'loan_status']
+    if fork_workers and n_jobs > 1 and 'fork' in multiprocessing.get_all_start_methods():
+        budgets = _thread_budgets(n_jobs, [1, len(np.unique(payload['loan_status']))])
+        with _training_payload_lock:
+            _training_payload = payload
+            try:
+                with ProcessPoolExecutor(max_workers=len(tasks), mp_context=multiprocessing.get_context('fork')) as executor:
+                    futures = [executor.submit(_fit_training_task, name, threads) for name, threads in zip(tasks, budgets)]
+                    results = [future.result() for future in futures]
+            finally:
+                _training_payload = {}
+    else:
+        results = [_fit_training_task(name, n_jobs, payload) for name in tasks]
+    del payload
+    (fraud_model, fraud_timings), (loan_status_model, loan_status_timings) = results
+    timings.update(fraud_timings)
+    timings.update(loan_status_timings)
+    timings['models_wall'] = time.perf_counter() - stage_start
+    timings['total'] = time.perf_counter() - training_start
+    
+    print("Models trained successfully!")
+    _print_stage_timings(timings)
+
+    models = ModelSet(
+        components['outlier_clipper'], components['preprocessor'], fraud_model, loan_status_model,
+        components['X_columns'], path=bundle_path or None,
+        metadata={'data_fingerprint': data_fingerprint, 'imbalance_strategy': imbalance_strategy,
+                  'training_timings': timings, 'training_data': applications_snapshot(components['applications_rows']),
+                  'category_counts': components['category_counts']}
+    )
+    _save_and_activate(models, bundle_path, components['validation_applications'])
+    return models.preprocessor, models.fraud_model, models.loan_status_model, models.X_columns
+
+def validation_scores(models, validation_applications):
+    """Fraud probabilities of the validation batch with the window features computed as in training.
+
+    validate_model_set compares these with the scores of the serving path, whose window features
+    come from the transaction feature store instead. Only the batch's customers' transactions are
+    read, in chunks.
+    """
+    applications_df = pd.DataFrame(validation_applications)
+    if models.outlier_clipper is not None:
+        models.outlier_clipper.transform(applications_df)
+    model.engineer_application_features(applications_df)
+    if model.uses_transaction_features(models):
+        customer_ids = set(applications_df['customer_id'])
+        transactions_df = pd.concat([
+            chunk[chunk['customer_id'].isin(customer_ids)]
+            for chunk in iter_transaction_chunks(STREAM_CHUNK_ROWS, usecols=TRANSACTION_COLUMNS)
+        ])
+        applications_df = add_transaction_window_features(applications_df, transactions_df, notebook_compatible=False)
+    return models.fraud_model.predict_proba(model._transform_model_input(applications_df, models))[:, 1]
+
+def _save_and_activate(models, bundle_path, validation_applications):
+    """Record a fitted set's scores on its validation batch, save it as a bundle and make it the active set"""
+    if validation_applications:
+        models.metadata['validation'] = {
+            'applications': validation_applications,
+            'fraud_probability': validation_scores(models, validation_applications).tolist(),
+        }
+    if bundle_path:
+        model.save_model_bundle(bundle_path, models=models, **models.metadata)
+        print(f"Model bundle saved to {bundle_path}")
+    model.registry.activate(models)
+
+def _one_hot_encoder(preprocessor):
+    """(fitted one-hot encoder, its columns) of a fitted preprocessor"""
+    for name, encoder, columns in preprocessor.transformers_:
+        if name == 'cat':
+            return encoder, list(columns)
+    return None, []
+
+def _own_column_categories(encoder):
+    """Per encoded column, the set of categories that have a one-hot column of their own"""
+    infrequent = getattr(encoder, 'infrequent_categories_', None) or [None] * len(encoder.categories_)
+    return [set(known) - set(rare if rare is not None else ()) for known, rare in zip(encoder.categories_, infrequent)]
+
+def _leading_category_counts(columns, rows, path=LOAN_APPLICATIONS_CSV):
+    """category_counts of the first `rows` applications, streamed (for bundles saved without them)"""
+    counts = {}
+    for chunk in iter_loan_application_chunks(STREAM_CHUNK_ROWS, usecols=columns, path=path):
+        chunk = chunk.iloc[:rows]
+        counts = combine_category_counts(counts, category_counts(chunk, columns))
+        rows -= len(chunk)
+        if rows <= 0:
+            break
+    return counts
+
+def _new_one_hot_categories(preprocessor, counts):
+    """Categories the fitted encoder has no one-hot column for, but would have if refitted on `counts`.
+
+    `counts` (see category_counts) cover every training row, old and new, so a category is
+    promoted on its cumulative count and rank, as a full retrain would (min_frequency and
+    max_categories are the encoder's own rules, applied by refitting a copy of it per column).
+    """
+    encoder, columns = _one_hot_encoder(preprocessor)
+    new_categories = {}
+    for col, own_column in zip(columns, _own_column_categories(encoder) if encoder is not None else []):
+        refitted = clone(encoder).fit(vocabulary_frame({col: counts[col]}, [col]))
+        refitted_own_column = _own_column_categories(refitted)[0]
+        fresh = [category for category in refitted.categories_[0]
+                 if category in refitted_own_column and category not in own_column]
+        if fresh:
+            new_categories[col] = fresh
+    return new_categories
+
+def _deadline_callback(deadline):
+    """lightgbm.train callback that stops adding rounds once time.perf_counter() passes `deadline`"""
+    def callback(env):
+        if time.perf_counter() >= deadline:
+            raise lgb.callback.EarlyStopException(env.iteration, [])
+    callback.order = 100
+    return callback
+
+def _continue_booster(base_model, X, y, imbalance_strategy, rounds, deadline, n_jobs):
+    """Add up to `rounds` boosting rounds, fitted on (X, y), to a copy of base_model's booster"""
+    classes = base_model.classes_
+    label_index = {label: i for i, label in enumerate(classes.tolist())}
+    unknown = set(pd.unique(y)) - set(label_index)
+    if unknown:
+        raise ValueError(f"Labels {sorted(unknown)} are not among the model's classes {classes.tolist()}")
+    labels = pd.Series(y).map(label_index).to_numpy()
+    try:
+        X, labels, model_params = rebalance_training_data(X, labels, imbalance_strategy)
+    except ValueError:  # too few new rows of a class to resample: weight the classes instead
+        X, labels, model_params = rebalance_training_data(X, labels, 'class_weight')
+    weight = compute_sample_weight('balanced', labels) if model_params.get('class_weight') == 'balanced' else None
+
+    params = {key: value for key, value in base_model.booster_.params.items()
+              if key not in ('num_iterations', 'metric', 'num_threads')}
+    params.update(learning_rate=INCREMENTAL_LEARNING_RATE, num_threads=n_jobs)
+    booster = lgb.train(params, lgb.Dataset(X, label=labels, weight=weight), num_boost_round=rounds,
+                        init_model=base_model.booster_, callbacks=[_deadline_callback(deadline)])
+    return BoosterClassifier(booster, classes)
+
+def _retrain(base, bundle_path, imbalance_strategy, n_jobs, fork_workers):
+    """Retrain a saved model set from scratch the way it was trained (in memory or out of core); returns the new set"""
+    if base.metadata.get('out_of_core'):
+        import chunked_training  # imports this module
+        return chunked_training.train_models_out_of_core(
+            bundle_path=bundle_path, imbalance_strategy=imbalance_strategy or 'class_weight', n_jobs=n_jobs
+        )
+    train_models(bundle_path=bundle_path, imbalance_strategy=imbalance_strategy or IMBALANCE_STRATEGY, n_jobs=n_jobs,
+                 fork_workers=fork_workers)
+    return model.registry.active
+
+def incremental_train_models(bundle_path=model.MODEL_BUNDLE_PATH, time_budget=None, rounds=INCREMENTAL_ROUNDS,
+                             imbalance_strategy=None, on_vocabulary_change='retrain', n_jobs=TRAINING_N_JOBS,
+                             fork_workers=False):
+    """Refresh a saved model set with the applications appended to the training data since it was trained.
+
+    Keeps the fitted preprocessor, whose output the existing trees split on, and continues both
+    boosters (lightgbm init_model) with up to `rounds` rounds fitted on the new rows only, stopping
+    early (after at least one round each) once `time_budget` seconds have passed. The outlier
+    clipper's bounds are widened to the new rows, which leaves the existing trees' decisions
+    unchanged. Retrains from scratch instead (train_models, or chunked_training's
+    train_models_out_of_core for a set trained out of core) when the bundle has no record of its
+    training rows, when the applications file was changed rather than appended to, or, with
+    on_vocabulary_change='retrain', when the new rows make a category frequent enough, counted over
+    old and new rows together, for its own one-hot column (the encoder, and so the boosters' feature
+    space, cannot grow in place; 'ignore' scores such categories as infrequent). New rows and
+    retraining use the saved set's imbalance strategy unless another is given, so the added trees
+    keep the class priors of the existing ones. Saves and activates the refreshed set and returns it.
+    """
+    if imbalance_strategy is not None and imbalance_strategy not in IMBALANCE_STRATEGIES:
+        raise ValueError(f"Unknown imbalance strategy {imbalance_strategy!r}, expected one of {IMBALANCE_STRATEGIES}")
+    training_start = time.perf_counter()
+    deadline = training_start + time_budget if time_budget else float('inf')
+    n_jobs = n_jobs or os.cpu_count() or 1
+    timings = {}
+
+    stage_start = time.perf_counter()
+    base = model.read_model_bundle(bundle_path)
+    imbalance_strategy = imbalance_strategy or base.metadata.get('imbalance_strategy')
+    snapshot = base.metadata.get('training_data')
+    if snapshot is None or not _only_appended(snapshot):
+        print("The training data changed beyond appended applications; retraining from scratch")
+        return _retrain(base, bundle_path, imbalance_strategy, n_jobs, fork_workers)
+    new_df = load_loan_applications_tail(snapshot['applications_rows'])
+    validation_applications = base.metadata.get('validation', {}).get('applications') or []
+    if any('customer_id' not in application for application in validation_applications):
+        validation_applications = validation_sample(new_df)  # saved before the batch kept customer_id
+    imbalance_strategy = imbalance_strategy or IMBALANCE_STRATEGY
+    timings['load_new_rows'] = time.perf_counter() - stage_start
+    if new_df.empty:
+        print("No new applications since the models were trained")
+        return base
+
+    _, one_hot_columns = _one_hot_encoder(base.preprocessor)
+    previous_counts = base.metadata.get('category_counts')
+    if previous_counts is None:
+        previous_counts = _leading_category_counts(one_hot_columns, snapshot['applications_rows'])
+    counts = combine_category_counts(previous_counts, category_counts(new_df, one_hot_columns))
+    new_categories = _new_one_hot_categories(base.preprocessor, counts)
+    if new_categories and on_vocabulary_change == 'retrain':
+        print(f"New categories need their own one-hot columns ({new_categories}); retraining from scratch")
+        return _retrain(base, bundle_path, imbalance_strategy, n_jobs, fork_workers)
+
+    # Features of the new rows: clipped with the widened bounds, then the unchanged preprocessor
+    stage_start = time.perf_counter()
+    outlier_clipper = copy.deepcopy(base.outlier_clipper)
+    widened_columns = outlier_clipper.widen(new_df)
+    outlier_clipper.transform(new_df)
+    model.engineer_application_features(new_df)
+    new_df = add_transaction_window_features(new_df, load_transactions(), notebook_compatible=False)
+    X_new = model._transform_model_input(new_df, base).tocsr()
+    timings['prepare_new_rows'] = time.perf_counter() - stage_start
+
+    # The multiclass model adds one tree per class per round: it gets that share of the remaining time
+    stage_start = time.perf_counter()
+    n_loan_status_classes = len(base.loan_status_model.classes_)
+    fraud_deadline = stage_start + (deadline - stage_start) / (1 + n_loan_status_classes)
+    fraud_model = _continue_booster(base.fraud_model, X_new, new_df['fraud_flag'].to_numpy(), imbalance_strategy,
+                                    rounds, fraud_deadline, n_jobs)
+    timings['fraud_continue'] = time.perf_counter() - stage_start
+    stage_start = time.perf_counter()
+    loan_status_model = _continue_booster(base.loan_status_model, X_new, new_df['loan_status'].to_numpy(),
+                                          imbalance_strategy, rounds, deadline, n_jobs)
+    timings['loan_status_continue'] = time.perf_counter() - stage_start
+    timings['total'] = time.perf_counter() - training_start
+
+    update = {
+        'new_rows': len(new_df),
+        'fraud_rounds_added': fraud_model.booster_.current_iteration() - base.fraud_model.booster_.current_iteration(),
+        'loan_status_rounds_added': (loan_status_model.booster_.current_iteration()
+                                     - base.loan_status_model.booster_.current_iteration()),
+        'imbalance_strategy': imbalance_strategy,
+        'widened_clip_columns': widened_columns,
+        'infrequent_new_categories': new_categories,
+        'seconds': timings['total'],
+    }
+    print(f"Models refreshed with {len(new_df):,} new applications "
+          f"(+{update['fraud_rounds_added']} fraud / +{update['loan_status_rounds_added']} loan status rounds)")
+    _print_stage_timings(timings)
+
+    models = ModelSet(
+        outlier_clipper, base.preprocessor, fraud_model, loan_status_model, base.X_columns, path=bundle_path or None,
+        metadata={
+            'data_fingerprint': training_data_fingerprint(),
+            'imbalance_strategy': base.metadata.get('imbalance_strategy'),
+            'out_of_core': base.metadata.get('out_of_core', False),
+            'training_timings': base.metadata.get('training_timings'),
+            'training_data': applications_snapshot(snapshot['applications_rows'] + len(new_df)),
+            'incremental_updates': base.metadata.get('incremental_updates', []) + [update],
+            'category_counts': counts,
+        }
+    )
+    _save_and_activate(models, bundle_path, validation_applications)
+    return models
+
+def main(argv=None):
+    """Train (or refresh), save the bundle and export the portable model (python loan_python_file.py / model_training.py)"""
+    parser = argparse.ArgumentParser(description="Train the fraud detection and loan risk assessment models")
+    parser.add_argument('--incremental', action='store_true',
+                        help="add trees for the applications appended since the saved bundle was trained")
+    parser.add_argument('--time-budget', type=float, help="seconds an incremental refresh may take")
+    parser.add_argument('--rounds', type=int, default=INCREMENTAL_ROUNDS, help="boosting rounds added per refresh")
+    parser.add_argument('--out-of-core', action='store_true',
+                        help="stream the training data in chunks instead of loading it into memory")
+    parser.add_argument('--imbalance-strategy', choices=IMBALANCE_STRATEGIES,
+                        help="class imbalance handling for a full training run (out of core: class_weight or undersample)")
+    args = parser.parse_args(argv)
+
+    if args.incremental and os.path.exists(model.MODEL_BUNDLE_PATH):
+        incremental_train_models(time_budget=args.time_budget, rounds=args.rounds, fork_workers=True)
+    elif args.out_of_core:
+        import chunked_training  # imports this module
+        chunked_training.train_models_out_of_core(imbalance_strategy=args.imbalance_strategy or 'class_weight')
+    else:
+        train_models(imbalance_strategy=args.imbalance_strategy or IMBALANCE_STRATEGY, fork_workers=True)
+    print("Training completed successfully!")
+    model.export_portable_model()
+    print(f"Portable model exported to {model.PORTABLE_MODEL_PATH}")
+
+if __name__ == "__main__":
+    main()
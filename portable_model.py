@@ -0,0 +1,396 @@
+# Portable scoring artifact
+# Scores applications with the exported models (loan_python_file.export_portable_model) using
+# NumPy only: the preprocessing is stored as lookup tables and both LightGBM boosters as flat split
+# and leaf arrays in one .npz file, so a scoring process starts without importing pandas, scikit-learn,
+# imblearn or LightGBM.
+
+import json
+import os
+import zlib
+from datetime import date, datetime
+
+import numpy as np
+
+PORTABLE_FORMAT_VERSION = 1
+
+_EPSILON = 1e-6
+
+# Model features looked up in the transaction feature store (transaction_features' window columns)
+TRANSACTION_FEATURE_PREFIXES = ('num_transactions_', 'total_transaction_amount_', 'average_transaction_amount_',
+                                'unique_merchant_categories_')
+
+# LightGBM missing-value handling per split (MissingType) and its zero threshold (kZeroThreshold)
+_MISSING_NONE, _MISSING_ZERO, _MISSING_NAN = 0, 1, 2
+_MISSING_TYPES = {'None': _MISSING_NONE, 'Zero': _MISSING_ZERO, 'NaN': _MISSING_NAN}
+_ZERO_THRESHOLD = 1e-35
+
+_TREE_ARRAYS = ('feature', 'threshold', 'default_left', 'missing_type', 'leaf_mask', 'tree_starts', 'leaf_offsets',
+                'leaf_value', 'tree_class', 'base_score')
+
+# Rows scored per vectorised pass in TreeEnsemble.predict_raw (bounds the per-split temporaries)
+_ROW_BLOCK = 1024
+
+def _is_missing(value):
+    return value is None or (isinstance(value, float) and value != value)
+
+def _number(value):
+    return float('nan') if _is_missing(value) else value
+
+def _parse_date(value):
+    """datetime.date of an application date given as a date, datetime or ISO-like string"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        import pandas as pd  # only for non-ISO date strings
+        return pd.Timestamp(value).date()
+
+def parse_address(address):
+    """(state, city) of a residential address, normalised to lower case; missing parts are None.
+
+    Addresses are split on ', ' like eda_analysis: the second-to-last part is the state and the
+    part before it, without its PIN code, the city. A single-part address (e.g. free text typed
+    into the UI) is taken as the city.
+    """
+    if not isinstance(address, str) or not address.strip():
+        return None, None
+    parts = [part.strip().lower() for part in address.split(', ')]
+    if len(parts) == 1:
+        return None, parts[0]
+    state = parts[-2]
+    city = None
+    if len(parts) >= 3:
+        words = parts[-3].split()
+        city = ' '.join(words[:-1] if len(words) > 1 and words[-1].isdigit() else words) or None
+    return state, city
+
+def hashed_address_columns(address, n_features):
+    """Hashed column (stable CRC32, out of n_features) of each parsed field of one address"""
+    state, city = parse_address(address)
+    columns = []
+    if state is not None:
+        columns.append(zlib.crc32(f'state={state}'.encode()) % n_features)
+    if city is not None:
+        columns.append(zlib.crc32(f'city={city}'.encode()) % n_features)
+    return columns
+
+class ApplicationFeaturizer:
+    """Model input vectors for application dicts, from the fitted preprocessing as plain lookup tables.
+
+    numeric_blocks: (columns, output positions, means, scales); onehot_blocks: (column,
+    {category: output index}, index of unknown/infrequent categories, None, or 'error');
+    address_blocks: (column, hashed width, output offset).
+    """
+
+    def __init__(self, X_columns, defaults, clip_bounds, numeric_blocks, onehot_blocks, address_blocks,
+                 n_features, transaction_feature_store=None):
+        self.X_columns = list(X_columns)
+        self.defaults = defaults
+        self.clip_bounds = clip_bounds
+        self.numeric_blocks = numeric_blocks
+        self.onehot_blocks = onehot_blocks
+        self.address_blocks = address_blocks
+        self.n_features = n_features
+        self.transaction_feature_store = transaction_feature_store
+        self.uses_transaction_features = any(col.startswith(TRANSACTION_FEATURE_PREFIXES) for col in self.X_columns)
+
+    def engineered_row(self, application):
+        """Clipped raw fields plus the engineered date, ratio and window features, as a dict"""
+        row = dict(application)
+        for col, (lower, upper) in self.clip_bounds.items():
+            value = row.get(col)
+            if not _is_missing(value):
+                row[col] = min(max(value, lower), upper)
+
+        application_date = _parse_date(row['application_date'])
+        row['application_year'] = application_date.year
+        row['application_month'] = application_date.month
+        row['application_day_of_week'] = application_date.weekday()
+
+        if 'existing_emis_monthly' in row and 'monthly_income' in row:
+            row['existing_emi_to_income_ratio'] = (_number(row['existing_emis_monthly']) / (_number(row['monthly_income']) + _EPSILON)) * 100
+        else:
+            row['existing_emi_to_income_ratio'] = 0
+        if 'loan_amount_requested' in row and 'monthly_income' in row:
+            row['loan_amount_to_income_ratio'] = (_number(row['loan_amount_requested']) / (_number(row['monthly_income']) + _EPSILON)) * 100
+        else:
+            row['loan_amount_to_income_ratio'] = 0
+
+        if self.uses_transaction_features:
+            if self.transaction_feature_store is None:
+                raise RuntimeError("The models use transaction window features but no transaction feature store is set")
+            # No customer_id: a new customer, with no transaction history
+            customer_id = None if _is_missing(row.get('customer_id')) else row['customer_id']
+            row.update(self.transaction_feature_store.get_features(customer_id, row['application_date']))
+        return row
+
+    def _fill(self, matrix, rows):
+        """Write the model inputs of engineered rows into the (zeroed) float64 matrix"""
+        for columns, positions, means, scales in self.numeric_blocks:
+            defaults = [self.defaults.get(col, 0) for col in columns]
+            values = np.array([[row.get(col, default) for col, default in zip(columns, defaults)] for row in rows],
+                              dtype=np.float64).reshape(len(rows), len(columns))
+            matrix[:, positions] = (values - means) / scales
+
+        for column, lookup, unknown_index in self.onehot_blocks:
+            for i, row in enumerate(rows):
+                value = row.get(column)
+                index = lookup.get(None if _is_missing(value) else value, unknown_index)
+                if index == 'error':
+                    raise ValueError(f"Unknown category {value!r} in column {column!r}")
+                if index is not None:
+                    matrix[i, index] = 1.0
+
+        for column, n_hashed, offset in self.address_blocks:
+            for i, row in enumerate(rows):
+                for index in hashed_address_columns(row.get(column), n_hashed):
+                    matrix[i, offset + index] += 1.0
+
+    def features(self, application):
+        """Model input vector (float32, shape (1, n_features)) for one application dict"""
+        return self.features_matrix([application])
+
+    def features_matrix(self, applications):
+        """Model input matrix (float32, one row per application dict)"""
+        rows = [self.engineered_row(application) for application in applications]
+        matrix = np.zeros((len(rows), self.n_features), dtype=np.float64)
+        self._fill(matrix, rows)
+        return matrix.astype(np.float32)
+
+    def to_dict(self):
+        """JSON-serialisable tables (without the transaction feature store)"""
+        return {
+            'X_columns': self.X_columns,
+            'defaults': self.defaults,
+            'clip_bounds': self.clip_bounds,
+            'numeric_blocks': [
+                [list(columns), positions.tolist(), np.asarray(means, dtype=np.float64).tolist(),
+                 np.asarray(scales, dtype=np.float64).tolist()]
+                for columns, positions, means, scales in self.numeric_blocks
+            ],
+            'onehot_blocks': [[column, list(lookup.items()), unknown_index]
+                              for column, lookup, unknown_index in self.onehot_blocks],
+            'address_blocks': [list(block) for block in self.address_blocks],
+            'n_features': self.n_features,
+        }
+
+    @classmethod
+    def from_dict(cls, tables, transaction_feature_store=None):
+        return cls(
+            tables['X_columns'],
+            tables['defaults'],
+            {col: tuple(bounds) for col, bounds in tables['clip_bounds'].items()},
+            [(columns, np.array(positions, dtype=np.int64), np.array(means), np.array(scales))
+             for columns, positions, means, scales in tables['numeric_blocks']],
+            [(column, dict((category, index) for category, index in lookup), unknown_index)
+             for column, lookup, unknown_index in tables['onehot_blocks']],
+            [tuple(block) for block in tables['address_blocks']],
+            tables['n_features'],
+            transaction_feature_store
+        )
+
+class TreeEnsemble:
+    """A LightGBM booster (numerical splits, binary or multiclass) as flat split and leaf arrays.
+
+    Scoring follows QuickScorer: every split of every tree is compared once for a block of rows;
+    each split that goes right clears the bits of its left subtree's leaves in its tree's leaf
+    bitmask (leaves numbered left to right), and the lowest bit left set is the exit leaf. That is
+    a handful of vectorised passes per block instead of one step per tree level. Trees may have at
+    most 64 leaves.
+    """
+
+    def __init__(self, arrays, objective, num_class, sigmoid):
+        for name in _TREE_ARRAYS:
+            setattr(self, name, arrays[name])
+        self.objective = objective
+        self.num_class = num_class
+        self.sigmoid = sigmoid
+
+        max_leaves = int(np.diff(np.append(self.leaf_offsets, len(self.leaf_value))).max(initial=0))
+        self._mask_dtype = np.uint32 if max_leaves <= 32 else np.uint64
+        self._all_leaves = np.iinfo(self._mask_dtype).max
+        self._leaf_masks = self.leaf_mask.astype(self._mask_dtype)
+        self._class_matrix = (self.tree_class[:, None] == np.arange(num_class)[None, :]).astype(np.float64)
+        self._default_missing_only = bool((self.missing_type == _MISSING_NONE).all())
+
+    @classmethod
+    def from_booster(cls, booster):
+        """Flatten a lightgbm.Booster (via its JSON model dump)"""
+        model = booster.dump_model()
+        objective, *params = model['objective'].split()
+        params = dict(param.split(':', 1) for param in params)
+        if objective not in ('binary', 'multiclass') or model.get('average_output'):
+            raise ValueError(f"Cannot export a LightGBM model with objective {model['objective']!r}")
+
+        num_class = model['num_class']
+        splits = {name: [] for name in ('feature', 'threshold', 'default_left', 'missing_type', 'leaf_mask')}
+        tree_starts, leaf_offsets, leaf_values, tree_class = [], [], [], []
+        base_score = np.zeros(num_class)
+
+        def add_node(node, leaves):
+            """Append the subtree's splits; returns the (first, last + 1) leaf numbers it covers"""
+            if 'split_index' not in node:
+                leaves.append(node['leaf_value'])
+                return len(leaves) - 1, len(leaves)
+            if node['decision_type'] != '<=':
+                raise ValueError("Cannot export a LightGBM model with categorical splits")
+            split = len(splits['feature'])
+            splits['feature'].append(node['split_feature'])
+            splits['threshold'].append(node['threshold'])
+            splits['default_left'].append(node['default_left'])
+            splits['missing_type'].append(_MISSING_TYPES[node['missing_type']])
+            splits['leaf_mask'].append(0)
+            first, middle = add_node(node['left_child'], leaves)
+            _, last = add_node(node['right_child'], leaves)
+            splits['leaf_mask'][split] = ~(((1 << (middle - first)) - 1) << first) & (2**64 - 1)
+            return first, last
+
+        for tree_index, tree in enumerate(model['tree_info']):
+            root = tree['tree_structure']
+            if 'split_index' not in root:
+                base_score[tree_index % num_class] += root['leaf_value']
+                continue
+            leaves = []
+            tree_starts.append(len(splits['feature']))
+            leaf_offsets.append(len(leaf_values))
+            add_node(root, leaves)
+            if len(leaves) > 64:
+                raise ValueError("Cannot export trees with more than 64 leaves")
+            leaf_values.extend(leaves)
+            tree_class.append(tree_index % num_class)
+
+        arrays = {
+            'feature': np.array(splits['feature'], dtype=np.int32),
+            'threshold': np.array(splits['threshold'], dtype=np.float64),
+            'default_left': np.array(splits['default_left'], dtype=bool),
+            'missing_type': np.array(splits['missing_type'], dtype=np.int8),
+            'leaf_mask': np.array(splits['leaf_mask'], dtype=np.uint64),
+            'tree_starts': np.array(tree_starts, dtype=np.int64),
+            'leaf_offsets': np.array(leaf_offsets, dtype=np.int64),
+            'leaf_value': np.array(leaf_values, dtype=np.float64),
+            'tree_class': np.array(tree_class, dtype=np.int32),
+            'base_score': base_score,
+        }
+        return cls(arrays, objective, num_class, float(params.get('sigmoid', 1.0)))
+
+    def _goes_left(self, values):
+        """Split outcomes for values of shape (n_splits, n_rows), with LightGBM's missing-value rules"""
+        threshold = self.threshold[:, None]
+        if self._default_missing_only:
+            return values <= threshold
+        missing_type = self.missing_type[:, None]
+        is_nan = np.isnan(values)
+        values = np.where(is_nan & (missing_type != _MISSING_NAN), 0.0, values)
+        use_default = (((missing_type == _MISSING_ZERO) & (np.abs(values) <= _ZERO_THRESHOLD))
+                       | ((missing_type == _MISSING_NAN) & is_nan))
+        return np.where(use_default, self.default_left[:, None], values <= threshold)
+
+    def predict_raw(self, X):
+        """Raw scores, shape (n_rows, num_class)"""
+        X = np.asarray(X, dtype=np.float64)
+        raw = np.tile(self.base_score, (len(X), 1))
+        if not len(self.tree_starts):
+            return raw
+        if self._default_missing_only:
+            X = np.where(np.isnan(X), 0.0, X)  # LightGBM scores NaN as 0 on these splits
+
+        for start in range(0, len(X), _ROW_BLOCK):
+            X_block = X[start:start + _ROW_BLOCK].T
+            masks = np.where(self._goes_left(X_block[self.feature]), self._all_leaves, self._leaf_masks[:, None])
+            exit_masks = np.bitwise_and.reduceat(masks, self.tree_starts, axis=0)
+            lowest_bit = exit_masks & (~exit_masks + 1)
+            leaves = np.log2(lowest_bit).astype(np.int64)  # exact for powers of two
+            raw[start:start + _ROW_BLOCK] += (self._class_matrix.T @ self.leaf_value[self.leaf_offsets[:, None] + leaves]).T
+        return raw
+
+    def predict_proba(self, X):
+        """Class probabilities, shape (n_rows, n_classes), like LGBMClassifier.predict_proba"""
+        raw = self.predict_raw(X)
+        if self.objective == 'binary':
+            positive = 1.0 / (1.0 + np.exp(-self.sigmoid * raw[:, 0]))
+            return np.column_stack([1.0 - positive, positive])
+        raw = raw - raw.max(axis=1, keepdims=True)
+        exp = np.exp(raw)
+        return exp / exp.sum(axis=1, keepdims=True)
+
+    def arrays(self):
+        return {name: getattr(self, name) for name in _TREE_ARRAYS}
+
+    def params(self):
+        return {'objective': self.objective, 'num_class': self.num_class, 'sigmoid': self.sigmoid}
+
+class PortableScorer:
+    """Exported preprocessing tables plus the fraud and loan-status tree ensembles.
+
+    predict() returns the same tuple as loan_python_file.predict_loan_risk_and_fraud and
+    predict_records() the batch equivalent.
+    """
+
+    def __init__(self, featurizer, fraud_model, loan_status_model, fraud_classes, loan_status_classes, metadata=None):
+        self.featurizer = featurizer
+        self.fraud_model = fraud_model
+        self.loan_status_model = loan_status_model
+        self.fraud_classes = np.asarray(fraud_classes)
+        self.loan_status_classes = np.asarray(loan_status_classes)
+        self.metadata = metadata or {}
+
+    def _predict(self, model_input, fraud_threshold):
+        fraud_proba = self.fraud_model.predict_proba(model_input)
+        if fraud_threshold is not None:
+            fraud_prediction = self.fraud_classes[(fraud_proba[:, 1] >= fraud_threshold).astype(int)]
+        else:
+            fraud_prediction = self.fraud_classes[fraud_proba.argmax(axis=1)]
+        loan_status_proba = self.loan_status_model.predict_proba(model_input)
+        loan_status_prediction = self.loan_status_classes[loan_status_proba.argmax(axis=1)]
+        return fraud_prediction, fraud_proba[:, 1], loan_status_prediction, loan_status_proba
+
+    def predict(self, application, fraud_threshold=None):
+        """(fraud label, fraud probability, loan status label, loan status probabilities) for one application"""
+        fraud_prediction, fraud_proba, loan_status_prediction, loan_status_proba = self._predict(
+            self.featurizer.features(application), fraud_threshold
+        )
+        return fraud_prediction[0], fraud_proba[0], loan_status_prediction[0], loan_status_proba
+
+    def predict_records(self, applications, fraud_threshold=None):
+        """Fraud labels, fraud probabilities, loan status labels and probabilities for a list of application dicts"""
+        return self._predict(self.featurizer.features_matrix(applications), fraud_threshold)
+
+    def save(self, path):
+        """Write the artifact as one .npz file (JSON header plus tree arrays), atomically"""
+        header = {
+            'format_version': PORTABLE_FORMAT_VERSION,
+            'metadata': self.metadata,
+            'featurizer': self.featurizer.to_dict(),
+            'fraud_classes': self.fraud_classes.tolist(),
+            'loan_status_classes': self.loan_status_classes.tolist(),
+            'fraud_model': self.fraud_model.params(),
+            'loan_status_model': self.loan_status_model.params(),
+        }
+        arrays = {'header': np.array(json.dumps(header))}
+        for prefix, model in [('fraud_model', self.fraud_model), ('loan_status_model', self.loan_status_model)]:
+            arrays.update({f'{prefix}.{name}': values for name, values in model.arrays().items()})
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+
+def load_portable_model(path, transaction_feature_store=None):
+    """Load an artifact written by PortableScorer.save"""
+    with np.load(path, allow_pickle=False) as data:
+        header = json.loads(str(data['header']))
+        if header.get('format_version') != PORTABLE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported portable model format {header.get('format_version')!r} in {path}")
+        models = {
+            prefix: TreeEnsemble({name: data[f'{prefix}.{name}'] for name in _TREE_ARRAYS}, **header[prefix])
+            for prefix in ('fraud_model', 'loan_status_model')
+        }
+    return PortableScorer(
+        ApplicationFeaturizer.from_dict(header['featurizer'], transaction_feature_store),
+        models['fraud_model'], models['loan_status_model'],
+        header['fraud_classes'], header['loan_status_classes'], header['metadata']
+    )
@@ -0,0 +1,389 @@
+# Scoring HTTP service
+# Dependency-free ASGI app that exposes predict_loan_risk_and_fraud to other systems:
+#   GET  /healthz        liveness (the process is serving requests)
+#   GET  /readyz         readiness (models loaded; 503 while loading or after a failed load)
+#   POST /predict        one application (JSON object) -> fraud / loan-status prediction
+#   POST /predict/batch  {"applications": [...]} (or a JSON list) -> one prediction per application
+# Each worker process loads the model bundle (or the portable model) once, in the background at
+# startup, and scores on a small thread pool so the event loop keeps answering while CPU-bound
+# inference runs; concurrent /predict requests are micro-batched (micro_batcher) into one matrix
+# per model call, and requests beyond SCORING_MAX_PENDING in flight get 503. Run it with
+#   python scoring_service.py --workers 4 --port 8000
+# (uvicorn), or point any other ASGI server at scoring_service:app. With several workers the CLI
+# loads the models once and forks the workers from that process (serve_forked), so they share
+# one copy of the boosters copy-on-write instead of each loading its own. With the bundle backend
+# every worker also watches the model directory and hot-swaps in new bundles once they have been
+# loaded, warmed up and validated in the background (loan_python_file.watch_model_directory).
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from micro_batcher import MicroBatcher
+from model_registry import freeze_for_fork
+
+# Settings are read from the environment so every worker process of a multi-worker server sees them
+SCORING_BACKEND = os.environ.get('LOAN_SHERLOCK_BACKEND', 'bundle')   # 'bundle' or 'portable'
+SCORING_MODEL_PATH = os.environ.get('LOAN_SHERLOCK_MODEL_PATH')        # None = the backend's default path
+SCORING_THREADS = int(os.environ.get('LOAN_SHERLOCK_SCORING_THREADS', 2))
+SCORING_MAX_PENDING = int(os.environ.get('LOAN_SHERLOCK_MAX_PENDING', 64))
+MAX_BATCH_SIZE = int(os.environ.get('LOAN_SHERLOCK_MAX_BATCH_SIZE', 10_000))
+# /predict micro-batching: up to this many concurrent requests per model call (<= 1 disables it),
+# waiting at most MICRO_BATCH_WAIT_MS after the first one
+MICRO_BATCH_SIZE = int(os.environ.get('LOAN_SHERLOCK_MICRO_BATCH_SIZE', 128))
+MICRO_BATCH_WAIT_MS = float(os.environ.get('LOAN_SHERLOCK_MICRO_BATCH_WAIT_MS', 2.0))
+MAX_BODY_BYTES = int(os.environ.get('LOAN_SHERLOCK_MAX_BODY_BYTES', 16 * 1024 * 1024))
+# Seconds between checks of the model directory for new bundles (0 disables hot reload)
+MODEL_WATCH_INTERVAL = float(os.environ.get('LOAN_SHERLOCK_MODEL_WATCH_INTERVAL', 10.0))
+
+class ScoringError(Exception):
+    """A request that cannot be scored, with the HTTP status to answer it with"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+def _plain(value):
+    """NumPy scalars as the matching Python scalar, for JSON"""
+    return value.item() if hasattr(value, 'item') else value
+
+def _prediction(fraud_flag, fraud_probability, loan_status, loan_status_proba, loan_status_classes):
+    return {
+        'fraud_flag': _plain(fraud_flag),
+        'fraud_probability': float(fraud_probability),
+        'loan_status': _plain(loan_status),
+        'loan_status_probabilities': {
+            str(_plain(label)): float(p) for label, p in zip(loan_status_classes, loan_status_proba)
+        },
+    }
+
+class BundleBackend:
+    """Scores with loan_python_file and the pickled model bundle (compiled single-application path)"""
+
+    def __init__(self, path=None):
+        import loan_python_file as model
+        self.model = model
+        self.bundle_path = path or model.MODEL_BUNDLE_PATH
+        models = model.registry.active
+        if models is None or models.path != self.bundle_path:  # else loaded before the worker was forked
+            models = model.load_model_bundle(self.bundle_path)
+        if model.uses_transaction_features(models):
+            model.ensure_transaction_feature_store()
+        model.get_compiled_scorer(models)  # build before the first request
+
+    @property
+    def path(self):
+        """Bundle the active model version was loaded from (changes on hot reload)"""
+        return self.model.registry.active.path
+
+    @property
+    def version(self):
+        return self.model.registry.version
+
+    def watch(self, interval):
+        """Hot-reload new bundles saved next to the one being served; returns the started watcher"""
+        return self.model.watch_model_directory(os.path.dirname(self.bundle_path) or '.', interval)
+
+    def predict(self, application):
+        fraud_flag, fraud_probability, loan_status, loan_status_proba = self.model.predict_loan_risk_and_fraud(application)
+        return _prediction(fraud_flag, fraud_probability, loan_status, loan_status_proba[0],
+                           self.model.lgbm_loan_status_model.classes_)
+
+    def predict_many(self, applications):
+        """Predictions for a few applications (a micro-batch), scored as one matrix"""
+        classes = self.model.lgbm_loan_status_model.classes_
+        return [
+            _prediction(fraud_flag, fraud_probability, loan_status, loan_status_proba[0], classes)
+            for fraud_flag, fraud_probability, loan_status, loan_status_proba in self.model.predict_applications(applications)
+        ]
+
+    def predict_batch(self, applications):
+        classes = self.model.lgbm_loan_status_model.classes_
+        results_df = self.model.predict_batch(applications)
+        proba = results_df[[f'loan_status_proba_{label}' for label in classes]].to_numpy()
+        return [
+            _prediction(fraud_flag, fraud_probability, loan_status, row, classes)
+            for fraud_flag, fraud_probability, loan_status, row in zip(
+                results_df['fraud_flag'], results_df['fraud_probability'], results_df['loan_status'], proba
+            )
+        ]
+
+class PortableBackend:
+    """Scores with the NumPy-only portable model (no pandas, scikit-learn or LightGBM in the worker)"""
+
+    def __init__(self, path=None):
+        from portable_model import load_portable_model
+        self.path = path or os.path.join('models', 'loan_sherlock_portable.npz')
+        self.scorer = load_portable_model(self.path)
+        if self.scorer.featurizer.uses_transaction_features:
+            # The transaction window features need the customers' transactions (this imports pandas)
+            from feature_store import TransactionFeatureStore
+            self.scorer.featurizer.transaction_feature_store = TransactionFeatureStore.from_csv(retention_days=math.inf)
+
+    def predict(self, application):
+        fraud_flag, fraud_probability, loan_status, loan_status_proba = self.scorer.predict(application)
+        return _prediction(fraud_flag, fraud_probability, loan_status, loan_status_proba[0],
+                           self.scorer.loan_status_classes)
+
+    def predict_batch(self, applications):
+        fraud_flags, fraud_probabilities, loan_statuses, loan_status_proba = self.scorer.predict_records(applications)
+        return [
+            _prediction(*prediction, self.scorer.loan_status_classes)
+            for prediction in zip(fraud_flags, fraud_probabilities, loan_statuses, loan_status_proba)
+        ]
+
+    predict_many = predict_batch
+
+SCORING_BACKENDS = {'bundle': BundleBackend, 'portable': PortableBackend}
+
+class ScoringService:
+    """ASGI application: one per worker process, owning that worker's models and thread pool"""
+
+    def __init__(self, backend=SCORING_BACKEND, model_path=SCORING_MODEL_PATH, threads=SCORING_THREADS,
+                 max_pending=SCORING_MAX_PENDING, micro_batch_size=MICRO_BATCH_SIZE,
+                 micro_batch_wait_ms=MICRO_BATCH_WAIT_MS, model_watch_interval=MODEL_WATCH_INTERVAL):
+        if backend not in SCORING_BACKENDS:
+            raise ValueError(f"Unknown scoring backend {backend!r}, expected one of {tuple(SCORING_BACKENDS)}")
+        self.backend_name = backend
+        self.model_path = model_path
+        self.threads = threads
+        self.max_pending = max_pending
+        self.micro_batch_size = micro_batch_size
+        self.micro_batch_wait_ms = micro_batch_wait_ms
+        self.model_watch_interval = model_watch_interval
+        self.backend = None
+        self.watcher = None
+        self._preloaded = None
+        self.batcher = None
+        self.load_error = None
+        self.pending = 0
+        self._executor = None
+        self._loading = None
+        self._lock = threading.Lock()
+
+    # Model loading
+    def preload(self):
+        """Load the models in this process now, without starting any thread (see serve_forked)"""
+        self._preloaded = SCORING_BACKENDS[self.backend_name](self.model_path)
+
+    def _load_backend(self):
+        try:
+            backend = self._preloaded or SCORING_BACKENDS[self.backend_name](self.model_path)
+            if self.micro_batch_size > 1:
+                self.batcher = MicroBatcher(backend.predict_many, self.micro_batch_size, self.micro_batch_wait_ms)
+            if self.model_watch_interval > 0 and hasattr(backend, 'watch'):
+                self.watcher = backend.watch(self.model_watch_interval)
+            self.backend = backend
+        except Exception as e:  # reported by /readyz; the worker keeps answering health checks
+            self.load_error = f"{type(e).__name__}: {e}"
+
+    def _start_loading(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix='scoring')
+            if self._loading is None:
+                self._loading = asyncio.get_running_loop().run_in_executor(self._executor, self._load_backend)
+
+    def _shutdown(self):
+        if self.watcher is not None:
+            self.watcher.stop(timeout=1)
+        if self.batcher is not None:
+            self.batcher.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # Request handling
+    async def _score(self, method, payload):
+        if self.backend is None:
+            raise ScoringError(503, self.load_error or "Models are still loading")
+        if self.pending >= self.max_pending:
+            raise ScoringError(503, "Too many requests in flight")
+        self.pending += 1
+        try:
+            if method == 'predict' and self.batcher is not None:
+                return await asyncio.wrap_future(self.batcher.submit(payload))
+            return await asyncio.get_running_loop().run_in_executor(self._executor, getattr(self.backend, method), payload)
+        except (KeyError, TypeError, ValueError) as e:
+            raise ScoringError(422, f"Cannot score application: {type(e).__name__}: {e}")
+        finally:
+            self.pending -= 1
+
+    async def _predict(self, body):
+        application = _parse_json(body)
+        if not isinstance(application, dict):
+            raise ScoringError(400, "Expected a JSON object with the application fields")
+        return 200, await self._score('predict', application)
+
+    async def _predict_batch(self, body):
+        payload = _parse_json(body)
+        applications = payload.get('applications') if isinstance(payload, dict) else payload
+        if not isinstance(applications, list) or not all(isinstance(a, dict) for a in applications):
+            raise ScoringError(400, "Expected a JSON list of application objects (or {\"applications\": [...]})")
+        if len(applications) > MAX_BATCH_SIZE:
+            raise ScoringError(413, f"At most {MAX_BATCH_SIZE} applications per batch")
+        if not applications:
+            return 200, {'results': []}
+        return 200, {'results': await self._score('predict_batch', applications)}
+
+    async def _health(self, body):
+        return 200, {'status': 'ok'}
+
+    async def _ready(self, body):
+        if self.backend is not None:
+            status = {'status': 'ready', 'backend': self.backend_name, 'model_path': self.backend.path,
+                      'pending': self.pending}
+            if self.watcher is not None:
+                status.update(model_version=self.backend.version, reloads=self.watcher.reloads,
+                              reload_error=self.watcher.last_error)
+            return 200, status
+        if self.load_error is not None:
+            return 503, {'status': 'failed', 'error': self.load_error}
+        return 503, {'status': 'loading'}
+
+    ROUTES = {
+        ('GET', '/healthz'): _health,
+        ('GET', '/readyz'): _ready,
+        ('POST', '/predict'): _predict,
+        ('POST', '/predict/batch'): _predict_batch,
+    }
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            self._start_loading()  # for servers that do not run the lifespan protocol
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                self._start_loading()  # in the background: /healthz answers while models load
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self._shutdown()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _http(self, scope, receive, send):
+        path = scope['path'].rstrip('/') or '/'
+        handler = self.ROUTES.get((scope['method'], path))
+        try:
+            if handler is None:
+                if any(route_path == path for _, route_path in self.ROUTES):
+                    raise ScoringError(405, f"Method {scope['method']} not allowed on {path}")
+                raise ScoringError(404, f"No route {path}")
+            status, response = await handler(self, await _read_body(receive))
+        except ScoringError as e:
+            status, response = e.status, {'error': e.message}
+        except Exception as e:
+            status, response = 500, {'error': f"{type(e).__name__}: {e}"}
+        await _send_json(send, status, response)
+
+async def _read_body(receive):
+    chunks, size = [], 0
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            raise ScoringError(400, "Client disconnected")
+        chunk = message.get('body', b'')
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            raise ScoringError(413, f"Request body larger than {MAX_BODY_BYTES} bytes")
+        chunks.append(chunk)
+        if not message.get('more_body', False):
+            return b''.join(chunks)
+
+def _parse_json(body):
+    try:
+        return json.loads(body)
+    except ValueError as e:
+        raise ScoringError(400, f"Invalid JSON: {e}")
+
+async def _send_json(send, status, payload):
+    body = json.dumps(payload, allow_nan=False).encode()
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())],
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+app = ScoringService()
+
+def serve_forked(service, host, port, workers):
+    """Serve `service` from `workers` uvicorn processes forked after loading the models here once.
+
+    The workers inherit the loaded models (frozen out of the GC's reach, see
+    model_registry.freeze_for_fork) and share their memory pages with this process until they
+    write to them, which scoring does not; this process only supervises and forwards SIGINT /
+    SIGTERM to the workers.
+    """
+    import signal
+    import socket
+    import uvicorn
+
+    sock = socket.socket(socket.AF_INET6 if ':' in host else socket.AF_INET)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+
+    service.preload()
+    freeze_for_fork()
+    children = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                uvicorn.Server(uvicorn.Config(service, lifespan='on', access_log=False)).run(sockets=[sock])
+            finally:
+                os._exit(0)
+        children.append(pid)
+
+    def stop(signum, frame):
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    for pid in children:
+        os.waitpid(pid, 0)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve loan fraud / risk predictions over HTTP")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=1, help="worker processes")
+    parser.add_argument('--backend', choices=tuple(SCORING_BACKENDS), default=SCORING_BACKEND)
+    parser.add_argument('--model-path', default=SCORING_MODEL_PATH)
+    parser.add_argument('--threads', type=int, default=SCORING_THREADS, help="scoring threads per worker")
+    parser.add_argument('--preload', action=argparse.BooleanOptionalAction, default=hasattr(os, 'fork'),
+                        help="with several workers, load the models once and fork the workers sharing them")
+    args = parser.parse_args()
+
+    try:
+        import uvicorn
+    except ImportError:
+        raise SystemExit("uvicorn is required to run the service directly (pip install uvicorn)")
+
+    os.environ['LOAN_SHERLOCK_BACKEND'] = args.backend
+    os.environ['LOAN_SHERLOCK_SCORING_THREADS'] = str(args.threads)
+    if args.model_path:
+        os.environ['LOAN_SHERLOCK_MODEL_PATH'] = args.model_path
+    # Workers share the box: keep LightGBM/OpenMP from starting one thread per core in each of them
+    if args.workers > 1:
+        os.environ.setdefault('OMP_NUM_THREADS', '1')
+    if args.workers > 1 and args.preload:
+        serve_forked(ScoringService(args.backend, args.model_path, args.threads), args.host, args.port, args.workers)
+    else:
+        uvicorn.run('scoring_service:app', host=args.host, port=args.port, workers=args.workers,
+                    lifespan='on', access_log=False)
@@ -0,0 +1,107 @@
+# The modules live at the repository root
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+def synthetic_applications(n=1500, n_customers=400, seed=0):
+    """Loan applications with the columns, value formats and label mix of loan_applications.csv"""
+    rng = np.random.default_rng(seed)
+    loan_status = rng.choice(['Approved', 'Declined', 'Fraudulent - Detected', 'Fraudulent - Undetected'],
+                             size=n, p=[0.7, 0.2, 0.06, 0.04])
+    fraud_flag = (np.char.startswith(loan_status.astype(str), 'Fraudulent') | (rng.random(n) < 0.02)).astype(int)
+    monthly_income = rng.integers(150, 2000, size=n) * 100.0
+    existing_emis = (monthly_income * rng.uniform(0, 0.4, size=n)).round(-2)
+    return pd.DataFrame({
+        'application_id': [f'00000000-0000-0000-0000-{i:012d}' for i in range(n)],
+        'customer_id': [f'CUST{i:06d}' for i in rng.integers(n_customers, size=n)],
+        'application_date': (pd.Timestamp('2023-01-01') + pd.to_timedelta(rng.integers(0, 540, size=n), unit='D')
+                             ).strftime('%Y-%m-%d'),
+        'loan_type': rng.choice(['Home Loan', 'Car Loan', 'Business Loan', 'Education Loan', 'Personal Loan'], size=n),
+        'loan_amount_requested': rng.integers(10, 2000, size=n) * 1000.0,
+        'loan_tenure_months': rng.choice([12, 24, 36, 60, 120, 240], size=n),
+        'interest_rate_offered': rng.uniform(8, 18, size=n).round(2),
+        'purpose_of_loan': rng.choice(['Home Renovation', 'Medical Emergency', 'Education', 'Business Expansion',
+                                       'Vehicle Purchase', 'Debt Consolidation'], size=n),
+        'employment_status': rng.choice(['Salaried', 'Retired', 'Self-Employed', 'Unemployed', 'Student'], size=n),
+        'monthly_income': monthly_income,
+        'cibil_score': rng.integers(300, 900, size=n),
+        'existing_emis_monthly': existing_emis,
+        'debt_to_income_ratio': (existing_emis / monthly_income * 100).round(1),
+        'property_ownership_status': rng.choice(['Owned', 'Rented', 'Jointly Owned'], size=n),
+        'residential_address': [f'{i % 97}/{i % 13}, X Road, {city} {400000 + i % 999}, {city}, {state}'
+                                for i, (city, state) in enumerate(zip(
+                                    rng.choice(['Pune', 'Tumkur', 'Anantapur', 'Kochi'], size=n),
+                                    rng.choice(['Maharashtra', 'Karnataka', 'Manipur', 'Kerala'], size=n)))],
+        'applicant_age': rng.integers(21, 70, size=n),
+        'gender': rng.choice(['Male', 'Female', 'Other'], size=n),
+        'number_of_dependents': rng.integers(0, 5, size=n),
+        'loan_status': loan_status,
+        'fraud_flag': fraud_flag,
+        'fraud_type': np.where(fraud_flag == 1, 'Identity Theft', None),
+    })
+
+def synthetic_transactions(n=6000, n_customers=400, seed=1):
+    """Transactions with the columns the window features read, for the synthetic customers"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'transaction_id': [f'TXN{i:08d}' for i in range(n)],
+        'customer_id': [f'CUST{i:06d}' for i in rng.integers(n_customers, size=n)],
+        'transaction_date': (pd.Timestamp('2022-01-01') + pd.to_timedelta(rng.integers(0, 900 * 1440, size=n),
+                                                                          unit='min')).strftime('%Y-%m-%d %H:%M:%S'),
+        'transaction_amount': rng.gamma(2.0, 800.0, size=n).round(2),
+        'merchant_category': rng.choice(['Groceries', 'Travel', 'Fuel', 'Dining', 'Electronics'], size=n),
+        'fraud_flag': 0,
+    })
+
+@pytest.fixture(scope='session')
+def training_data_dir(tmp_path_factory):
+    """Working directory holding synthetic loan_applications.csv and transactions.csv (the modules read relative paths)"""
+    directory = tmp_path_factory.mktemp('loan_data')
+    synthetic_applications().to_csv(directory / 'loan_applications.csv', index=False)
+    synthetic_transactions().to_csv(directory / 'transactions.csv', index=False)
+    previous = os.getcwd()
+    os.chdir(directory)
+    yield directory
+    os.chdir(previous)
+
+@pytest.fixture(scope='session')
+def trained_models(training_data_dir):
+    """Model set trained on the synthetic data and saved as the default bundle, with its feature store"""
+    import loan_python_file as model
+    import model_training
+    model_training.train_models(imbalance_strategy='class_weight', n_jobs=2)
+    model.set_transaction_feature_store(None)
+    model.ensure_transaction_feature_store()
+    return model.registry.active
+
+@pytest.fixture
+def scoring_models(trained_models):
+    """The trained model set, made active for the duration of a test"""
+    import loan_python_file as model
+    previous = model.registry.activate(trained_models)
+    yield trained_models
+    model.registry.activate(previous)
+
+@pytest.fixture
+def scoring_applications():
+    """Raw applications as scoring callers pass them (labels dropped)"""
+    applications_df = synthetic_applications(n=200, seed=7)
+    return applications_df.drop(columns=['loan_status', 'fraud_flag', 'fraud_type'])
+
+@pytest.fixture
+def unusual_applications(scoring_applications):
+    """Application dicts with missing fields and values, unseen categories, out-of-range numbers and unknown customers"""
+    base = scoring_applications.iloc[:6].to_dict('records')
+    base[0].pop('customer_id')
+    base[1]['customer_id'] = 'NO-SUCH-CUSTOMER'
+    base[2].update(monthly_income=None, cibil_score=float('nan'))
+    base[3].update(loan_type='Gold Loan', employment_status=None)
+    base[4].update(loan_amount_requested=1e12, applicant_age=-5)
+    base[5].pop('residential_address')
+    base[5].pop('existing_emis_monthly')
+    return base
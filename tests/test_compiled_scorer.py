@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import loan_python_file as model
+
+def _dataframe_input(applications, models):
+    return model._transform_model_input(model._prepare_scoring_frame(pd.DataFrame(applications), models), models)
+
+def _batchable(applications, columns):
+    """Applications that can be compared as one DataFrame: a field absent from only some dicts becomes NaN
+    there, whereas a lone application without it gets the column default (as the compiled path does)"""
+    return [application for application in applications if set(columns) - {'customer_id'} <= set(application)]
+
+def test_features_match_the_dataframe_pipeline(scoring_models, scoring_applications, unusual_applications):
+    scorer = model.get_compiled_scorer(scoring_models)
+    applications = scoring_applications.to_dict('records') + unusual_applications
+    for application in applications:
+        np.testing.assert_array_equal(scorer.features(application), _dataframe_input([application], scoring_models).toarray())
+    applications = _batchable(applications, scoring_applications.columns)
+    np.testing.assert_array_equal(scorer.featurizer.features_matrix(applications),
+                                  _dataframe_input(applications, scoring_models).toarray())
+
+def test_predictions_match_the_dataframe_path(scoring_models, scoring_applications, unusual_applications,
+                                               monkeypatch):
+    applications = scoring_applications.iloc[:50].to_dict('records') + unusual_applications
+    compiled = [model.predict_loan_risk_and_fraud(application) for application in applications]
+    batch = _batchable(applications, scoring_applications.columns)
+    compiled_records = model._score_records(batch, scoring_models, fraud_threshold=0.2)
+    monkeypatch.setattr(model, 'USE_COMPILED_SCORER', False)
+    expected = [model.predict_loan_risk_and_fraud(application) for application in applications]
+    expected_records = model._score_records(batch, scoring_models, fraud_threshold=0.2)
+
+    for actual, reference in zip(compiled, expected):
+        assert actual[0] == reference[0] and actual[2] == reference[2]
+        assert actual[1] == pytest.approx(reference[1], abs=1e-12)
+        np.testing.assert_allclose(actual[3], reference[3], rtol=0, atol=1e-12)
+    for actual, reference in zip(compiled_records, expected_records):
+        if actual.dtype.kind == 'f':
+            np.testing.assert_allclose(actual, reference, rtol=0, atol=1e-12)
+        else:
+            np.testing.assert_array_equal(actual, reference)
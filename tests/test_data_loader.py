@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import data_loader
+
+@pytest.fixture
+def applications_csv(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_loader, 'CACHE_DIR', str(tmp_path / 'cache'))
+    data_loader.clear_cache()
+    path = tmp_path / 'loan_applications.csv'
+    pd.DataFrame({
+        'application_id': ['APP1', 'APP2', 'APP3', 'APP4'],
+        'customer_id': ['CUST1', 'CUST2', 'CUST3', 'CUST4'],
+        'application_date': ['2023-01-05', '2023-02-11', '2023-03-17', '2023-04-23'],
+        'loan_tenure_months': [12, 24, 36, 48],
+        'cibil_score': [710, None, 655, 802],
+        'applicant_age': [31, 45, 28, 52],
+        'number_of_dependents': [0, 2, None, 1],
+        'fraud_flag': [0, 1, 0, 0],
+    }).to_csv(path, index=False)
+    yield path
+    data_loader.clear_cache()
+
+def test_missing_integer_values_load_as_nan(applications_csv):
+    applications_df = data_loader.load_loan_applications(applications_csv)
+
+    assert applications_df['cibil_score'].dtype == np.float64
+    assert applications_df['cibil_score'].isna().tolist() == [False, True, False, False]
+    assert applications_df['number_of_dependents'].dtype == np.float64
+    # Complete integer columns keep the dtype pd.read_csv infers for them
+    assert applications_df['loan_tenure_months'].dtype == np.int64
+    assert applications_df['applicant_age'].dtype == np.int64
+
+def test_chunks_and_tail_parse_missing_integer_values(applications_csv):
+    chunks = list(data_loader.iter_loan_application_chunks(2, path=applications_csv))
+    assert [chunk['cibil_score'].dtype for chunk in chunks] == [np.float64, np.int64]
+    assert pd.concat(chunks)['cibil_score'].isna().sum() == 1
+
+    tail_df = data_loader.load_loan_applications_tail(2, applications_csv)
+    assert tail_df['application_id'].tolist() == ['APP3', 'APP4']
+    assert tail_df['number_of_dependents'].isna().tolist() == [True, False]
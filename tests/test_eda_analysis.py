@@ -0,0 +1,123 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import data_loader
+import eda_analysis
+from conftest import synthetic_applications, synthetic_transactions
+
+@pytest.fixture
+def eda_data(tmp_path, monkeypatch):
+    """Synthetic CSVs in the working directory (with a few missing CIBIL scores), read as the old EDA code did"""
+    applications_df = synthetic_applications(n=3000, seed=3)
+    applications_df.loc[applications_df.sample(frac=0.02, random_state=0).index, 'cibil_score'] = np.nan
+    transactions_df = synthetic_transactions(n=5000, seed=4)
+    transactions_df['transaction_type'] = np.random.default_rng(5).choice(
+        ['Bill Payment', 'Transfer', 'Purchase'], size=len(transactions_df)
+    )
+    transactions_df.loc[::7, 'fraud_flag'] = 1
+    applications_df.to_csv(tmp_path / 'loan_applications.csv', index=False)
+    transactions_df.to_csv(tmp_path / 'transactions.csv', index=False)
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(data_loader, 'CACHE_DIR', str(tmp_path / 'cache'))
+    data_loader.clear_cache()
+    yield pd.read_csv('loan_applications.csv'), pd.read_csv('transactions.csv')
+    data_loader.clear_cache()
+
+def _assert_close(actual, expected, abs_tol=1e-9):
+    """Nested dicts with the same keys and numbers equal up to float summation order"""
+    if isinstance(expected, dict):
+        assert set(actual) == set(expected)
+        for key in expected:
+            _assert_close(actual[key], expected[key], abs_tol)
+    elif isinstance(expected, str):
+        assert actual == expected
+    elif math.isnan(expected):
+        assert math.isnan(actual)
+    else:
+        assert actual == pytest.approx(expected, rel=1e-9, abs=abs_tol)
+
+def _approval_rate(statuses):
+    return (statuses == 'Approved').sum() / len(statuses) * 100
+
+def _baseline_loan_data(loan_df, transactions_df):
+    """analyze_loan_data as written before the grouped aggregation (row filters per KPI)"""
+    total_applications = len(loan_df)
+    approved_loans = len(loan_df[loan_df['loan_status'] == 'Approved'])
+    total_transactions = len(transactions_df)
+    return {
+        'loan_stats': {
+            'total_applications': total_applications,
+            'approved_loans': approved_loans,
+            'declined_loans': len(loan_df[loan_df['loan_status'] == 'Declined']),
+            'approval_rate': approved_loans / total_applications * 100,
+            'avg_loan_amount': loan_df['loan_amount_requested'].mean(),
+            'total_loan_amount': loan_df[loan_df['loan_status'] == 'Approved']['loan_amount_requested'].sum(),
+            'fraud_rate': len(loan_df[loan_df['fraud_flag'] == 1]) / total_applications * 100,
+            'avg_age': loan_df['applicant_age'].mean(),
+            'avg_cibil': loan_df['cibil_score'].mean(),
+            'cibil_approved': loan_df[loan_df['loan_status'] == 'Approved']['cibil_score'].mean(),
+            'cibil_declined': loan_df[loan_df['loan_status'] == 'Declined']['cibil_score'].mean(),
+            'avg_interest_rate': loan_df['interest_rate_offered'].mean(),
+            'loan_type_dist': loan_df['loan_type'].value_counts().to_dict(),
+            'employment_dist': loan_df['employment_status'].value_counts().to_dict(),
+            'gender_dist': loan_df['gender'].value_counts().to_dict(),
+            'property_dist': loan_df['property_ownership_status'].value_counts().to_dict(),
+        },
+        'transaction_stats': {
+            'total_transactions': total_transactions,
+            'avg_transaction_amount': transactions_df['transaction_amount'].mean(),
+            'total_transaction_volume': transactions_df['transaction_amount'].sum(),
+            'transaction_fraud_rate': len(transactions_df[transactions_df['fraud_flag'] == 1]) / total_transactions * 100,
+            'transaction_type_dist': transactions_df['transaction_type'].value_counts().to_dict(),
+            'merchant_category_dist': transactions_df['merchant_category'].value_counts().to_dict(),
+        },
+    }
+
+@pytest.mark.parametrize('chunksize', [None, 700])
+def test_analyze_loan_data_matches_the_row_filter_implementation(eda_data, chunksize):
+    results = eda_analysis.analyze_loan_data(chunksize=chunksize)
+    _assert_close(results, _baseline_loan_data(*eda_data))
+    counts = list(results['loan_stats']['loan_type_dist'].values())
+    assert counts == sorted(counts, reverse=True)
+
+def _baseline_market_insights(loan_df):
+    """get_detailed_market_insights as written before the vectorized aggregation (lambda approval rates)"""
+    risk_columns = {'loan_status': _approval_rate, 'cibil_score': 'mean', 'loan_amount_requested': 'mean'}
+    loan_df['state'] = loan_df['residential_address'].str.split(', ').str[-2]
+    state_analysis = loan_df.groupby('state').agg({
+        'loan_status': _approval_rate, 'loan_amount_requested': 'mean', 'cibil_score': 'mean'
+    }).round(2)
+    loan_df['age_group'] = pd.cut(loan_df['applicant_age'], bins=[0, 25, 35, 45, 55, 100],
+                                  labels=['18-25', '26-35', '36-45', '46-55', '55+'])
+    return {
+        'avg_amounts_by_type': loan_df.groupby('loan_type')['loan_amount_requested'].mean().to_dict(),
+        'interest_by_type': loan_df.groupby('loan_type')['interest_rate_offered'].mean().to_dict(),
+        'risk_by_employment': loan_df.groupby('employment_status').agg(risk_columns).round(2).to_dict(),
+        'top_states': state_analysis.sort_values('loan_amount_requested', ascending=False).head(10).to_dict(),
+        'age_analysis': loan_df.groupby('age_group', observed=False).agg(risk_columns).round(2).to_dict(),
+        'latest_trends': {
+            'total_portfolio_value': loan_df[loan_df['loan_status'] == 'Approved']['loan_amount_requested'].sum(),
+            'average_processing_time': '3-5 days',
+            'digital_adoption': 78.5,
+            'customer_satisfaction': 4.2,
+        },
+    }
+
+@pytest.mark.parametrize('source', ['rows', 'threads', 'cube'])
+def test_market_insights_match_the_lambda_implementation(eda_data, source):
+    if source == 'cube':
+        from loan_cube import LoanCube
+        insights = eda_analysis.get_detailed_market_insights(
+            cube=LoanCube.from_applications(data_loader.load_loan_applications())
+        )
+    else:
+        insights = eda_analysis.get_detailed_market_insights(n_jobs=3 if source == 'threads' else 1)
+
+    # Rounded group statistics may differ in the last place when a mean lands on a rounding boundary
+    _assert_close(insights, _baseline_market_insights(eda_data[0]), abs_tol=0.01)
+    amounts = list(insights['avg_amounts_by_type'].values())
+    assert amounts == sorted(amounts, reverse=True)
@@ -0,0 +1,97 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from feature_store import TransactionFeatureStore
+from transaction_features import compute_transaction_window_features
+
+def _transactions(n_customers=50, n_transactions=4000, seed=0):
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp('2022-01-01')
+    return pd.DataFrame({
+        'customer_id': [f'CUST{i:04d}' for i in rng.integers(n_customers, size=n_transactions)],
+        'transaction_date': start + pd.to_timedelta(rng.integers(0, 3 * 365 * 24 * 60, size=n_transactions), unit='min'),
+        'transaction_amount': rng.gamma(2.0, 500.0, size=n_transactions).round(2),
+        'merchant_category': rng.choice(['Groceries', 'Travel', 'Fuel', 'Dining', 'Electronics', None], size=n_transactions),
+    })
+
+def _applications(transactions_df, n_applications=500, seed=1):
+    rng = np.random.default_rng(seed)
+    dates = pd.Timestamp('2022-03-01') + pd.to_timedelta(rng.integers(0, 2 * 365, size=n_applications), unit='D')
+    return pd.DataFrame({
+        'application_id': np.arange(n_applications),
+        'customer_id': rng.choice(transactions_df['customer_id'].unique(), size=n_applications),
+        'application_date': dates,
+    })
+
+def _assert_matches_offline(store, applications_df, transactions_df):
+    expected = compute_transaction_window_features(applications_df, transactions_df, notebook_compatible=False)
+    batch = store.features_frame(applications_df['customer_id'], applications_df['application_date'])
+    single = pd.DataFrame([store.get_features(customer_id, as_of) for customer_id, as_of
+                           in zip(applications_df['customer_id'], applications_df['application_date'])])
+    for actual in (batch, single):
+        for col in store.feature_columns:
+            np.testing.assert_allclose(actual[col].to_numpy(dtype=float), expected[col].to_numpy(dtype=float),
+                                       rtol=1e-9, atol=1e-6, err_msg=col)
+
+def test_historical_lookups_match_offline_features(tmp_path):
+    transactions_df = _transactions()
+    applications_df = _applications(transactions_df)
+    path = tmp_path / 'transactions.csv'
+    transactions_df.to_csv(path, index=False)
+
+    store = TransactionFeatureStore.from_csv(path, retention_days=math.inf)
+    _assert_matches_offline(store, applications_df, transactions_df)
+
+def test_lookups_match_offline_features_within_retention():
+    transactions_df = _transactions()
+    store = TransactionFeatureStore()
+    store.ingest(transactions_df)
+
+    # Applications after each customer's newest transaction are inside the retained horizon
+    newest = transactions_df.groupby('customer_id')['transaction_date'].max()
+    applications_df = _applications(transactions_df)
+    offsets = pd.to_timedelta(np.arange(len(applications_df)) % 400, unit='D')
+    applications_df['application_date'] = newest.loc[applications_df['customer_id']].to_numpy() + offsets
+    _assert_matches_offline(store, applications_df, transactions_df)
+
+def test_streamed_and_late_transactions_match_offline_features():
+    transactions_df = _transactions(n_customers=5, n_transactions=600)
+    store = TransactionFeatureStore(retention_days=math.inf)
+    # Shuffled order: most transactions arrive late relative to ones already added
+    for row in transactions_df.sample(frac=1, random_state=3).itertuples(index=False):
+        store.add_transaction(row.customer_id, row.transaction_date, row.transaction_amount, row.merchant_category)
+    _assert_matches_offline(store, _applications(transactions_df, n_applications=200), transactions_df)
+
+def test_lookup_before_retained_horizon_raises():
+    transactions_df = _transactions(n_customers=1, n_transactions=500)
+    store = TransactionFeatureStore()
+    store.ingest(transactions_df)
+
+    with pytest.raises(ValueError, match='evicted'):
+        store.get_features('CUST0000', '2022-06-01')
+    with pytest.raises(ValueError, match='evicted'):
+        store.features_frame(['CUST0000', 'CUST0000'], ['2030-01-01', '2022-06-01'])
+
+def test_batch_lookups_of_unknown_customers_are_zero():
+    transactions_df = _transactions(n_customers=3, n_transactions=300)
+    store = TransactionFeatureStore(retention_days=math.inf)
+    store.ingest(transactions_df)
+
+    features_df = store.features_frame(['CUST9999', 'CUST0001'], ['2023-01-01', '2023-01-01'])
+    assert (features_df.iloc[0] == 0).all()
+    assert features_df.iloc[1].to_dict() == store.get_features('CUST0001', '2023-01-01')
+
+def test_future_dated_lookup_leaves_state_unchanged():
+    transactions_df = _transactions(n_customers=3, n_transactions=300)
+    store = TransactionFeatureStore()
+    store.ingest(transactions_df)
+    as_of = transactions_df['transaction_date'].max() + pd.Timedelta(days=1)
+    before = store.get_features('CUST0001', as_of)
+
+    future = store.get_features('CUST0001', '2035-01-01')
+    assert future['num_transactions_365d'] == 0
+    assert store.get_features('CUST0001', as_of) == before
+    assert before['num_transactions_365d'] > 0
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import data_loader
+import loan_cube
+from loan_cube import LoanCube, load_cube
+
+pytest.importorskip('pyarrow')
+
+def _applications(n, seed=0, start=0):
+    rng = np.random.default_rng(seed)
+    states = ['Maharashtra', 'Karnataka', 'Manipur', 'Kerala']
+    return pd.DataFrame({
+        'application_id': [f'APP{i:06d}' for i in range(start, start + n)],
+        'customer_id': [f'CUST{i:06d}' for i in rng.integers(1000, size=n)],
+        'application_date': (pd.Timestamp('2023-01-01') + pd.to_timedelta(rng.integers(0, 540, size=n), unit='D')
+                             ).strftime('%Y-%m-%d'),
+        'loan_type': rng.choice(['Home Loan', 'Car Loan', 'Personal Loan'], size=n),
+        'loan_amount_requested': rng.integers(10, 900, size=n) * 1000.0,
+        'interest_rate_offered': rng.uniform(8, 16, size=n).round(2),
+        'employment_status': rng.choice(['Salaried', 'Self-Employed', 'Retired'], size=n),
+        'cibil_score': rng.integers(300, 900, size=n),
+        'residential_address': [f'{i}/4, X Road, Town 372428, City, {state}'
+                                for i, state in enumerate(rng.choice(states, size=n))],
+        'applicant_age': rng.integers(18, 80, size=n),
+        'loan_status': rng.choice(['Approved', 'Declined', 'Fraudulent - Detected'], size=n, p=[0.7, 0.2, 0.1]),
+        'fraud_flag': rng.choice([0, 1], size=n, p=[0.9, 0.1]),
+    })
+
+@pytest.fixture
+def cube_paths(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_loader, 'CACHE_DIR', str(tmp_path / 'cache'))
+    data_loader.clear_cache()
+    yield tmp_path / 'loan_applications.csv', str(tmp_path / 'cube' / 'loan_cube.parquet')
+    data_loader.clear_cache()
+
+def _assert_same_cube(actual, expected):
+    by = ['loan_type', 'state', 'loan_status']
+    pd.testing.assert_frame_equal(actual.query(by), expected.query(by), check_dtype=False)
+
+def test_query_matches_grouping_the_rows(cube_paths):
+    path, _ = cube_paths
+    applications_df = _applications(2000)
+    applications_df.to_csv(path, index=False)
+    cube = LoanCube.from_applications(data_loader.load_loan_applications(path))
+
+    result = cube.query(['loan_type'], filters={'employment_status': ['Salaried', 'Retired']})
+    rows = applications_df[applications_df['employment_status'].isin(['Salaried', 'Retired'])]
+    grouped = rows.groupby('loan_type')
+    np.testing.assert_array_equal(result['applications'], grouped.size())
+    np.testing.assert_allclose(result['approval_rate'], grouped['loan_status'].apply(lambda s: (s == 'Approved').mean() * 100))
+    np.testing.assert_allclose(result['fraud_rate'], grouped['fraud_flag'].mean() * 100)
+    np.testing.assert_allclose(result['loan_amount_requested_mean'], grouped['loan_amount_requested'].mean())
+    np.testing.assert_allclose(result['cibil_score_std'], grouped['cibil_score'].std())
+
+def test_appended_rows_are_merged_into_the_stored_cube(cube_paths, monkeypatch):
+    path, cube_path = cube_paths
+    _applications(2000).to_csv(path, index=False)
+    load_cube(path, cube_path)
+
+    _applications(300, seed=1, start=2000).to_csv(path, mode='a', header=False, index=False)
+
+    def full_load(*args, **kwargs):
+        raise AssertionError("an append-only change must not reload the whole file")
+    with monkeypatch.context() as patch:
+        patch.setattr(loan_cube, 'load_loan_applications', full_load)
+        cube = load_cube(path, cube_path)
+    _assert_same_cube(cube, LoanCube.from_applications(data_loader.load_loan_applications(path)))
+
+def test_edited_row_forces_a_rebuild(cube_paths):
+    path, cube_path = cube_paths
+    applications_df = _applications(2000)
+    applications_df.loc[0, 'loan_status'] = 'Approved'
+    applications_df.to_csv(path, index=False)
+    load_cube(path, cube_path)
+
+    # Edit the first row in place, far before the end of the file, then append rows
+    with open(path, 'r+b') as f:
+        f.readline()
+        offset = f.tell()
+        row = f.readline()
+        f.seek(offset)
+        f.write(row.replace(b',Approved,', b',Declined,'))
+    _applications(300, seed=1, start=2000).to_csv(path, mode='a', header=False, index=False)
+    data_loader.clear_cache()
+
+    cube = load_cube(path, cube_path)
+    _assert_same_cube(cube, LoanCube.from_applications(data_loader.load_loan_applications(path)))
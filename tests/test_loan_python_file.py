@@ -0,0 +1,80 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import loan_python_file as model
+
+def test_saved_bundle_reads_back_as_the_same_model_set(trained_models, scoring_applications, tmp_path):
+    path = str(tmp_path / 'bundle.pkl')
+    model.save_model_bundle(path, data_fingerprint='abc123', imbalance_strategy='class_weight', models=trained_models)
+
+    models = model.read_model_bundle(path)
+    assert models.path == path
+    assert models.X_columns == trained_models.X_columns
+    assert models.metadata['format_version'] == model.BUNDLE_FORMAT_VERSION
+    assert models.metadata['data_fingerprint'] == 'abc123'
+    assert models.metadata['imbalance_strategy'] == 'class_weight'
+    assert models.metadata['loan_status_classes'] == trained_models.loan_status_model.classes_.tolist()
+
+    records = scoring_applications.to_dict('records')
+    for expected, actual in zip(model._score_records(records, trained_models), model._score_records(records, models)):
+        np.testing.assert_array_equal(actual, expected)
+
+def test_reading_a_bundle_does_not_activate_it(trained_models, tmp_path):
+    path = str(tmp_path / 'bundle.pkl')
+    model.save_model_bundle(path, models=trained_models)
+    previous = model.registry.active
+    try:
+        assert model.read_model_bundle(path) is not model.registry.active
+        assert model.load_model_bundle(path) is model.registry.active
+    finally:
+        model.registry.activate(previous)
+
+@pytest.mark.parametrize('format_version', [None, 1, model.BUNDLE_FORMAT_VERSION + 1])
+def test_bundle_of_another_format_version_is_rejected(trained_models, tmp_path, format_version):
+    path = str(tmp_path / 'bundle.pkl')
+    bundle = model.save_model_bundle(path, models=trained_models)
+    bundle['format_version'] = format_version
+    with open(path, 'wb') as f:
+        pickle.dump(bundle, f)
+
+    with pytest.raises(ValueError, match='Unsupported model bundle version'):
+        model.read_model_bundle(path)
+
+@pytest.mark.parametrize('use_compiled_scorer', [True, False])
+def test_batch_matches_single_application_scoring(scoring_models, scoring_applications, monkeypatch,
+                                                   use_compiled_scorer):
+    monkeypatch.setattr(model, 'USE_COMPILED_SCORER', use_compiled_scorer)
+    assert (model.get_compiled_scorer(scoring_models) is not None) == use_compiled_scorer
+    classes = scoring_models.loan_status_model.classes_
+
+    batch = model.predict_batch(scoring_applications, chunk_size=64)
+    assert batch.index.equals(scoring_applications.index)
+    for (_, row), application in zip(batch.iterrows(), scoring_applications.to_dict('records')):
+        fraud_prediction, fraud_proba, loan_status, loan_status_proba = model.predict_loan_risk_and_fraud(application)
+        assert row['fraud_flag'] == fraud_prediction
+        assert row['fraud_probability'] == pytest.approx(fraud_proba, abs=1e-9)
+        assert row['loan_status'] == loan_status
+        np.testing.assert_allclose(row[[f'loan_status_proba_{label}' for label in classes]].to_numpy(dtype=float),
+                                   loan_status_proba[0], rtol=0, atol=1e-9)
+
+def test_batch_scores_applications_without_a_customer_id_as_new_customers(scoring_models, scoring_applications):
+    without_ids = model.predict_batch(scoring_applications.drop(columns=['customer_id']))
+    unknown_ids = model.predict_batch(scoring_applications.assign(customer_id='NO-SUCH-CUSTOMER'))
+    records = model.predict_batch(scoring_applications.drop(columns=['customer_id']).to_dict('records'))
+    pd.testing.assert_frame_equal(without_ids, unknown_ids)
+    pd.testing.assert_frame_equal(without_ids, records)
+
+def test_batch_labels_follow_the_probabilities(scoring_models, scoring_applications):
+    classes = scoring_models.loan_status_model.classes_
+    batch = model.predict_batch(scoring_applications)
+    loan_status_proba = batch[[f'loan_status_proba_{label}' for label in classes]].to_numpy()
+    np.testing.assert_array_equal(batch['loan_status'], classes[loan_status_proba.argmax(axis=1)])
+    np.testing.assert_allclose(loan_status_proba.sum(axis=1), 1)
+    np.testing.assert_array_equal(batch['fraud_flag'], (batch['fraud_probability'] > 0.5).astype(int))
+
+    thresholded = model.predict_batch(scoring_applications, fraud_threshold=0.2)
+    np.testing.assert_array_equal(thresholded['fraud_flag'], (batch['fraud_probability'] >= 0.2).astype(int))
+    pd.testing.assert_frame_equal(thresholded.drop(columns='fraud_flag'), batch.drop(columns='fraud_flag'))
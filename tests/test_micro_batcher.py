@@ -0,0 +1,24 @@
+import threading
+
+import pytest
+
+from micro_batcher import MicroBatcher
+
+def test_results_are_returned_to_their_callers():
+    with MicroBatcher(lambda items: [item * 2 for item in items], max_batch_size=8, max_wait_ms=20) as batcher:
+        futures = [batcher.submit(i) for i in range(20)]
+        assert [future.result(timeout=5) for future in futures] == [i * 2 for i in range(20)]
+
+def test_wrong_number_of_results_fails_every_caller():
+    release = threading.Event()
+
+    def short_batch(items):
+        release.wait(5)
+        return [item for item in items[:-1]]
+
+    with MicroBatcher(short_batch, max_batch_size=4, max_wait_ms=50) as batcher:
+        futures = [batcher.submit(i) for i in range(4)]
+        release.set()
+        for future in futures:
+            with pytest.raises(RuntimeError, match='3 results for a batch of 4'):
+                future.result(timeout=5)
@@ -0,0 +1,76 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+
+import loan_python_file as model
+from conftest import synthetic_applications
+from model_components import OutlierClipper
+
+def _amounts(n, seed, shift=0.0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'loan_amount_requested': rng.lognormal(12 + shift, 0.8, size=n),
+        'cibil_score': rng.integers(300, 900, size=n).astype(float),
+    })
+
+def test_fit_transform_matches_clipping_each_column_to_its_quantiles():
+    applications_df = synthetic_applications(n=2000, seed=2)
+    expected = applications_df.copy()
+    for col in expected.select_dtypes(include=np.number).columns.drop('fraud_flag'):
+        expected[col] = expected[col].clip(lower=expected[col].quantile(0.01), upper=expected[col].quantile(0.99))
+
+    clipped = OutlierClipper().fit_transform(applications_df.copy())
+    pd.testing.assert_frame_equal(clipped, expected)
+    pd.testing.assert_series_equal(clipped['fraud_flag'], applications_df['fraud_flag'])
+
+def test_partial_fit_bounds_do_not_depend_on_the_chunking():
+    applications_df = synthetic_applications(n=5000, seed=2)
+    whole = OutlierClipper(sample_size=1000).partial_fit(applications_df)
+    chunked = OutlierClipper(sample_size=1000)
+    for start in range(0, len(applications_df), 700):
+        chunked.partial_fit(applications_df.iloc[start:start + 700])
+    pd.testing.assert_series_equal(chunked.lower_, whole.lower_)
+    pd.testing.assert_series_equal(chunked.upper_, whole.upper_)
+
+    # A sample holding every row gives the exact bounds
+    exact = OutlierClipper(sample_size=len(applications_df))
+    for start in range(0, len(applications_df), 700):
+        exact.partial_fit(applications_df.iloc[start:start + 700])
+    fitted = OutlierClipper().fit(applications_df)
+    pd.testing.assert_series_equal(exact.lower_, fitted.lower_)
+    pd.testing.assert_series_equal(exact.upper_, fitted.upper_)
+
+def test_scoring_clips_to_the_training_bounds(scoring_models, scoring_applications):
+    application = scoring_applications.iloc[0].to_dict()
+    bound = scoring_models.outlier_clipper.upper_['loan_amount_requested']
+    at_bound = model.predict_loan_risk_and_fraud({**application, 'loan_amount_requested': bound})
+    beyond = model.predict_loan_risk_and_fraud({**application, 'loan_amount_requested': bound * 1000})
+    assert beyond[1] == at_bound[1]
+    np.testing.assert_array_equal(beyond[3], at_bound[3])
+
+def test_refreshes_from_the_training_distribution_leave_the_bounds_unchanged():
+    clipper = OutlierClipper().fit(_amounts(20_000, seed=0))
+    lower, upper = clipper.lower_.copy(), clipper.upper_.copy()
+
+    for seed in range(1, 21):
+        # Each refresh starts from the saved bundle, as incremental_train_models does
+        clipper = pickle.loads(pickle.dumps(clipper))
+        assert clipper.widen(_amounts(500, seed=seed)) == []
+    pd.testing.assert_series_equal(clipper.lower_, lower)
+    pd.testing.assert_series_equal(clipper.upper_, upper)
+
+def test_shifted_rows_widen_only_the_bound_they_cross():
+    clipper = OutlierClipper().fit(_amounts(20_000, seed=0))
+    lower, upper = clipper.lower_.copy(), clipper.upper_.copy()
+
+    assert clipper.widen(_amounts(5_000, seed=1, shift=1.0)) == ['loan_amount_requested']
+    assert clipper.upper_['loan_amount_requested'] > upper['loan_amount_requested']
+    assert clipper.lower_['loan_amount_requested'] == lower['loan_amount_requested']
+    assert clipper.upper_['cibil_score'] == upper['cibil_score']
+
+def test_saved_sample_is_cut_to_the_retained_size():
+    clipper = OutlierClipper(retained_sample_size=1_000).fit(_amounts(20_000, seed=0))
+    restored = pickle.loads(pickle.dumps(clipper))
+    assert len(restored._sample) == 1_000
+    assert np.all(np.sort(restored._sample_keys) == np.sort(clipper._sample_keys)[:1_000])
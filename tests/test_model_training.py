@@ -0,0 +1,91 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import chunked_training
+import loan_python_file as model
+import model_training as training
+
+def _applications(categories):
+    """Applications with the given loan_type counts ({category: rows}) and one numeric column"""
+    loan_types = [category for category, rows in categories.items() for _ in range(rows)]
+    return pd.DataFrame({
+        'loan_type': pd.Series(loan_types, dtype=object),
+        'loan_amount_requested': np.linspace(1000.0, 50000.0, len(loan_types)),
+    })
+
+def _fitted_preprocessor(applications_df):
+    return training.build_preprocessor(*training.feature_groups(applications_df)).fit(applications_df)
+
+def test_category_is_promoted_on_its_combined_count():
+    old_df = _applications({'Personal Loan': 100, 'Car Loan': 60, 'Gold Loan': 15})
+    new_df = _applications({'Personal Loan': 20, 'Gold Loan': 10})
+    preprocessor = _fitted_preprocessor(old_df)
+
+    # Below ONE_HOT_MIN_FREQUENCY in the old rows and in the new rows, above it in both together
+    assert not training._new_one_hot_categories(preprocessor, training.category_counts(new_df, ['loan_type']))
+    counts = training.combine_category_counts(
+        training.category_counts(old_df, ['loan_type']), training.category_counts(new_df, ['loan_type'])
+    )
+    assert training._new_one_hot_categories(preprocessor, counts) == {'loan_type': ['Gold Loan']}
+
+def test_category_outside_max_categories_is_not_promoted():
+    frequent = {f'Loan {i:02d}': 100 for i in range(training.ONE_HOT_MAX_CATEGORIES + 5)}
+    old_df = _applications(frequent)
+    new_df = _applications({'Gold Loan': 30})
+    preprocessor = _fitted_preprocessor(old_df)
+
+    # Frequent in the refresh batch, but ranked below every category already in the vocabulary
+    counts = training.combine_category_counts(
+        training.category_counts(old_df, ['loan_type']), training.category_counts(new_df, ['loan_type'])
+    )
+    assert training._new_one_hot_categories(preprocessor, counts) == {}
+
+def test_known_categories_are_not_reported():
+    old_df = _applications({'Personal Loan': 100, 'Car Loan': 60})
+    preprocessor = _fitted_preprocessor(old_df)
+    counts = training.category_counts(pd.concat([old_df, old_df]), ['loan_type'])
+    assert training._new_one_hot_categories(preprocessor, counts) == {}
+
+def test_leading_category_counts_reads_only_the_trained_rows(tmp_path):
+    applications_df = _applications({'Personal Loan': 30, 'Gold Loan': 5})
+    path = tmp_path / 'loan_applications.csv'
+    applications_df.to_csv(path, index=False)
+
+    counts = training._leading_category_counts(['loan_type'], 32, path=path)
+    assert counts['loan_type'].to_dict() == {'Personal Loan': 30, 'Gold Loan': 2}
+
+def test_training_without_fork_workers_fits_in_process(training_data_dir, tmp_path, monkeypatch):
+    def fork(*args, **kwargs):
+        raise AssertionError("train_models forked worker processes without fork_workers")
+    monkeypatch.setattr(training, 'ProcessPoolExecutor', fork)
+
+    previous = model.registry.active
+    try:
+        _, fraud_model, loan_status_model, _ = training.train_models(
+            bundle_path=str(tmp_path / 'bundle.pkl'), imbalance_strategy='class_weight', n_jobs=4
+        )
+    finally:
+        model.registry.activate(previous)
+    assert list(fraud_model.classes_) == [0, 1]
+    assert len(loan_status_model.classes_) == 4
+    assert training._training_payload == {}
+
+@pytest.mark.parametrize('metadata, argument, expected', [
+    ({'imbalance_strategy': 'class_weight'}, None, ('train_models', 'class_weight')),
+    ({'imbalance_strategy': 'class_weight'}, 'undersample', ('train_models', 'undersample')),
+    ({'imbalance_strategy': 'undersample', 'out_of_core': True}, None, ('train_models_out_of_core', 'undersample')),
+])
+def test_full_retrain_fallback_keeps_how_the_set_was_trained(monkeypatch, metadata, argument, expected):
+    calls = []
+    monkeypatch.setattr(model, 'read_model_bundle', lambda path: SimpleNamespace(metadata=metadata))
+    monkeypatch.setattr(training, 'train_models',
+                        lambda **kwargs: calls.append(('train_models', kwargs['imbalance_strategy'])))
+    monkeypatch.setattr(chunked_training, 'train_models_out_of_core',
+                        lambda **kwargs: calls.append(('train_models_out_of_core', kwargs['imbalance_strategy'])))
+
+    # No record of the training rows: the refresh falls back to a full retrain
+    training.incremental_train_models(bundle_path='bundle.pkl', imbalance_strategy=argument)
+    assert calls == [expected]
@@ -0,0 +1,46 @@
+import json
+
+import numpy as np
+import pytest
+
+import loan_python_file as model
+from portable_model import load_portable_model
+
+@pytest.fixture
+def portable_path(scoring_models, tmp_path):
+    path = str(tmp_path / 'portable.npz')
+    model.export_portable_model(path)
+    return path
+
+def test_exported_model_scores_like_the_bundle(scoring_models, portable_path, scoring_applications,
+                                               unusual_applications):
+    portable = load_portable_model(portable_path, model.transaction_feature_store)
+    applications = scoring_applications.to_dict('records') + unusual_applications
+
+    compiled = model.get_compiled_scorer(scoring_models)
+    np.testing.assert_array_equal(portable.featurizer.features_matrix(applications),
+                                  compiled.featurizer.features_matrix(applications))
+    for actual, expected in zip(portable.predict_records(applications, fraud_threshold=0.2),
+                                model._score_records(applications, scoring_models, fraud_threshold=0.2)):
+        if expected.dtype.kind == 'f':
+            np.testing.assert_allclose(actual, expected, rtol=0, atol=1e-9)
+        else:
+            np.testing.assert_array_equal(actual, expected)
+
+    for application in unusual_applications:
+        actual, expected = portable.predict(application), model.predict_loan_risk_and_fraud(application)
+        assert actual[0] == expected[0] and actual[2] == expected[2]
+        assert actual[1] == pytest.approx(expected[1], abs=1e-9)
+        np.testing.assert_allclose(actual[3], expected[3], rtol=0, atol=1e-9)
+
+def test_artifact_of_another_format_version_is_rejected(portable_path):
+    with np.load(portable_path) as data:
+        arrays = dict(data)
+    header = json.loads(str(arrays['header']))
+    header['format_version'] += 1
+    arrays['header'] = np.array(json.dumps(header))
+    with open(portable_path, 'wb') as f:
+        np.savez(f, **arrays)
+
+    with pytest.raises(ValueError, match='Unsupported portable model format'):
+        load_portable_model(portable_path)
@@ -0,0 +1,122 @@
+import asyncio
+import json
+
+import pytest
+
+import loan_python_file as model
+import scoring_service
+from scoring_service import ScoringService
+
+async def _request(service, method, path, body=b''):
+    """Send one HTTP request to the ASGI app; returns (status, decoded JSON body)"""
+    messages = [{'type': 'http.request', 'body': body if isinstance(body, bytes) else json.dumps(body).encode()}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0) if messages else {'type': 'http.disconnect'}
+
+    async def send(message):
+        sent.append(message)
+
+    await service({'type': 'http', 'method': method, 'path': path}, receive, send)
+    return sent[0]['status'], json.loads(sent[1]['body'])
+
+def _serve(service, requests):
+    """Start the service (ASGI lifespan), wait until its models are loaded or failed, send each
+    (method, path, body) request in turn and shut it down; returns the responses"""
+    async def run():
+        lifespan = asyncio.Queue()
+        await lifespan.put({'type': 'lifespan.startup'})
+        started = asyncio.Event()
+
+        async def send(message):
+            if message['type'] == 'lifespan.startup.complete':
+                started.set()
+
+        lifespan_task = asyncio.create_task(service({'type': 'lifespan'}, lifespan.get, send))
+        await started.wait()
+        await asyncio.wait_for(service._loading, timeout=60)
+        try:
+            return [await _request(service, *request) for request in requests]
+        finally:
+            await lifespan.put({'type': 'lifespan.shutdown'})
+            await lifespan_task
+    return asyncio.run(run())
+
+def _records(applications_df):
+    """Applications as a JSON client sends them"""
+    return json.loads(applications_df.to_json(orient='records'))
+
+@pytest.fixture
+def bundle_service(scoring_models):
+    return ScoringService('bundle', scoring_models.path, model_watch_interval=0)
+
+def test_health_and_readiness(bundle_service, scoring_models):
+    (health_status, health), (ready_status, ready) = _serve(
+        bundle_service, [('GET', '/healthz'), ('GET', '/readyz/')]
+    )
+    assert (health_status, health) == (200, {'status': 'ok'})
+    assert ready_status == 200
+    assert ready['status'] == 'ready' and ready['backend'] == 'bundle' and ready['model_path'] == scoring_models.path
+
+def test_predictions_match_the_scoring_module(bundle_service, scoring_applications):
+    applications = _records(scoring_applications.iloc[:20])
+    responses = _serve(bundle_service, [('POST', '/predict', application) for application in applications] + [
+        ('POST', '/predict/batch', {'applications': applications}),
+        ('POST', '/predict/batch', applications),
+        ('POST', '/predict/batch', []),
+    ])
+    singles, (batch_status, batch), (list_status, listed), empty = responses[:-3], *responses[-3:]
+
+    classes = model.lgbm_loan_status_model.classes_
+    for (status, prediction), application in zip(singles, applications):
+        fraud_flag, fraud_probability, loan_status, loan_status_proba = model.predict_loan_risk_and_fraud(application)
+        assert status == 200
+        assert prediction['fraud_flag'] == fraud_flag and prediction['loan_status'] == loan_status
+        assert prediction['fraud_probability'] == pytest.approx(fraud_probability, abs=1e-12)
+        assert prediction['loan_status_probabilities'] == pytest.approx(dict(zip(classes, loan_status_proba[0])),
+                                                                        abs=1e-12)
+    assert batch_status == list_status == 200
+    assert batch == listed
+    for (_, prediction), result in zip(singles, batch['results']):
+        assert result['fraud_flag'] == prediction['fraud_flag'] and result['loan_status'] == prediction['loan_status']
+        assert result['fraud_probability'] == pytest.approx(prediction['fraud_probability'], abs=1e-9)
+    assert empty == (200, {'results': []})
+
+def test_bad_requests_get_client_errors(bundle_service, scoring_applications, monkeypatch):
+    monkeypatch.setattr(scoring_service, 'MAX_BATCH_SIZE', 2)
+    application = _records(scoring_applications.iloc[:1])[0]
+    responses = _serve(bundle_service, [
+        ('POST', '/predict', b'{not json'),
+        ('POST', '/predict', [application]),
+        ('POST', '/predict/batch', {'applications': [application, 'x']}),
+        ('POST', '/predict/batch', [application] * 3),
+        ('POST', '/predict', {**application, 'application_date': 'not a date'}),
+        ('GET', '/predict'),
+        ('GET', '/score'),
+    ])
+    assert [status for status, _ in responses] == [400, 400, 400, 413, 422, 405, 404]
+    assert all('error' in response for _, response in responses)
+
+def test_failed_model_load_is_reported_by_readiness(tmp_path):
+    service = ScoringService('bundle', str(tmp_path / 'missing.pkl'), model_watch_interval=0)
+    (health_status, _), (ready_status, ready), (predict_status, _) = _serve(
+        service, [('GET', '/healthz'), ('GET', '/readyz'), ('POST', '/predict', {})]
+    )
+    assert health_status == 200
+    assert ready_status == 503 and ready['status'] == 'failed' and 'FileNotFoundError' in ready['error']
+    assert predict_status == 503
+
+def test_portable_backend_matches_the_bundle(scoring_models, scoring_applications, tmp_path):
+    path = str(tmp_path / 'portable.npz')
+    model.export_portable_model(path)
+    applications = _records(scoring_applications.iloc[:20])
+    requests = [('POST', '/predict', applications[0]), ('POST', '/predict/batch', applications)]
+    portable = _serve(ScoringService('portable', path), requests)
+    bundle = _serve(ScoringService('bundle', scoring_models.path, model_watch_interval=0), requests)
+
+    assert [status for status, _ in portable] == [200, 200]
+    for actual, expected in zip([portable[0][1]] + portable[1][1]['results'], [bundle[0][1]] + bundle[1][1]['results']):
+        assert actual['fraud_flag'] == expected['fraud_flag'] and actual['loan_status'] == expected['loan_status']
+        assert actual['fraud_probability'] == pytest.approx(expected['fraud_probability'], abs=1e-9)
+        assert actual['loan_status_probabilities'] == pytest.approx(expected['loan_status_probabilities'], abs=1e-9)